@@ -0,0 +1,288 @@
+"""
+Blaze Sports Intelligence Expected Points Lookup Tables
+
+Shared field-position and down/distance model for all football features:
+- Dense EP table keyed by down x distance bucket x yard line
+- Expected-yards rate per down x distance bucket (used by DVOA)
+- Versioned, memory-mappable .npy file loaded once per process
+- Build step regenerates the table from the reference scalar models
+
+Swapping or recomputing the model means rebuilding the table
+(tools/features/build_ep_table.py), not editing feature functions.
+"""
+
+import json
+import os
+import threading
+import warnings
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+EP_TABLE_VERSION = 1
+
+# Table layout: table[kind, down_index, distance_bucket, yard_line]
+EP = 0
+EXPECTED_YARDS_RATE = 1
+N_DOWNS = 4                                  # 1st-4th; other downs use the 4th-down row
+MAX_DISTANCE = 30                            # distance buckets 0..30 yards (30 = "30+")
+MISSING_DISTANCE_BUCKET = MAX_DISTANCE + 1   # unknown distance
+N_DISTANCE_BUCKETS = MAX_DISTANCE + 2
+N_YARD_LINES = 101                           # yard line 0..100 (own goal line = 0)
+TABLE_SHAPE = (2, N_DOWNS, N_DISTANCE_BUCKETS, N_YARD_LINES)
+
+# Expected drive start after a kickoff touchback
+DEFAULT_START_YARDLINE = 25.0
+
+DEFAULT_TABLE_DIR = Path(__file__).parent / "features" / "tables"
+
+
+# ==================== REFERENCE MODELS ====================
+
+def expected_points(down, distance, yard_line) -> float:
+    """
+    Simplified expected points for a single down/distance/yard-line state.
+
+    Reference model the EP table is built from (would use the full model in
+    production).
+    """
+    if pd.isna(down) or pd.isna(yard_line):
+        return 0.0
+
+    # Field position value (simplified)
+    fp_value = (yard_line - 50) / 50.0 * 3.0
+
+    # Down and distance value
+    if down == 1:
+        dd_value = 0.5
+    elif down == 2:
+        dd_value = 0.3 if distance < 7 else 0.1
+    elif down == 3:
+        dd_value = 0.1 if distance < 4 else -0.2
+    else:  # 4th down
+        dd_value = -0.5 if distance > 1 else 0.3
+
+    return fp_value + dd_value
+
+
+def expected_yards_rate(down) -> float:
+    """Expected yards gained as a fraction of yards to go, by down."""
+    if down == 1:
+        return 0.45
+    elif down == 2:
+        return 0.60
+    elif down == 3:
+        return 0.85
+    return 1.0
+
+
+# ==================== BUILD STEP ====================
+
+def build_ep_table() -> np.ndarray:
+    """
+    Evaluate the reference models on every table cell.
+
+    Returns:
+        float64 array with shape TABLE_SHAPE
+    """
+    table = np.empty(TABLE_SHAPE, dtype=np.float64)
+
+    for down_idx in range(N_DOWNS):
+        down = down_idx + 1
+        for bucket in range(N_DISTANCE_BUCKETS):
+            distance = np.nan if bucket == MISSING_DISTANCE_BUCKET else float(bucket)
+            table[EXPECTED_YARDS_RATE, down_idx, bucket, :] = expected_yards_rate(down)
+            for yard_line in range(N_YARD_LINES):
+                table[EP, down_idx, bucket, yard_line] = expected_points(down, distance, yard_line)
+
+    return table
+
+
+def table_path(version: int = EP_TABLE_VERSION, table_dir: Union[str, Path] = None) -> Path:
+    """Location of the versioned table file."""
+    return Path(table_dir or DEFAULT_TABLE_DIR) / f"ep_table_v{version}.npy"
+
+
+def save_ep_table(table: np.ndarray, path: Union[str, Path],
+                  version: int = EP_TABLE_VERSION, model: str = "blaze_simplified_ep") -> Path:
+    """
+    Write the table as a raw .npy (memory-mappable) plus a JSON metadata sidecar.
+
+    Both files are written under temporary names in the target directory and
+    renamed into place, sidecar first, so readers in other processes see
+    either the old files or complete new ones.
+
+    Args:
+        table: Array with shape TABLE_SHAPE
+        path: Output .npy path
+        version: Table version recorded in the metadata
+        model: Name of the model the table was built from
+
+    Returns:
+        Path of the written table
+    """
+    if table.shape != TABLE_SHAPE:
+        raise ValueError(f"EP table shape {table.shape} does not match {TABLE_SHAPE}")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    metadata = {
+        "version": version,
+        "model": model,
+        "shape": list(TABLE_SHAPE),
+        "axes": ["kind", "down", "distance_bucket", "yard_line"],
+        "kinds": ["expected_points", "expected_yards_rate"],
+        "max_distance": MAX_DISTANCE,
+        "default_start_yardline": DEFAULT_START_YARDLINE,
+        "built_at": datetime.now().isoformat()
+    }
+
+    meta_path = path.with_suffix(".json")
+    tmp_meta = _temp_path(meta_path)
+    tmp_table = _temp_path(path)
+    try:
+        with open(tmp_meta, 'w') as f:
+            json.dump(metadata, f, indent=2)
+        with open(tmp_table, 'wb') as f:
+            np.save(f, np.ascontiguousarray(table, dtype=np.float64))
+
+        os.replace(tmp_meta, meta_path)
+        os.replace(tmp_table, path)
+    finally:
+        for tmp in (tmp_meta, tmp_table):
+            if tmp.exists():
+                tmp.unlink()
+
+    return path
+
+
+def _temp_path(path: Path) -> Path:
+    """Unique sibling of ``path`` for writing before an atomic rename."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+# ==================== LOOKUP API ====================
+
+class EPTable:
+    """Vectorized lookups against a loaded EP / expected-yards table."""
+
+    def __init__(self, table: np.ndarray, metadata: Dict[str, Any] = None):
+        if table.shape != TABLE_SHAPE:
+            raise ValueError(f"EP table shape {table.shape} does not match {TABLE_SHAPE}")
+
+        self.table = table
+        self.metadata = metadata or {}
+        self.version = self.metadata.get("version", EP_TABLE_VERSION)
+        self.default_start_yardline = float(
+            self.metadata.get("default_start_yardline", DEFAULT_START_YARDLINE)
+        )
+
+    @staticmethod
+    def down_index(down) -> np.ndarray:
+        """Row for each down: 1st-3rd map to 0-2, anything else uses the 4th-down row."""
+        down = np.asarray(down, dtype=float)
+        return np.select([down == 1, down == 2, down == 3], [0, 1, 2], default=3)
+
+    @staticmethod
+    def distance_bucket(distance) -> np.ndarray:
+        """
+        Distance bucket (capped at MAX_DISTANCE, missing -> own bucket).
+
+        Buckets are whole yards rounded down, which keeps the reference
+        model's ``distance < 7`` / ``distance < 4`` branches, except that
+        anything over 1 yard and under 2 goes to bucket 2 for its
+        ``distance > 1`` branch.
+        """
+        distance = np.asarray(distance, dtype=float)
+        bucket = np.clip(np.floor(np.nan_to_num(distance)), 0, MAX_DISTANCE).astype(np.intp)
+        bucket = np.where((distance > 1) & (distance < 2), 2, bucket)
+        return np.where(np.isnan(distance), MISSING_DISTANCE_BUCKET, bucket)
+
+    def expected_points(self, down, distance, yard_line) -> np.ndarray:
+        """
+        Expected points per play state.
+
+        Yard lines are linearly interpolated between table columns (and
+        extrapolated from the edge columns outside 0-100, like the reference
+        model). Returns 0.0 where down or yard line is missing.
+        """
+        down = np.asarray(down, dtype=float)
+        yard_line = np.asarray(yard_line, dtype=float)
+
+        d = self.down_index(down)
+        b = self.distance_bucket(distance)
+        yl = np.nan_to_num(yard_line)
+        lo = np.clip(np.floor(yl), 0, N_YARD_LINES - 2).astype(np.intp)
+        w = yl - lo
+
+        ep = self.table[EP]
+        lower = ep[d, b, lo]
+        values = lower + w * (ep[d, b, lo + 1] - lower)
+
+        return np.where(np.isnan(down) | np.isnan(yard_line), 0.0, values)
+
+    def expected_yards(self, down, distance) -> np.ndarray:
+        """Expected yards gained per play given down and yards to go."""
+        distance = np.asarray(distance, dtype=float)
+        rate = self.table[EXPECTED_YARDS_RATE, self.down_index(down), self.distance_bucket(distance), 0]
+        return distance * rate
+
+
+_table_lock = threading.Lock()
+_loaded_tables: Dict[Path, EPTable] = {}
+
+
+def load_ep_table(path: Union[str, Path], mmap: bool = True) -> EPTable:
+    """Load a table file (memory-mapped by default) and validate its version."""
+    path = Path(path)
+    table = np.load(path, mmap_mode="r" if mmap else None)
+
+    metadata = {}
+    meta_path = path.with_suffix(".json")
+    if meta_path.exists():
+        with open(meta_path, 'r') as f:
+            metadata = json.load(f)
+
+    if metadata.get("version", EP_TABLE_VERSION) != EP_TABLE_VERSION:
+        raise ValueError(f"EP table {path} is version {metadata['version']}, "
+                         f"expected {EP_TABLE_VERSION}; rebuild it with build_ep_table.py")
+
+    return EPTable(table, metadata)
+
+
+def get_ep_table(path: Optional[Union[str, Path]] = None) -> EPTable:
+    """
+    Process-wide EP table, loaded once per path.
+
+    The path defaults to $BLAZE_EP_TABLE or the versioned file under
+    features/tables. A missing file is built and written on first use; if the
+    location is read-only the freshly built table is kept in memory instead.
+    """
+    path = Path(path or os.environ.get("BLAZE_EP_TABLE") or table_path())
+
+    cached = _loaded_tables.get(path)
+    if cached is not None:
+        return cached
+
+    with _table_lock:
+        if path in _loaded_tables:
+            return _loaded_tables[path]
+
+        if path.exists():
+            ep_table = load_ep_table(path)
+        else:
+            table = build_ep_table()
+            try:
+                save_ep_table(table, path)
+                ep_table = load_ep_table(path)
+            except OSError as e:
+                warnings.warn(f"Could not write EP table to {path} ({e}); using in-memory table")
+                ep_table = EPTable(table, {"version": EP_TABLE_VERSION})
+
+        _loaded_tables[path] = ep_table
+        return ep_table
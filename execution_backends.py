@@ -0,0 +1,148 @@
+"""
+Blaze Sports Intelligence Feature Execution Backends
+
+Pluggable executors for CPU-bound feature computation in the real-time pipelines:
+- "thread": features run in the calling process (GIL-bound, no handoff cost)
+- "process": persistent worker processes attach to the input frame through
+  shared memory (shared_frame), so only a small handle is pickled per task
+
+Backends are looked up by name in EXECUTION_BACKENDS.
+"""
+
+import multiprocessing
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from features_impl import compute_feature
+from shared_frame import SharedFrame, SharedFrameHandle, attached_frame
+
+
+def _result_values(result) -> np.ndarray:
+    """Feature result copied out as a float64 array."""
+    if isinstance(result, pd.Series):
+        return result.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    return np.array(result, dtype=np.float64, ndmin=1)
+
+
+def _warm_worker() -> None:
+    """Load per-process lookup tables once, when the worker starts."""
+    from ep_table import get_ep_table
+
+    try:
+        get_ep_table()
+    except Exception as e:
+        warnings.warn(f"Worker could not preload the EP table: {e}")
+
+
+def _compute_shared(handle: SharedFrameHandle, feature_name: str) -> np.ndarray:
+    """Worker task: compute one feature over a shared-memory frame."""
+    with attached_frame(handle) as df:
+        result = compute_feature(feature_name, df)
+        if isinstance(result, pd.Series):
+            result = result.reindex(df.index)
+        values = _result_values(result)
+        del df, result
+    return values
+
+
+class ThreadBackend:
+    """Runs features in the calling process (compute_many() fans out over threads)."""
+
+    name = "thread"
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+
+    def compute(self, feature_name: str, df: pd.DataFrame) -> pd.Series:
+        """Compute one feature on the calling thread."""
+        return compute_feature(feature_name, df)
+
+    def compute_many(self, df: pd.DataFrame, feature_names: List[str]) -> Dict[str, pd.Series]:
+        """
+        Compute several features concurrently; failures warn and fall back to NaN.
+
+        The thread pool lives for this call only: the pipelines call
+        compute() from their own executors and never need one.
+        """
+        feature_names = list(dict.fromkeys(feature_names))
+        with ThreadPoolExecutor(max_workers=max(min(self.max_workers, len(feature_names)), 1)) as executor:
+            futures = {name: executor.submit(compute_feature, name, df) for name in feature_names}
+            return {name: _collect(name, future, df.index) for name, future in futures.items()}
+
+    def shutdown(self) -> None:
+        """Nothing to release; kept for the backend interface."""
+
+
+class ProcessBackend:
+    """
+    Runs features in persistent worker processes.
+
+    Each call publishes its input frame into shared memory once; every task
+    over that frame receives only the handle.
+    """
+
+    name = "process"
+
+    def __init__(self, max_workers: int = 4, mp_context=None):
+        # The pipelines already run thread pools, so workers are not forked from them
+        if mp_context is None:
+            methods = multiprocessing.get_all_start_methods()
+            mp_context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+        self.max_workers = max_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context, initializer=_warm_worker
+        )
+
+    def compute(self, feature_name: str, df: pd.DataFrame) -> pd.Series:
+        """Compute one feature in a worker process (errors propagate)."""
+        with SharedFrame(df) as frame:
+            values = self._executor.submit(_compute_shared, frame.handle, feature_name).result()
+        return pd.Series(values, index=df.index, name=feature_name)
+
+    def compute_many(self, df: pd.DataFrame, feature_names: List[str]) -> Dict[str, pd.Series]:
+        """Compute several features over one published frame; failures warn and fall back to NaN."""
+        with SharedFrame(df) as frame:
+            futures = {
+                name: self._executor.submit(_compute_shared, frame.handle, name)
+                for name in dict.fromkeys(feature_names)
+            }
+            return {name: _collect(name, future, df.index) for name, future in futures.items()}
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+def _collect(feature_name: str, future, index: pd.Index) -> pd.Series:
+    """Feature result from a future, or NaN with a warning if it failed."""
+    try:
+        result = future.result()
+    except Exception as e:
+        warnings.warn(f"Feature {feature_name} failed: {e}")
+        return pd.Series(np.nan, index=index, name=feature_name)
+
+    if isinstance(result, pd.Series):
+        return result
+    return pd.Series(result, index=index, name=feature_name)
+
+
+EXECUTION_BACKENDS = {
+    "thread": ThreadBackend,
+    "process": ProcessBackend,
+}
+
+
+def get_execution_backend(name: str = "thread", max_workers: int = 4):
+    """
+    Create an execution backend by name.
+
+    Raises:
+        ValueError: If the backend name is not registered
+    """
+    if name not in EXECUTION_BACKENDS:
+        raise ValueError(f"Unknown execution backend '{name}' (expected one of {sorted(EXECUTION_BACKENDS)})")
+    return EXECUTION_BACKENDS[name](max_workers=max_workers)
@@ -10,14 +10,527 @@ Architecture:
 - Handle edge cases and missing data gracefully
 - Support rolling windows (30d, 7g formats)
 - Implement sport-specific aggregations
+- Treat the input DataFrame as read-only: no copies, no added columns;
+  derived columns go in a narrow side buffer (feature_buffer)
 """
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Union
+import math
+import pickle
+import threading
 import warnings
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+from ep_table import get_ep_table
+from shared_frame import SharedFrame, SharedFrameHandle, attached_frame
+
+
+# ==================== ROLLING WINDOW ENGINE ====================
+
+def _parse_window(window: Union[int, str]):
+    """
+    Parse a window spec into (size, is_count).
+
+    Count windows are ints or strings like '7g'/'7G'; anything else is a
+    pandas offset ('30D', '15D', '7D') and is returned in nanoseconds.
+    """
+    if isinstance(window, (int, np.integer)):
+        return int(window), True
+    if isinstance(window, str) and window[-1:] in ("g", "G"):
+        return int(window[:-1]), True
+    return pd.Timedelta(window).value, False
+
+
+def _entity_codes(df: pd.DataFrame, by: List[str]) -> np.ndarray:
+    """Integer partition codes for the entity key (-1 for missing keys)."""
+    if len(by) == 1:
+        codes, _ = pd.factorize(df[by[0]])
+        return codes.astype(np.int64)
+    return df.groupby(by, sort=False).ngroup().fillna(-1).to_numpy(dtype=np.int64)
+
+
+def _order_values(col: pd.Series):
+    """Sortable int64/float64 values for the order column and whether they are timestamps."""
+    if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+        return col.to_numpy(dtype=float), False
+    ts = pd.DatetimeIndex(pd.to_datetime(col)).as_unit("ns")
+    return ts.asi8, True
+
+
+class RollingWindowEngine:
+    """
+    Sort-once, partition-once rolling aggregates for per-entity windows.
+
+    The frame is ordered by (entity, order column) a single time. Every window
+    query after that is answered from prefix sums over the sorted layout, so
+    many 30D/15D/7D or 7g/5g aggregates share one sort and one partitioning
+    instead of paying for a ``groupby().rolling()`` each.
+
+    Time windows follow pandas offset semantics, ``(t - window, t]`` ending at
+    the current row. Count windows cover the current row and the previous
+    ``n - 1`` rows of the same entity.
+    """
+
+    def __init__(self, df: pd.DataFrame, by: Union[str, List[str]],
+                 order_col: Optional[str] = "ts"):
+        """
+        Args:
+            df: Input DataFrame (not modified)
+            by: Entity column(s) that partition the windows
+            order_col: Column that orders rows within an entity (None keeps row order)
+        """
+        self.by = [by] if isinstance(by, str) else list(by)
+        self.order_col = order_col
+        self.index = df.index
+        self.size = len(df)
+
+        codes = _entity_codes(df, self.by)
+        if order_col is None:
+            keys, self.is_time = np.arange(self.size, dtype=float), False
+        else:
+            keys, self.is_time = _order_values(df[order_col])
+
+        # Stable sort: ties keep input order, matching sort_values on both keys
+        self.order = np.lexsort((keys, codes))
+        self.codes = codes[self.order]
+        self.keys = keys[self.order]
+
+        positions = np.arange(self.size)
+        new_group = np.ones(self.size, dtype=bool)
+        new_group[1:] = self.codes[1:] != self.codes[:-1]
+        self.group_start = np.maximum.accumulate(np.where(new_group, positions, 0))
+
+        self._starts: Dict[Any, np.ndarray] = {}
+
+    def window_start(self, window: Union[int, str]) -> np.ndarray:
+        """First sorted position inside each row's window (cached per spec)."""
+        if window in self._starts:
+            return self._starts[window]
+
+        size, is_count = _parse_window(window)
+        if is_count:
+            start = np.maximum(self.group_start, np.arange(self.size) - size + 1)
+        elif not self.is_time:
+            raise ValueError(f"Time window '{window}' requires a datetime order column, "
+                             f"got '{self.order_col}'")
+        else:
+            # Merge (entity, t - window) queries into the sorted rows; the number of
+            # rows sorting at or before a query is the first row inside its window.
+            n = self.size
+            codes = np.concatenate([self.codes, self.codes])
+            keys = np.concatenate([self.keys, self.keys - size])
+            is_query = np.repeat(np.array([0, 1], dtype=np.int8), n)
+            merged = np.lexsort((is_query, keys, codes))
+            merged_is_query = is_query[merged] == 1
+            rows_seen = np.cumsum(~merged_is_query)
+            start = np.empty(n, dtype=np.int64)
+            start[merged[merged_is_query] - n] = rows_seen[merged_is_query]
+
+        self._starts[window] = start
+        return start
+
+    def rolling(self, values, window: Union[int, str], agg: str = "mean",
+                min_periods: int = 1, name: Optional[str] = None) -> pd.Series:
+        """
+        Rolling aggregate of ``values`` per entity.
+
+        Args:
+            values: Series/array positionally aligned with the engine's frame
+            window: Time offset ('30D') or count window (7, '7g')
+            agg: 'mean', 'sum', 'count' or 'std'
+            min_periods: Minimum non-null observations required for a value
+            name: Identifies the window within its feature (keys streaming state)
+
+        Returns:
+            Rolling values indexed like the input DataFrame
+        """
+        start = self.window_start(window)
+        end = np.arange(1, self.size + 1)
+
+        x = np.asarray(values, dtype=float)[self.order]
+        valid = ~np.isnan(x)
+        x = np.where(valid, x, 0.0)
+
+        count = np.concatenate([[0], np.cumsum(valid)])
+        count = count[end] - count[start]
+        total = np.concatenate([[0.0], np.cumsum(x)])
+        total = total[end] - total[start]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if agg == "mean":
+                out = total / count
+            elif agg == "sum":
+                out = total
+            elif agg == "count":
+                out = count.astype(float)
+            elif agg == "std":
+                squares = np.concatenate([[0.0], np.cumsum(x * x)])
+                squares = squares[end] - squares[start]
+                var = (squares - total * total / count) / (count - 1)
+                out = np.where(count > 1, np.sqrt(np.clip(var, 0.0, None)), np.nan)
+            else:
+                raise ValueError(f"Unsupported aggregation function: {agg}")
+
+        out = np.where((count >= min_periods) & (self.codes >= 0), out, np.nan)
+
+        result = np.empty(self.size)
+        result[self.order] = out
+        return pd.Series(result, index=self.index)
+
+
+_engine_scope = threading.local()
+
+
+@contextmanager
+def shared_window_engines():
+    """
+    Share one RollingWindowEngine (and GameRollup) per (frame, entity key, order column).
+
+    Inside the block, features computed on the same DataFrame reuse the sort and
+    partitioning built by the first feature that asked for them. The entity and
+    order columns must not be mutated while the block is active.
+    """
+    outer = getattr(_engine_scope, "cache", None)
+    if outer is None:
+        _engine_scope.cache = {}
+    try:
+        yield
+    finally:
+        if outer is None:
+            _engine_scope.cache = None
+
+
+def get_window_engine(df: pd.DataFrame, by: Union[str, List[str]],
+                      order_col: Optional[str] = "ts") -> RollingWindowEngine:
+    """Return the shared engine for ``df`` if one is in scope, else build one."""
+    stream_scope = getattr(_engine_scope, "stream_scope", None)
+    if stream_scope is not None:
+        feature_name, states = stream_scope
+        return StreamingWindowEngine(states, df, by, order_col, feature_name)
+
+    cache = getattr(_engine_scope, "cache", None)
+    if cache is None:
+        return RollingWindowEngine(df, by, order_col)
+
+    key = (id(df), (by,) if isinstance(by, str) else tuple(by), order_col)
+    entry = cache.get(key)
+    if entry is None or entry[0] is not df:
+        # Hold the frame so its id cannot be recycled while the scope is open
+        entry = (df, RollingWindowEngine(df, by, order_col))
+        cache[key] = entry
+    return entry[1]
+
+
+class GameRollup:
+    """
+    Aggregate rows per (entity, game), roll across games, scatter back to rows.
+
+    Every row gets an integer code for its (entity, game) group, so game-level
+    results are mapped straight onto the original rows by position -- correct
+    under any input order and without a merge/reindex round trip. Rolling over
+    games runs on a RollingWindowEngine built over the (much smaller) game table.
+    """
+
+    def __init__(self, df: pd.DataFrame, by: Union[str, List[str]], game_col: str = "game_no"):
+        """
+        Args:
+            df: Input DataFrame (not modified)
+            by: Entity column(s)
+            game_col: Column identifying the game (ordered within an entity)
+        """
+        self.by = [by] if isinstance(by, str) else list(by)
+        self.game_col = game_col
+        self.index = df.index
+
+        entity = _entity_codes(df, self.by)
+        game_codes, game_values = pd.factorize(df[game_col])
+        n_values = max(len(game_values), 1)
+
+        # Row -> (entity, game) group code; -1 where either key is missing
+        valid = (entity >= 0) & (game_codes >= 0)
+        group_codes, group_keys = pd.factorize(entity[valid] * n_values + game_codes[valid])
+        self.group = np.full(len(df), -1, dtype=np.int64)
+        self.group[valid] = group_codes
+        self.n_games = len(group_keys)
+
+        games = pd.DataFrame({
+            "entity": group_keys // n_values,
+            game_col: np.asarray(game_values)[group_keys % n_values]
+        })
+        self.engine = RollingWindowEngine(games, "entity", game_col)
+
+    def aggregate(self, values, agg: str = "mean") -> pd.Series:
+        """
+        Per-game 'sum', 'mean' or 'count' of row values (nulls skipped, as in groupby).
+
+        Returns:
+            Series indexed by game group code
+        """
+        x = np.asarray(values, dtype=float)
+        rows = (self.group >= 0) & ~np.isnan(x)
+        counts = np.bincount(self.group[rows], minlength=self.n_games).astype(float)
+
+        if agg == "count":
+            out = counts
+        else:
+            sums = np.bincount(self.group[rows], weights=x[rows], minlength=self.n_games)
+            if agg == "sum":
+                out = sums
+            elif agg == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    out = sums / counts
+            else:
+                raise ValueError(f"Unsupported aggregation function: {agg}")
+
+        return pd.Series(out)
+
+    def rolling(self, per_game, window: Union[int, str], agg: str = "mean",
+                min_periods: int = 1) -> pd.Series:
+        """Rolling aggregate of per-game values over each entity's games ('7g', 5, ...)."""
+        return self.engine.rolling(per_game, window, agg=agg, min_periods=min_periods)
+
+    def scatter(self, per_game) -> pd.Series:
+        """Broadcast per-game values back to rows (NaN for rows with missing keys)."""
+        values = np.append(np.asarray(per_game, dtype=float), np.nan)
+        return pd.Series(values[self.group], index=self.index)
+
+
+def get_game_rollup(df: pd.DataFrame, by: Union[str, List[str]],
+                    game_col: str = "game_no") -> GameRollup:
+    """Return the shared per-game rollup for ``df`` if one is in scope, else build one."""
+    cache = getattr(_engine_scope, "cache", None)
+    if cache is None:
+        return GameRollup(df, by, game_col)
+
+    key = ("games", id(df), (by,) if isinstance(by, str) else tuple(by), game_col)
+    entry = cache.get(key)
+    if entry is None or entry[0] is not df:
+        entry = (df, GameRollup(df, by, game_col))
+        cache[key] = entry
+    return entry[1]
+
+
+# ==================== INCREMENTAL WINDOW STATE ====================
+
+_STREAM_AGGS = ("sum", "count", "mean", "std")
+
+
+class _WindowState:
+    """Timestamped ring buffer with running sums for one (window, entity)."""
+
+    __slots__ = ("keys", "values", "total", "squares", "count")
+
+    def __init__(self):
+        self.keys = deque()
+        self.values = deque()
+        self.total = 0.0
+        self.squares = 0.0
+        self.count = 0
+
+    def push(self, key, value: float, size, is_count: bool):
+        """Append one event (no earlier than the last) and evict everything that fell out of the window."""
+        self.keys.append(key)
+        self.values.append(value)
+        if not math.isnan(value):
+            self.total += value
+            self.squares += value * value
+            self.count += 1
+
+        if is_count:
+            while len(self.keys) > size:
+                self._pop()
+        else:
+            # Time windows cover (t - window, t], as in RollingWindowEngine
+            while self.keys[0] <= key - size:
+                self._pop()
+
+    def _pop(self):
+        self.keys.popleft()
+        value = self.values.popleft()
+        if not math.isnan(value):
+            self.count -= 1
+            if self.count == 0:
+                self.total = self.squares = 0.0
+            else:
+                self.total -= value
+                self.squares -= value * value
+
+    def aggregate(self, agg: str, min_periods: int) -> float:
+        if self.count < min_periods:
+            return np.nan
+        if agg == "sum":
+            return self.total
+        if agg == "count":
+            return float(self.count)
+        if agg == "mean":
+            return self.total / self.count if self.count else np.nan
+        if agg == "std":
+            if self.count < 2:
+                return np.nan
+            var = (self.squares - self.total * self.total / self.count) / (self.count - 1)
+            return math.sqrt(max(var, 0.0))
+        raise ValueError(f"Unsupported aggregation function: {agg}")
+
+
+class StreamingWindowEngine:
+    """
+    RollingWindowEngine stand-in that advances persistent window state.
+
+    Each ``rolling()`` call pushes the new rows into per-entity ring buffers
+    held in ``states`` and returns the window aggregate as of every row, so a
+    feature kernel run on just the new events gives the values a batch
+    recompute over the full history would. Work per event is amortized O(1).
+    """
+
+    def __init__(self, states: Dict, df: pd.DataFrame, by: Union[str, List[str]],
+                 order_col: Optional[str] = "ts", feature_name: Optional[str] = None):
+        """
+        Args:
+            states: Window state for one feature (owned by a WindowStateStore)
+            df: New events (not modified)
+            by: Entity column(s) that partition the windows
+            order_col: Column that orders events within an entity
+            feature_name: Feature whose kernel is running (part of every state key)
+        """
+        if order_col is None:
+            raise ValueError("Streaming windows require an order column")
+
+        self.by = [by] if isinstance(by, str) else list(by)
+        self.order_col = order_col
+        self.index = df.index
+        self.size = len(df)
+        self.states = states
+
+        codes = _entity_codes(df, self.by)
+        self.keys, self.is_time = _order_values(df[order_col])
+        self.order = np.lexsort((self.keys, codes))
+        self.valid = codes >= 0
+        self.entities = list(df[self.by].itertuples(index=False, name=None))
+        self.feature_name = feature_name
+
+    def rolling(self, values, window: Union[int, str], agg: str = "mean",
+                min_periods: int = 1, name: Optional[str] = None) -> pd.Series:
+        """
+        Same contract as RollingWindowEngine.rolling, over stored history plus
+        these rows. ``name`` is required: state is keyed by the feature, the
+        window's name and its spec, not by call order.
+        """
+        if name is None:
+            raise ValueError(f"Streaming windows of {self.feature_name} must be named")
+        size, is_count = _parse_window(window)
+        if not is_count and not self.is_time:
+            raise ValueError(f"Time window '{window}' requires a datetime order column, "
+                             f"got '{self.order_col}'")
+
+        call = (self.feature_name, name, tuple(self.by), self.order_col, window)
+
+        if agg not in _STREAM_AGGS:
+            raise ValueError(f"Unsupported aggregation function: {agg}")
+        self._check_order(call)
+
+        x = np.asarray(values, dtype=float)
+        out = np.full(self.size, np.nan)
+
+        for i in self.order:
+            if not self.valid[i]:
+                continue
+            state = self.states.get((call, self.entities[i]))
+            if state is None:
+                state = self.states[(call, self.entities[i])] = _WindowState()
+            state.push(self.keys[i], x[i], size, is_count)
+            out[i] = state.aggregate(agg, min_periods)
+
+        return pd.Series(out, index=self.index)
+
+    def _check_order(self, call) -> None:
+        """
+        Reject the whole batch, before any state is touched, if it reaches
+        back before an entity's stored history. Every rolling call of a
+        kernel advances in step, so the first call catches it.
+        """
+        earliest = {}
+        for i in self.order:  # sorted by entity, then order key
+            if self.valid[i] and self.entities[i] not in earliest:
+                earliest[self.entities[i]] = self.keys[i]
+
+        for entity, key in earliest.items():
+            state = self.states.get((call, entity))
+            if state is not None and state.keys and key < state.keys[-1]:
+                raise ValueError("Streaming window events must arrive in order per entity")
+
+
+class WindowStateStore:
+    """
+    Persistent per-(feature, entity) rolling-window state for streaming features.
+
+    ``update()`` runs a feature kernel on new events only; its rolling windows
+    are answered from running sums, counts and timestamped ring buffers kept
+    here, matching a batch recompute over the full history. Events must reach
+    the store in order per entity.
+    """
+
+    def __init__(self):
+        self.states: Dict[str, Dict] = {}
+
+    def update(self, feature_name: str, new_data: pd.DataFrame) -> pd.Series:
+        """Advance ``feature_name``'s window state with ``new_data`` and return its values."""
+        if feature_name not in STREAMING_FEATURES:
+            raise ValueError(f"Feature {feature_name} does not support incremental state")
+
+        outer = getattr(_engine_scope, "stream_scope", None)
+        _engine_scope.stream_scope = (feature_name, self.states.setdefault(feature_name, {}))
+        try:
+            return FEATURE_IMPLEMENTATIONS[feature_name](new_data)
+        finally:
+            _engine_scope.stream_scope = outer
+
+    def update_many(self, feature_list: list, new_data: pd.DataFrame) -> pd.DataFrame:
+        """Advance several features with the same batch of events."""
+        feature_df = pd.DataFrame(index=new_data.index)
+        for feature_name in feature_list:
+            feature_df[feature_name] = self.update(feature_name, new_data)
+        return feature_df
+
+    def n_states(self, feature_name: Optional[str] = None) -> int:
+        """Number of live (window, entity) buffers."""
+        if feature_name is not None:
+            return len(self.states.get(feature_name, {}))
+        return sum(len(states) for states in self.states.values())
+
+    def save(self, path: str):
+        """Persist the window state."""
+        with open(path, 'wb') as f:
+            pickle.dump(self.states, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "WindowStateStore":
+        """Restore a store written by save()."""
+        store = cls()
+        with open(path, 'rb') as f:
+            store.states = pickle.load(f)
+        return store
+
+
+# ==================== FEATURE INPUT CONTRACT ====================
+
+def feature_buffer(df: pd.DataFrame, columns: List[str] = (), **derived) -> pd.DataFrame:
+    """
+    Narrow side buffer for a feature kernel's derived columns.
+
+    Holds references to ``columns`` of ``df`` (no copy) plus the derived
+    Series, all on ``df.index``. Kernels group and merge against the buffer
+    instead of copying and extending the caller's frame, so peak memory per
+    batch stays near input size plus outputs.
+    """
+    data = {col: df[col] for col in columns}
+    data.update(derived)
+    return pd.DataFrame(data, index=df.index, copy=False)
+
 
 # ==================== CARDINALS BASEBALL FEATURES ====================
 
@@ -28,27 +541,22 @@ def cardinals_batter_xwoba_30d(df: pd.DataFrame) -> pd.Series:
     Input columns: batter_id, ts, exit_velocity, launch_angle, sprint_speed
     Output: xwOBA values (0.200-0.600)
     """
-    d = df.copy().sort_values(["batter_id", "ts"])
-
     # Simple xwOBA approximation based on exit velocity and launch angle
-    ev = d.get("exit_velocity", pd.Series(0, index=d.index))
-    la = d.get("launch_angle", pd.Series(0, index=d.index))
+    ev = df.get("exit_velocity", pd.Series(0, index=df.index))
+    la = df.get("launch_angle", pd.Series(0, index=df.index))
 
     # Simplified xwOBA calculation (real implementation would use Statcast model)
     xwoba_base = 0.300  # League average baseline
     ev_factor = (ev - 85.0) / 100.0  # Normalize around 85 mph
     la_factor = np.where((la >= 8) & (la <= 32), 0.1, -0.05)  # Sweet spot bonus
 
-    d["xwoba_single"] = (xwoba_base + ev_factor * 0.15 + la_factor).clip(0.150, 0.650)
+    xwoba_single = (xwoba_base + ev_factor * 0.15 + la_factor).clip(0.150, 0.650)
 
     # Rolling 30-day average per batter
-    d = d.set_index("ts")
-    rolling_xwoba = (d.groupby("batter_id")["xwoba_single"]
-                     .rolling("30D", min_periods=10)
-                     .mean()
-                     .reset_index(level=0, drop=True))
+    engine = get_window_engine(df, "batter_id", "ts")
+    rolling_xwoba = engine.rolling(xwoba_single, "30D", agg="mean", min_periods=10, name="xwoba")
 
-    return rolling_xwoba.reindex(df.index).fillna(0.300).clip(0.200, 0.600)
+    return rolling_xwoba.fillna(0.300).clip(0.200, 0.600)
 
 
 def cardinals_batter_barrel_rate_7g(df: pd.DataFrame) -> pd.Series:
@@ -58,34 +566,23 @@ def cardinals_batter_barrel_rate_7g(df: pd.DataFrame) -> pd.Series:
     Input columns: batter_id, game_no, exit_velocity, launch_angle
     Output: Barrel rate percentage (0.0-50.0)
     """
-    d = df.copy().sort_values(["batter_id", "game_no"])
-
-    ev = d.get("exit_velocity", pd.Series(0, index=d.index))
-    la = d.get("launch_angle", pd.Series(0, index=d.index))
+    ev = df.get("exit_velocity", pd.Series(0, index=df.index))
+    la = df.get("launch_angle", pd.Series(0, index=df.index))
 
     # Barrel definition: EV >= 98 mph and LA between 26-30 degrees
-    d["is_barrel"] = (ev >= 98.0) & (la >= 26.0) & (la <= 30.0)
+    is_barrel = (ev >= 98.0) & (la >= 26.0) & (la <= 30.0)
 
     # Calculate barrel rate by game
-    game_stats = (d.groupby(["batter_id", "game_no"])
-                  .agg(barrels=("is_barrel", "sum"),
-                       total_pa=("is_barrel", "count"))
-                  .reset_index())
+    games = get_game_rollup(df, "batter_id")
+    barrels = games.aggregate(is_barrel, "sum")
+    total_pa = games.aggregate(is_barrel, "count")
 
-    game_stats["barrel_rate"] = (game_stats["barrels"] / game_stats["total_pa"] * 100.0).fillna(0)
+    barrel_rate = (barrels / total_pa * 100.0).fillna(0)
 
-    # Rolling 7-game average
-    game_stats = game_stats.sort_values(["batter_id", "game_no"])
-    game_stats["barrel_rate_7g"] = (game_stats.groupby("batter_id")["barrel_rate"]
-                                    .rolling(7, min_periods=3)
-                                    .mean()
-                                    .reset_index(level=0, drop=True))
-
-    # Broadcast back to original DataFrame
-    result = d.merge(game_stats[["batter_id", "game_no", "barrel_rate_7g"]],
-                     on=["batter_id", "game_no"], how="left")["barrel_rate_7g"]
+    # Rolling 7-game average, broadcast back to plate appearances
+    barrel_rate_7g = games.rolling(barrel_rate, "7g", agg="mean", min_periods=3)
 
-    return result.reindex(df.index).fillna(0.0).clip(0.0, 50.0)
+    return games.scatter(barrel_rate_7g).fillna(0.0).clip(0.0, 50.0)
 
 
 def cardinals_batter_chase_rate_below_zone_30d(df: pd.DataFrame) -> pd.Series:
@@ -95,28 +592,22 @@ def cardinals_batter_chase_rate_below_zone_30d(df: pd.DataFrame) -> pd.Series:
     Input columns: batter_id, ts, swing, sz_bot, plate_z
     Output: Chase rate percentage (0.0-100.0)
     """
-    d = df.copy().sort_values(["batter_id", "ts"])
-
-    plate_z = d.get("plate_z", pd.Series(0, index=d.index))
-    sz_bot = d.get("sz_bot", pd.Series(1.5, index=d.index))
-    swing = d.get("swing", pd.Series(False, index=d.index)).astype(bool)
+    plate_z = df.get("plate_z", pd.Series(0, index=df.index))
+    sz_bot = df.get("sz_bot", pd.Series(1.5, index=df.index))
+    swing = df.get("swing", pd.Series(False, index=df.index)).astype(bool)
 
     # Define below zone (2 inches below bottom of strike zone)
     below_zone = plate_z < (sz_bot - 2.0/12.0)  # Convert inches to feet
     chase = below_zone & swing
 
-    # Rolling 30-day statistics per batcher
-    d = d.set_index("ts")
-    d["below_zone"] = below_zone
-    d["chase"] = chase
-
-    g = d.groupby("batter_id")
-    pitches_below = g["below_zone"].rolling("30D", min_periods=20).sum().reset_index(level=0, drop=True)
-    chases = g["chase"].rolling("30D", min_periods=5).sum().reset_index(level=0, drop=True)
+    # Rolling 30-day statistics per batter
+    engine = get_window_engine(df, "batter_id", "ts")
+    pitches_below = engine.rolling(below_zone, "30D", agg="sum", min_periods=20, name="below_zone")
+    chases = engine.rolling(chase, "30D", agg="sum", min_periods=5, name="chases")
 
     chase_rate = (chases / pitches_below * 100.0).fillna(0.0)
 
-    return chase_rate.reindex(df.index).clip(0.0, 100.0)
+    return chase_rate.clip(0.0, 100.0)
 
 
 def cardinals_batter_clutch_performance_season(df: pd.DataFrame) -> pd.Series:
@@ -126,22 +617,17 @@ def cardinals_batter_clutch_performance_season(df: pd.DataFrame) -> pd.Series:
     Input columns: batter_id, leverage_index, win_probability_added
     Output: Clutch performance score (-2.0 to 2.0)
     """
-    d = df.copy()
-
-    leverage = d.get("leverage_index", pd.Series(1.0, index=d.index))
-    wpa = d.get("win_probability_added", pd.Series(0.0, index=d.index))
+    leverage = df.get("leverage_index", pd.Series(1.0, index=df.index))
+    wpa = df.get("win_probability_added", pd.Series(0.0, index=df.index))
 
     # Define high-leverage situations (LI > 1.5)
     high_leverage = leverage > 1.5
     clutch_wpa = wpa.where(high_leverage, np.nan)
 
     # Season average clutch performance per batter
-    clutch_performance = (d.groupby("batter_id")
-                         .apply(lambda g: g.loc[g.index, "win_probability_added"]
-                               .where(g["leverage_index"] > 1.5).mean())
-                         .reindex(d["batter_id"]))
+    clutch_performance = df["batter_id"].map(clutch_wpa.groupby(df["batter_id"]).mean())
 
-    return clutch_performance.reindex(df.index).fillna(0.0).clip(-2.0, 2.0)
+    return clutch_performance.fillna(0.0).clip(-2.0, 2.0)
 
 
 def cardinals_batter_sprint_speed_percentile(df: pd.DataFrame) -> pd.Series:
@@ -151,19 +637,18 @@ def cardinals_batter_sprint_speed_percentile(df: pd.DataFrame) -> pd.Series:
     Input columns: batter_id, sprint_speed
     Output: Percentile ranking (0.0-100.0)
     """
-    d = df.copy()
-    sprint_speed = d.get("sprint_speed", pd.Series(25.0, index=d.index))
+    sprint_speed = df.get("sprint_speed", pd.Series(25.0, index=df.index))
 
     # Season best sprint speed per batter
-    season_speed = d.groupby("batter_id")["sprint_speed"].max()
+    season_speed = sprint_speed.groupby(df["batter_id"]).max()
 
     # Calculate percentiles within league
     percentiles = season_speed.rank(pct=True) * 100.0
 
     # Broadcast to all rows
-    result = d["batter_id"].map(percentiles)
+    result = df["batter_id"].map(percentiles)
 
-    return result.reindex(df.index).fillna(50.0).clip(0.0, 100.0)
+    return result.fillna(50.0).clip(0.0, 100.0)
 
 
 # ==================== CARDINALS PITCHING FEATURES ====================
@@ -175,23 +660,17 @@ def cardinals_pitcher_whiff_rate_15d(df: pd.DataFrame) -> pd.Series:
     Input columns: pitcher_id, ts, swing, whiff
     Output: Whiff rate percentage (0.0-60.0)
     """
-    d = df.copy().sort_values(["pitcher_id", "ts"])
-
-    swing = d.get("swing", pd.Series(False, index=d.index)).astype(bool)
-    whiff = d.get("whiff", pd.Series(False, index=d.index)).astype(bool)
+    swing = df.get("swing", pd.Series(False, index=df.index)).astype(bool)
+    whiff = df.get("whiff", pd.Series(False, index=df.index)).astype(bool)
 
     # Rolling 15-day statistics
-    d = d.set_index("ts")
-    d["swing"] = swing
-    d["whiff"] = whiff
-
-    g = d.groupby("pitcher_id")
-    swings = g["swing"].rolling("15D", min_periods=10).sum().reset_index(level=0, drop=True)
-    whiffs = g["whiff"].rolling("15D", min_periods=3).sum().reset_index(level=0, drop=True)
+    engine = get_window_engine(df, "pitcher_id", "ts")
+    swings = engine.rolling(swing, "15D", agg="sum", min_periods=10, name="swings")
+    whiffs = engine.rolling(whiff, "15D", agg="sum", min_periods=3, name="whiffs")
 
     whiff_rate = (whiffs / swings * 100.0).fillna(0.0)
 
-    return whiff_rate.reindex(df.index).clip(0.0, 60.0)
+    return whiff_rate.clip(0.0, 60.0)
 
 
 def cardinals_pitcher_command_plus_30d(df: pd.DataFrame) -> pd.Series:
@@ -201,25 +680,20 @@ def cardinals_pitcher_command_plus_30d(df: pd.DataFrame) -> pd.Series:
     Input columns: pitcher_id, ts, location_score, called_strike_rate
     Output: Command+ score (50.0-200.0)
     """
-    d = df.copy().sort_values(["pitcher_id", "ts"])
-
-    location_score = d.get("location_score", pd.Series(0.5, index=d.index))
-    called_strike_rate = d.get("called_strike_rate", pd.Series(0.15, index=d.index))
+    location_score = df.get("location_score", pd.Series(0.5, index=df.index))
+    called_strike_rate = df.get("called_strike_rate", pd.Series(0.15, index=df.index))
 
     # Simplified command calculation
-    d["command_raw"] = location_score * 0.6 + called_strike_rate * 0.4
+    command_raw = location_score * 0.6 + called_strike_rate * 0.4
 
     # Rolling 30-day average
-    d = d.set_index("ts")
-    command_30d = (d.groupby("pitcher_id")["command_raw"]
-                   .rolling("30D", min_periods=15)
-                   .mean()
-                   .reset_index(level=0, drop=True))
+    engine = get_window_engine(df, "pitcher_id", "ts")
+    command_30d = engine.rolling(command_raw, "30D", agg="mean", min_periods=15, name="command")
 
     # Convert to plus metric (normalize to 100)
     command_plus = (command_30d / 0.325) * 100.0  # Assuming 0.325 is league average
 
-    return command_plus.reindex(df.index).fillna(100.0).clip(50.0, 200.0)
+    return command_plus.fillna(100.0).clip(50.0, 200.0)
 
 
 def cardinals_bullpen_fatigue_index_3d(df: pd.DataFrame) -> pd.Series:
@@ -229,30 +703,24 @@ def cardinals_bullpen_fatigue_index_3d(df: pd.DataFrame) -> pd.Series:
     Input columns: team_id, pitcher_id, ts, role, pitches, back_to_back
     Output: Fatigue index (0.0-1.0)
     """
-    d = df.copy()
-    d["is_rp"] = (d.get("role", "RP") == "RP")
-    d = d.sort_values(["team_id", "pitcher_id", "ts"])
+    is_rp = df.get("role", pd.Series("RP", index=df.index)) == "RP"
 
     # Rolling 3-day pitch count for relievers
-    r = (d.set_index("ts")
-         .groupby(["team_id", "pitcher_id"])
-         .apply(lambda g: g["pitches"].rolling("3D", min_periods=1).sum())
-         .reset_index(level=[0,1], drop=True))
+    engine = get_window_engine(df, ["team_id", "pitcher_id"], "ts")
+    r = engine.rolling(df["pitches"], "3D", agg="sum", min_periods=1, name="pitches")
 
     # Normalize by capacity (150 pitches over 3 days)
     capacity = 150.0
     load = (r.fillna(0) / capacity).clip(0, 1.0)
 
     # Back-to-back penalty
-    b2b_penalty = (d.get("back_to_back", pd.Series(False, index=d.index))
+    b2b_penalty = (df.get("back_to_back", pd.Series(False, index=df.index))
                    .astype(bool).map({True: 0.15, False: 0.0}))
 
     fatigue_score = (load + b2b_penalty).clip(0, 1.0)
 
     # Only apply to relievers
-    fatigue_score = fatigue_score.where(d["is_rp"], 0.0)
-
-    return fatigue_score.reindex(df.index)
+    return fatigue_score.where(is_rp, 0.0)
 
 
 def cardinals_pitcher_tto_penalty_delta_2to3(df: pd.DataFrame) -> pd.Series:
@@ -262,10 +730,8 @@ def cardinals_pitcher_tto_penalty_delta_2to3(df: pd.DataFrame) -> pd.Series:
     Input columns: pitcher_id, season, tto, woba_value
     Output: wOBA delta (-0.200 to 0.300)
     """
-    d = df.copy()
-
-    if "season" not in d.columns:
-        d["season"] = pd.to_datetime(d["ts"]).dt.year
+    season = df["season"] if "season" in df.columns else pd.to_datetime(df["ts"]).dt.year
+    d = feature_buffer(df, ["pitcher_id", "tto", "woba_value"], season=season)
 
     # Calculate mean wOBA by pitcher, season, and times through order
     woba_by_tto = (d.groupby(["pitcher_id", "season", "tto"])["woba_value"]
@@ -277,12 +743,11 @@ def cardinals_pitcher_tto_penalty_delta_2to3(df: pd.DataFrame) -> pd.Series:
     else:
         tto_delta = pd.Series(0.0, index=woba_by_tto.index, name="tto_delta")
 
-    # Broadcast back to original DataFrame
-    result = (d.set_index(["pitcher_id", "season"])
-              .join(tto_delta)
-              .reset_index(drop=True)["tto_delta"])
+    # Broadcast back to original rows
+    keys = pd.MultiIndex.from_arrays([d["pitcher_id"], d["season"]])
+    result = pd.Series(tto_delta.reindex(keys).to_numpy(), index=df.index)
 
-    return result.reindex(df.index).fillna(0.0).clip(-0.200, 0.300)
+    return result.fillna(0.0).clip(-0.200, 0.300)
 
 
 def cardinals_pitcher_stuff_plus_rolling_7g(df: pd.DataFrame) -> pd.Series:
@@ -292,26 +757,22 @@ def cardinals_pitcher_stuff_plus_rolling_7g(df: pd.DataFrame) -> pd.Series:
     Input columns: pitcher_id, game_no, velocity, spin_rate, movement
     Output: Stuff+ score (60.0-180.0)
     """
-    d = df.copy().sort_values(["pitcher_id", "game_no"])
-
-    velocity = d.get("velocity", pd.Series(92.0, index=d.index))
-    spin_rate = d.get("spin_rate", pd.Series(2200, index=d.index))
-    movement = d.get("movement", pd.Series(10.0, index=d.index))
+    velocity = df.get("velocity", pd.Series(92.0, index=df.index))
+    spin_rate = df.get("spin_rate", pd.Series(2200, index=df.index))
+    movement = df.get("movement", pd.Series(10.0, index=df.index))
 
     # Simplified Stuff+ calculation
     vel_component = (velocity - 92.0) / 5.0  # Normalize around 92 mph
     spin_component = (spin_rate - 2200) / 300.0  # Normalize around 2200 rpm
     movement_component = (movement - 10.0) / 5.0  # Normalize around 10 inches
 
-    d["stuff_raw"] = 100.0 + (vel_component + spin_component + movement_component) * 20.0
+    stuff_raw = 100.0 + (vel_component + spin_component + movement_component) * 20.0
 
     # Rolling 7-game average
-    stuff_7g = (d.groupby("pitcher_id")["stuff_raw"]
-                .rolling(7, min_periods=3)
-                .mean()
-                .reset_index(level=0, drop=True))
+    engine = get_window_engine(df, "pitcher_id", "game_no")
+    stuff_7g = engine.rolling(stuff_raw, "7g", agg="mean", min_periods=3, name="stuff")
 
-    return stuff_7g.reindex(df.index).fillna(100.0).clip(60.0, 180.0)
+    return stuff_7g.fillna(100.0).clip(60.0, 180.0)
 
 
 # ==================== TITANS FOOTBALL FEATURES ====================
@@ -323,35 +784,23 @@ def titans_qb_pressure_to_sack_rate_adj_4g(df: pd.DataFrame) -> pd.Series:
     Input columns: qb_id, game_no, pressure, sack, opp_pass_block_win_rate
     Output: Adjusted sack rate (0.0-1.0)
     """
-    d = df.copy().sort_values(["qb_id", "game_no"])
-
     # Aggregate by game
-    per_game = (d.groupby(["qb_id", "game_no"])
-                .agg(pressures=("pressure", "sum"),
-                     sacks=("sack", "sum"),
-                     opp_pbwr=("opp_pass_block_win_rate", "mean"))
-                .reset_index())
+    games = get_game_rollup(df, "qb_id")
+    pressures = games.aggregate(df["pressure"], "sum")
+    sacks = games.aggregate(df["sack"], "sum")
+    opp_pbwr = games.aggregate(df["opp_pass_block_win_rate"], "mean")
 
-    per_game["raw_sack_rate"] = (per_game["sacks"] /
-                                per_game["pressures"].replace(0, np.nan)).clip(0, 1)
+    raw_sack_rate = (sacks / pressures.replace(0, np.nan)).clip(0, 1)
 
     # Rolling 4-game averages
-    per_game = per_game.sort_values(["qb_id", "game_no"])
-    per_game["raw_4g"] = (per_game.groupby("qb_id")["raw_sack_rate"]
-                          .rolling(4, min_periods=2).mean()
-                          .reset_index(level=0, drop=True))
-    per_game["opp_4g"] = (per_game.groupby("qb_id")["opp_pbwr"]
-                          .rolling(4, min_periods=2).mean()
-                          .reset_index(level=0, drop=True))
+    raw_4g = games.rolling(raw_sack_rate, "4g", agg="mean", min_periods=2)
+    opp_4g = games.rolling(opp_pbwr, "4g", agg="mean", min_periods=2)
 
     # Adjust for opponent strength
-    per_game["adj_sack_rate"] = (per_game["raw_4g"] / per_game["opp_4g"]).clip(0, 1)
+    adj_sack_rate = (raw_4g / opp_4g).clip(0, 1)
 
     # Broadcast back to play level
-    result = d.merge(per_game[["qb_id", "game_no", "adj_sack_rate"]],
-                     on=["qb_id", "game_no"], how="left")["adj_sack_rate"]
-
-    return result.reindex(df.index).fillna(0.0)
+    return games.scatter(adj_sack_rate).fillna(0.0)
 
 
 def titans_qb_epa_per_play_clean_pocket_5g(df: pd.DataFrame) -> pd.Series:
@@ -361,30 +810,21 @@ def titans_qb_epa_per_play_clean_pocket_5g(df: pd.DataFrame) -> pd.Series:
     Input columns: qb_id, game_no, pressure, expected_points_added
     Output: Clean pocket EPA (-1.0 to 1.5)
     """
-    d = df.copy().sort_values(["qb_id", "game_no"])
-
-    pressure = d.get("pressure", pd.Series(False, index=d.index)).astype(bool)
-    epa = d.get("expected_points_added", pd.Series(0.0, index=d.index))
+    pressure = df.get("pressure", pd.Series(False, index=df.index)).astype(bool)
+    epa = df.get("expected_points_added", pd.Series(0.0, index=df.index))
 
     # Filter to clean pocket plays only
     clean_pocket_epa = epa.where(~pressure, np.nan)
-    d["clean_pocket_epa"] = clean_pocket_epa
 
     # Game-level averages
-    per_game = (d.groupby(["qb_id", "game_no"])["clean_pocket_epa"]
-                .mean().reset_index())
+    games = get_game_rollup(df, "qb_id")
+    per_game = games.aggregate(clean_pocket_epa, "mean")
 
     # Rolling 5-game average
-    per_game = per_game.sort_values(["qb_id", "game_no"])
-    per_game["clean_epa_5g"] = (per_game.groupby("qb_id")["clean_pocket_epa"]
-                                .rolling(5, min_periods=2).mean()
-                                .reset_index(level=0, drop=True))
+    clean_epa_5g = games.rolling(per_game, "5g", agg="mean", min_periods=2)
 
     # Broadcast back
-    result = d.merge(per_game[["qb_id", "game_no", "clean_epa_5g"]],
-                     on=["qb_id", "game_no"], how="left")["clean_epa_5g"]
-
-    return result.reindex(df.index).fillna(0.0).clip(-1.0, 1.5)
+    return games.scatter(clean_epa_5g).fillna(0.0).clip(-1.0, 1.5)
 
 
 def titans_rb_yards_after_contact_per_attempt_3g(df: pd.DataFrame) -> pd.Series:
@@ -394,28 +834,20 @@ def titans_rb_yards_after_contact_per_attempt_3g(df: pd.DataFrame) -> pd.Series:
     Input columns: rb_id, game_no, rushing_yards, yards_before_contact
     Output: YAC per attempt (0.0-8.0)
     """
-    d = df.copy().sort_values(["rb_id", "game_no"])
-
-    rushing_yards = d.get("rushing_yards", pd.Series(0, index=d.index))
-    yards_before_contact = d.get("yards_before_contact", pd.Series(0, index=d.index))
+    rushing_yards = df.get("rushing_yards", pd.Series(0, index=df.index))
+    yards_before_contact = df.get("yards_before_contact", pd.Series(0, index=df.index))
 
     # Calculate yards after contact
-    d["yac"] = (rushing_yards - yards_before_contact).clip(lower=0)
+    yac = (rushing_yards - yards_before_contact).clip(lower=0)
 
     # Game-level averages
-    per_game = (d.groupby(["rb_id", "game_no"])["yac"]
-                .mean().reset_index())
+    games = get_game_rollup(df, "rb_id")
+    per_game = games.aggregate(yac, "mean")
 
     # Rolling 3-game average
-    per_game = per_game.sort_values(["rb_id", "game_no"])
-    per_game["yac_3g"] = (per_game.groupby("rb_id")["yac"]
-                          .rolling(3, min_periods=1).mean()
-                          .reset_index(level=0, drop=True))
+    yac_3g = games.rolling(per_game, "3g", agg="mean", min_periods=1)
 
-    result = d.merge(per_game[["rb_id", "game_no", "yac_3g"]],
-                     on=["rb_id", "game_no"], how="left")["yac_3g"]
-
-    return result.reindex(df.index).fillna(0.0).clip(0.0, 8.0)
+    return games.scatter(yac_3g).fillna(0.0).clip(0.0, 8.0)
 
 
 def titans_oline_pass_block_win_rate_season(df: pd.DataFrame) -> pd.Series:
@@ -425,18 +857,15 @@ def titans_oline_pass_block_win_rate_season(df: pd.DataFrame) -> pd.Series:
     Input columns: oline_unit_id, pass_block_win
     Output: Pass block win rate percentage (30.0-85.0)
     """
-    d = df.copy()
-
-    pass_block_win = d.get("pass_block_win", pd.Series(False, index=d.index)).astype(bool)
+    pass_block_win = df.get("pass_block_win", pd.Series(False, index=df.index)).astype(bool)
 
     # Season-long win rate by O-line unit
-    win_rate = (d.groupby("oline_unit_id")["pass_block_win"]
-                .mean() * 100.0)
+    win_rate = pass_block_win.groupby(df["oline_unit_id"]).mean() * 100.0
 
     # Broadcast to all plays
-    result = d["oline_unit_id"].map(win_rate)
+    result = df["oline_unit_id"].map(win_rate)
 
-    return result.reindex(df.index).fillna(50.0).clip(30.0, 85.0)
+    return result.fillna(50.0).clip(30.0, 85.0)
 
 
 def titans_hidden_yardage_per_drive_5g(df: pd.DataFrame) -> pd.Series:
@@ -447,31 +876,24 @@ def titans_hidden_yardage_per_drive_5g(df: pd.DataFrame) -> pd.Series:
                    return_yards, penalty_yards
     Output: Hidden yardage per drive (-30.0 to 30.0)
     """
-    d = df.copy().sort_values(["offense_team", "game_no", "drive_id"])
-
-    start_yl = d.get("start_yardline", pd.Series(25, index=d.index))
-    expected_start = d.get("expected_start", pd.Series(25, index=d.index))
-    return_yards = d.get("return_yards", pd.Series(0, index=d.index)).fillna(0)
-    penalty_yards = d.get("penalty_yards", pd.Series(0, index=d.index)).fillna(0)
+    default_start = get_ep_table().default_start_yardline
+    start_yl = df.get("start_yardline", pd.Series(default_start, index=df.index))
+    expected_start = df.get("expected_start", pd.Series(default_start, index=df.index))
+    return_yards = df.get("return_yards", pd.Series(0, index=df.index)).fillna(0)
+    penalty_yards = df.get("penalty_yards", pd.Series(0, index=df.index)).fillna(0)
 
     # Calculate hidden yardage per drive
-    d["hidden_yardage"] = ((start_yl - expected_start) +
-                          return_yards - penalty_yards)
+    hidden_yardage = ((start_yl - expected_start) +
+                      return_yards - penalty_yards)
 
     # Game-level averages
-    per_game = (d.groupby(["offense_team", "game_no"])["hidden_yardage"]
-                .mean().reset_index())
+    games = get_game_rollup(df, "offense_team")
+    per_game = games.aggregate(hidden_yardage, "mean")
 
     # Rolling 5-game average
-    per_game = per_game.sort_values(["offense_team", "game_no"])
-    per_game["hidden_5g"] = (per_game.groupby("offense_team")["hidden_yardage"]
-                             .rolling(5, min_periods=2).mean()
-                             .reset_index(level=0, drop=True))
-
-    result = d.merge(per_game[["offense_team", "game_no", "hidden_5g"]],
-                     on=["offense_team", "game_no"], how="left")["hidden_5g"]
+    hidden_5g = games.rolling(per_game, "5g", agg="mean", min_periods=2)
 
-    return result.reindex(df.index).fillna(0.0).clip(-30.0, 30.0)
+    return games.scatter(hidden_5g).fillna(0.0).clip(-30.0, 30.0)
 
 
 # ==================== GRIZZLIES BASKETBALL FEATURES ====================
@@ -483,27 +905,17 @@ def grizzlies_player_defensive_rating_10g(df: pd.DataFrame) -> pd.Series:
     Input columns: player_id, game_no, def_possessions, points_allowed
     Output: Defensive rating (80.0-130.0)
     """
-    d = df.copy().sort_values(["player_id", "game_no"])
-
     # Game-level defensive rating
-    per_game = (d.groupby(["player_id", "game_no"])
-                .agg(poss=("def_possessions", "sum"),
-                     pts=("points_allowed", "sum"))
-                .reset_index())
+    games = get_game_rollup(df, "player_id")
+    poss = games.aggregate(df["def_possessions"], "sum")
+    pts = games.aggregate(df["points_allowed"], "sum")
 
-    per_game["def_rating"] = (per_game["pts"] / per_game["poss"] * 100.0).fillna(100.0)
+    def_rating = (pts / poss * 100.0).fillna(100.0)
 
     # Rolling 10-game average
-    per_game = per_game.sort_values(["player_id", "game_no"])
-    per_game["def_rating_10g"] = (per_game.groupby("player_id")["def_rating"]
-                                   .rolling(10, min_periods=5)
-                                   .mean()
-                                   .reset_index(level=0, drop=True))
+    def_rating_10g = games.rolling(def_rating, "10g", agg="mean", min_periods=5)
 
-    result = d.merge(per_game[["player_id", "game_no", "def_rating_10g"]],
-                     on=["player_id", "game_no"], how="left")["def_rating_10g"]
-
-    return result.reindex(df.index).fillna(100.0).clip(80.0, 130.0)
+    return games.scatter(def_rating_10g).fillna(100.0).clip(80.0, 130.0)
 
 
 def grizzlies_player_grit_grind_score_season(df: pd.DataFrame) -> pd.Series:
@@ -513,16 +925,14 @@ def grizzlies_player_grit_grind_score_season(df: pd.DataFrame) -> pd.Series:
     Input columns: player_id, charges_drawn, contested_shots, deflections, hustle_plays
     Output: Grit-Grind score (0.0-100.0)
     """
-    d = df.copy()
-
     # Components of Grit and Grind
-    charges = d.get("charges_drawn", pd.Series(0, index=d.index))
-    contested = d.get("contested_shots", pd.Series(0, index=d.index))
-    deflections = d.get("deflections", pd.Series(0, index=d.index))
-    hustle = d.get("hustle_plays", pd.Series(0, index=d.index))
+    charges = df.get("charges_drawn", pd.Series(0, index=df.index))
+    contested = df.get("contested_shots", pd.Series(0, index=df.index))
+    deflections = df.get("deflections", pd.Series(0, index=df.index))
+    hustle = df.get("hustle_plays", pd.Series(0, index=df.index))
 
     # Weighted score per possession
-    d["grit_score"] = (
+    grit_score = (
         charges * 3.0 +         # Charges are high-effort plays
         contested * 0.5 +       # Contesting shots
         deflections * 1.5 +     # Active hands
@@ -530,13 +940,13 @@ def grizzlies_player_grit_grind_score_season(df: pd.DataFrame) -> pd.Series:
     )
 
     # Season average per player
-    season_grit = (d.groupby("player_id")["grit_score"]
+    season_grit = (grit_score.groupby(df["player_id"])
                    .mean()
                    .rank(pct=True) * 100.0)
 
-    result = d["player_id"].map(season_grit)
+    result = df["player_id"].map(season_grit)
 
-    return result.reindex(df.index).fillna(50.0).clip(0.0, 100.0)
+    return result.fillna(50.0).clip(0.0, 100.0)
 
 
 def grizzlies_lineup_net_rating_5g(df: pd.DataFrame) -> pd.Series:
@@ -546,28 +956,19 @@ def grizzlies_lineup_net_rating_5g(df: pd.DataFrame) -> pd.Series:
     Input columns: lineup_id, game_no, off_rating, def_rating
     Output: Net rating (-50.0 to 50.0)
     """
-    d = df.copy().sort_values(["lineup_id", "game_no"])
+    off_rating = df.get("off_rating", pd.Series(100.0, index=df.index))
+    def_rating = df.get("def_rating", pd.Series(100.0, index=df.index))
 
-    off_rating = d.get("off_rating", pd.Series(100.0, index=d.index))
-    def_rating = d.get("def_rating", pd.Series(100.0, index=d.index))
-
-    d["net_rating"] = off_rating - def_rating
+    net_rating = off_rating - def_rating
 
     # Game-level averages
-    per_game = (d.groupby(["lineup_id", "game_no"])["net_rating"]
-                .mean().reset_index())
+    games = get_game_rollup(df, "lineup_id")
+    per_game = games.aggregate(net_rating, "mean")
 
     # Rolling 5-game average
-    per_game = per_game.sort_values(["lineup_id", "game_no"])
-    per_game["net_rating_5g"] = (per_game.groupby("lineup_id")["net_rating"]
-                                  .rolling(5, min_periods=2)
-                                  .mean()
-                                  .reset_index(level=0, drop=True))
-
-    result = d.merge(per_game[["lineup_id", "game_no", "net_rating_5g"]],
-                     on=["lineup_id", "game_no"], how="left")["net_rating_5g"]
+    net_rating_5g = games.rolling(per_game, "5g", agg="mean", min_periods=2)
 
-    return result.reindex(df.index).fillna(0.0).clip(-50.0, 50.0)
+    return games.scatter(net_rating_5g).fillna(0.0).clip(-50.0, 50.0)
 
 
 def grizzlies_player_clutch_shooting_season(df: pd.DataFrame) -> pd.Series:
@@ -577,15 +978,14 @@ def grizzlies_player_clutch_shooting_season(df: pd.DataFrame) -> pd.Series:
     Input columns: player_id, clutch_situation, fg_attempt, fg_made, shot_value
     Output: Clutch eFG% (20.0-80.0)
     """
-    d = df.copy()
-
-    clutch = d.get("clutch_situation", pd.Series(False, index=d.index)).astype(bool)
-    fg_made = d.get("fg_made", pd.Series(False, index=d.index)).astype(bool)
-    shot_value = d.get("shot_value", pd.Series(2, index=d.index))  # 2 or 3 pointer
+    clutch = df.get("clutch_situation", pd.Series(False, index=df.index)).astype(bool)
+    fg_made = df.get("fg_made", pd.Series(False, index=df.index)).astype(bool)
+    shot_value = df.get("shot_value", pd.Series(2, index=df.index))  # 2 or 3 pointer
 
     # Filter to clutch situations only
-    d["clutch_points"] = fg_made.where(clutch, 0) * shot_value
-    d["clutch_attempts"] = clutch.astype(int)
+    d = feature_buffer(df, ["player_id"],
+                       clutch_points=fg_made.where(clutch, 0) * shot_value,
+                       clutch_attempts=clutch.astype(int))
 
     # Season clutch eFG% per player
     clutch_stats = (d.groupby("player_id")
@@ -598,9 +998,9 @@ def grizzlies_player_clutch_shooting_season(df: pd.DataFrame) -> pd.Series:
     clutch_stats["clutch_efg"] = (clutch_stats["points"] /
                                   (clutch_stats["attempts"] * 2) * 100.0)
 
-    result = d["player_id"].map(clutch_stats["clutch_efg"])
+    result = df["player_id"].map(clutch_stats["clutch_efg"])
 
-    return result.reindex(df.index).fillna(45.0).clip(20.0, 80.0)
+    return result.fillna(45.0).clip(20.0, 80.0)
 
 
 def grizzlies_player_load_management_index(df: pd.DataFrame) -> pd.Series:
@@ -610,27 +1010,22 @@ def grizzlies_player_load_management_index(df: pd.DataFrame) -> pd.Series:
     Input columns: player_id, ts, minutes_played, distance_covered, accelerations
     Output: Load index (0.0-1.0, higher = more fatigued)
     """
-    d = df.copy().sort_values(["player_id", "ts"])
-
-    minutes = d.get("minutes_played", pd.Series(0, index=d.index))
-    distance = d.get("distance_covered", pd.Series(0, index=d.index))
-    accels = d.get("accelerations", pd.Series(0, index=d.index))
+    minutes = df.get("minutes_played", pd.Series(0, index=df.index))
+    distance = df.get("distance_covered", pd.Series(0, index=df.index))
+    accels = df.get("accelerations", pd.Series(0, index=df.index))
 
     # Compute load score
-    d["load_score"] = (
+    load_score = (
         minutes / 48.0 * 0.4 +          # Minutes as % of full game
         distance / 5000.0 * 0.3 +       # Distance in meters
         accels / 100.0 * 0.3            # High-intensity accelerations
     )
 
     # 7-day rolling load
-    d = d.set_index("ts")
-    load_7d = (d.groupby("player_id")["load_score"]
-               .rolling("7D", min_periods=3)
-               .mean()
-               .reset_index(level=0, drop=True))
+    engine = get_window_engine(df, "player_id", "ts")
+    load_7d = engine.rolling(load_score, "7D", agg="mean", min_periods=3, name="load")
 
-    return load_7d.reindex(df.index).fillna(0.3).clip(0.0, 1.0)
+    return load_7d.fillna(0.3).clip(0.0, 1.0)
 
 
 # ==================== LONGHORNS COLLEGE FEATURES ====================
@@ -642,42 +1037,26 @@ def longhorns_qb_passing_efficiency_rating_3g(df: pd.DataFrame) -> pd.Series:
     Input columns: qb_id, game_no, completions, attempts, yards, touchdowns, interceptions
     Output: Passer rating (0.0-200.0)
     """
-    d = df.copy().sort_values(["qb_id", "game_no"])
-
     # Game-level stats
-    per_game = (d.groupby(["qb_id", "game_no"])
-                .agg(comp=("completions", "sum"),
-                     att=("attempts", "sum"),
-                     yds=("yards", "sum"),
-                     td=("touchdowns", "sum"),
-                     int=("interceptions", "sum"))
-                .reset_index())
-
-    # NCAA passer rating formula
-    per_game["comp_pct"] = (per_game["comp"] / per_game["att"].replace(0, np.nan) * 100.0)
-    per_game["ypa"] = per_game["yds"] / per_game["att"].replace(0, np.nan)
-    per_game["td_pct"] = per_game["td"] / per_game["att"].replace(0, np.nan) * 100.0
-    per_game["int_pct"] = per_game["int"] / per_game["att"].replace(0, np.nan) * 100.0
+    games = get_game_rollup(df, "qb_id")
+    comp = games.aggregate(df["completions"], "sum")
+    att = games.aggregate(df["attempts"], "sum")
+    yds = games.aggregate(df["yards"], "sum")
+    td = games.aggregate(df["touchdowns"], "sum")
+    ints = games.aggregate(df["interceptions"], "sum")
 
     # Passer rating = ((8.4 * YDS) + (330 * TD) - (200 * INT) + (100 * COMP)) / ATT
-    per_game["passer_rating"] = (
-        ((8.4 * per_game["yds"]) +
-         (330 * per_game["td"]) -
-         (200 * per_game["int"]) +
-         (100 * per_game["comp"])) / per_game["att"]
+    passer_rating = (
+        ((8.4 * yds) +
+         (330 * td) -
+         (200 * ints) +
+         (100 * comp)) / att
     ).fillna(0.0)
 
     # Rolling 3-game average
-    per_game = per_game.sort_values(["qb_id", "game_no"])
-    per_game["rating_3g"] = (per_game.groupby("qb_id")["passer_rating"]
-                             .rolling(3, min_periods=1)
-                             .mean()
-                             .reset_index(level=0, drop=True))
+    rating_3g = games.rolling(passer_rating, "3g", agg="mean", min_periods=1)
 
-    result = d.merge(per_game[["qb_id", "game_no", "rating_3g"]],
-                     on=["qb_id", "game_no"], how="left")["rating_3g"]
-
-    return result.reindex(df.index).fillna(100.0).clip(0.0, 200.0)
+    return games.scatter(rating_3g).fillna(100.0).clip(0.0, 200.0)
 
 
 def longhorns_rb_breakaway_run_rate_5g(df: pd.DataFrame) -> pd.Series:
@@ -687,31 +1066,20 @@ def longhorns_rb_breakaway_run_rate_5g(df: pd.DataFrame) -> pd.Series:
     Input columns: rb_id, game_no, rushing_yards, is_breakaway
     Output: Breakaway rate percentage (0.0-50.0)
     """
-    d = df.copy().sort_values(["rb_id", "game_no"])
-
-    is_breakaway = d.get("is_breakaway",
-                        d.get("rushing_yards", pd.Series(0, index=d.index)) >= 15)
+    is_breakaway = df.get("is_breakaway",
+                          df.get("rushing_yards", pd.Series(0, index=df.index)) >= 15)
 
     # Game-level breakaway rate
-    per_game = (d.groupby(["rb_id", "game_no"])
-                .agg(breakaways=("is_breakaway", "sum"),
-                     total_runs=("is_breakaway", "count"))
-                .reset_index())
+    games = get_game_rollup(df, "rb_id")
+    breakaways = games.aggregate(is_breakaway, "sum")
+    total_runs = games.aggregate(is_breakaway, "count")
 
-    per_game["breakaway_rate"] = (per_game["breakaways"] /
-                                  per_game["total_runs"].replace(0, np.nan) * 100.0)
+    breakaway_rate = breakaways / total_runs.replace(0, np.nan) * 100.0
 
     # Rolling 5-game average
-    per_game = per_game.sort_values(["rb_id", "game_no"])
-    per_game["breakaway_5g"] = (per_game.groupby("rb_id")["breakaway_rate"]
-                                .rolling(5, min_periods=2)
-                                .mean()
-                                .reset_index(level=0, drop=True))
-
-    result = d.merge(per_game[["rb_id", "game_no", "breakaway_5g"]],
-                     on=["rb_id", "game_no"], how="left")["breakaway_5g"]
+    breakaway_5g = games.rolling(breakaway_rate, "5g", agg="mean", min_periods=2)
 
-    return result.reindex(df.index).fillna(5.0).clip(0.0, 50.0)
+    return games.scatter(breakaway_5g).fillna(5.0).clip(0.0, 50.0)
 
 
 def longhorns_nil_valuation_index(df: pd.DataFrame) -> pd.Series:
@@ -722,19 +1090,17 @@ def longhorns_nil_valuation_index(df: pd.DataFrame) -> pd.Series:
                    media_mentions, game_impact_score
     Output: NIL index (0.0-100.0)
     """
-    d = df.copy()
-
     # Performance metrics
-    touchdowns = d.get("touchdowns", pd.Series(0, index=d.index))
-    yards = d.get("all_purpose_yards", pd.Series(0, index=d.index))
-    impact = d.get("game_impact_score", pd.Series(0.5, index=d.index))
+    touchdowns = df.get("touchdowns", pd.Series(0, index=df.index))
+    yards = df.get("all_purpose_yards", pd.Series(0, index=df.index))
+    impact = df.get("game_impact_score", pd.Series(0.5, index=df.index))
 
     # Social metrics
-    followers = d.get("social_followers", pd.Series(1000, index=d.index))
-    mentions = d.get("media_mentions", pd.Series(0, index=d.index))
+    followers = df.get("social_followers", pd.Series(1000, index=df.index))
+    mentions = df.get("media_mentions", pd.Series(0, index=df.index))
 
     # NIL valuation formula
-    d["nil_score"] = (
+    nil_score = (
         (touchdowns * 10000) +                    # TD value
         (yards * 50) +                            # Yards value
         (impact * 20000) +                        # Game impact
@@ -743,11 +1109,11 @@ def longhorns_nil_valuation_index(df: pd.DataFrame) -> pd.Series:
     )
 
     # Convert to percentile ranking
-    nil_percentile = d.groupby("player_id")["nil_score"].mean().rank(pct=True) * 100.0
+    nil_percentile = nil_score.groupby(df["player_id"]).mean().rank(pct=True) * 100.0
 
-    result = d["player_id"].map(nil_percentile)
+    result = df["player_id"].map(nil_percentile)
 
-    return result.reindex(df.index).fillna(50.0).clip(0.0, 100.0)
+    return result.fillna(50.0).clip(0.0, 100.0)
 
 
 # ==================== ADVANCED SABERMETRICS ====================
@@ -759,8 +1125,6 @@ def calculate_woba(df: pd.DataFrame) -> pd.Series:
     Input columns: bb, hbp, single, double, triple, hr, ab, sf
     Output: wOBA (0.000-1.000)
     """
-    d = df.copy()
-
     # 2024 linear weights (approximate)
     wBB = 0.690
     wHBP = 0.720
@@ -769,14 +1133,14 @@ def calculate_woba(df: pd.DataFrame) -> pd.Series:
     w3B = 1.560
     wHR = 2.000
 
-    bb = d.get("bb", pd.Series(0, index=d.index))
-    hbp = d.get("hbp", pd.Series(0, index=d.index))
-    single = d.get("single", pd.Series(0, index=d.index))
-    double = d.get("double", pd.Series(0, index=d.index))
-    triple = d.get("triple", pd.Series(0, index=d.index))
-    hr = d.get("hr", pd.Series(0, index=d.index))
-    ab = d.get("ab", pd.Series(0, index=d.index))
-    sf = d.get("sf", pd.Series(0, index=d.index))
+    bb = df.get("bb", pd.Series(0, index=df.index))
+    hbp = df.get("hbp", pd.Series(0, index=df.index))
+    single = df.get("single", pd.Series(0, index=df.index))
+    double = df.get("double", pd.Series(0, index=df.index))
+    triple = df.get("triple", pd.Series(0, index=df.index))
+    hr = df.get("hr", pd.Series(0, index=df.index))
+    ab = df.get("ab", pd.Series(0, index=df.index))
+    sf = df.get("sf", pd.Series(0, index=df.index))
 
     numerator = (wBB * bb + wHBP * hbp + w1B * single +
                 w2B * double + w3B * triple + wHR * hr)
@@ -794,13 +1158,11 @@ def calculate_fip(df: pd.DataFrame) -> pd.Series:
     Input columns: hr, bb, hbp, k, ip
     Output: FIP (1.00-7.00)
     """
-    d = df.copy()
-
-    hr = d.get("hr", pd.Series(0, index=d.index))
-    bb = d.get("bb", pd.Series(0, index=d.index))
-    hbp = d.get("hbp", pd.Series(0, index=d.index))
-    k = d.get("k", pd.Series(0, index=d.index))
-    ip = d.get("ip", pd.Series(1, index=d.index))
+    hr = df.get("hr", pd.Series(0, index=df.index))
+    bb = df.get("bb", pd.Series(0, index=df.index))
+    hbp = df.get("hbp", pd.Series(0, index=df.index))
+    k = df.get("k", pd.Series(0, index=df.index))
+    ip = df.get("ip", pd.Series(1, index=df.index))
 
     # FIP constant (league average ERA - league average FIP)
     cFIP = 3.10
@@ -817,13 +1179,11 @@ def calculate_xfip(df: pd.DataFrame) -> pd.Series:
     Input columns: fly_balls, bb, hbp, k, ip
     Output: xFIP (1.00-7.00)
     """
-    d = df.copy()
-
-    fb = d.get("fly_balls", pd.Series(0, index=d.index))
-    bb = d.get("bb", pd.Series(0, index=d.index))
-    hbp = d.get("hbp", pd.Series(0, index=d.index))
-    k = d.get("k", pd.Series(0, index=d.index))
-    ip = d.get("ip", pd.Series(1, index=d.index))
+    fb = df.get("fly_balls", pd.Series(0, index=df.index))
+    bb = df.get("bb", pd.Series(0, index=df.index))
+    hbp = df.get("hbp", pd.Series(0, index=df.index))
+    k = df.get("k", pd.Series(0, index=df.index))
+    ip = df.get("ip", pd.Series(1, index=df.index))
 
     # League average HR/FB rate
     league_hr_fb = 0.105
@@ -841,6 +1201,23 @@ def calculate_xfip(df: pd.DataFrame) -> pd.Series:
 
 # ==================== FOOTBALL ADVANCED METRICS ====================
 
+def expected_points_vectorized(down, distance, yard_line) -> np.ndarray:
+    """
+    Array version of expected_points for whole play-by-play columns.
+
+    Backed by the shared EP lookup table (see ep_table.py).
+
+    Args:
+        down: Down (1-4) per play
+        distance: Yards to go per play
+        yard_line: Yard line (0-100, own goal = 0) per play
+
+    Returns:
+        Expected points per play (0.0 where down or yard line is missing)
+    """
+    return get_ep_table().expected_points(down, distance, yard_line)
+
+
 def calculate_epa(df: pd.DataFrame) -> pd.Series:
     """
     Calculate Expected Points Added (EPA) per play.
@@ -849,39 +1226,22 @@ def calculate_epa(df: pd.DataFrame) -> pd.Series:
                    next_distance, next_yard_line
     Output: EPA (-7.0 to 7.0)
     """
-    d = df.copy()
-
-    # Simplified EP model (would use full model in production)
-    def expected_points(down, distance, yard_line):
-        if pd.isna(down) or pd.isna(yard_line):
-            return 0.0
-
-        # Field position value (simplified)
-        fp_value = (yard_line - 50) / 50.0 * 3.0
-
-        # Down and distance value
-        if down == 1:
-            dd_value = 0.5
-        elif down == 2:
-            dd_value = 0.3 if distance < 7 else 0.1
-        elif down == 3:
-            dd_value = 0.1 if distance < 4 else -0.2
-        else:  # 4th down
-            dd_value = -0.5 if distance > 1 else 0.3
-
-        return fp_value + dd_value
+    def column(name):
+        if name not in df.columns:
+            return np.full(len(df), np.nan)
+        return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=float)
 
     # Calculate EP before and after play
-    ep_before = d.apply(lambda r: expected_points(r.get("down"),
-                                                 r.get("distance"),
-                                                 r.get("yard_line")), axis=1)
+    ep_before = expected_points_vectorized(column("down"),
+                                           column("distance"),
+                                           column("yard_line"))
 
-    ep_after = d.apply(lambda r: expected_points(r.get("next_down"),
-                                                r.get("next_distance"),
-                                                r.get("next_yard_line")), axis=1)
+    ep_after = expected_points_vectorized(column("next_down"),
+                                          column("next_distance"),
+                                          column("next_yard_line"))
 
     # EPA = EP after - EP before
-    epa = ep_after - ep_before
+    epa = pd.Series(ep_after - ep_before, index=df.index)
 
     return epa.clip(-7.0, 7.0)
 
@@ -893,19 +1253,14 @@ def calculate_dvoa(df: pd.DataFrame) -> pd.Series:
     Input columns: yards_gained, play_type, down, distance, opponent_def_rank
     Output: DVOA percentage (-100.0 to 100.0)
     """
-    d = df.copy()
-
-    yards = d.get("yards_gained", pd.Series(0, index=d.index))
-    play_type = d.get("play_type", pd.Series("run", index=d.index))
-    down = d.get("down", pd.Series(1, index=d.index))
-    distance = d.get("distance", pd.Series(10, index=d.index))
-    def_rank = d.get("opponent_def_rank", pd.Series(16, index=d.index))
+    yards = df.get("yards_gained", pd.Series(0, index=df.index))
+    play_type = df.get("play_type", pd.Series("run", index=df.index))
+    down = df.get("down", pd.Series(1, index=df.index))
+    distance = df.get("distance", pd.Series(10, index=df.index))
+    def_rank = df.get("opponent_def_rank", pd.Series(16, index=df.index))
 
     # Expected yards based on down and distance
-    expected_yards = np.where(down == 1, distance * 0.45,
-                             np.where(down == 2, distance * 0.60,
-                                    np.where(down == 3, distance * 0.85,
-                                           distance * 1.0)))
+    expected_yards = get_ep_table().expected_yards(down, distance)
 
     # Success value
     success_value = (yards - expected_yards) / expected_yards
@@ -961,10 +1316,8 @@ def cross_sport_athlete_versatility_index(df: pd.DataFrame) -> pd.Series:
                    games_played, skill_diversity
     Output: Versatility index (0.0-100.0)
     """
-    d = df.copy()
-
     # Count unique sports and positions per athlete
-    athlete_diversity = (d.groupby("athlete_id")
+    athlete_diversity = (df.groupby("athlete_id")
                         .agg(sports_count=("sport", "nunique"),
                              positions_count=("position", "nunique"),
                              total_games=("games_played", "sum"),
@@ -979,9 +1332,9 @@ def cross_sport_athlete_versatility_index(df: pd.DataFrame) -> pd.Series:
         athlete_diversity["skill_div"] * 20
     ).clip(0, 100)
 
-    result = d["athlete_id"].map(versatility)
+    result = df["athlete_id"].map(versatility)
 
-    return result.reindex(df.index).fillna(50.0).clip(0.0, 100.0)
+    return result.fillna(50.0).clip(0.0, 100.0)
 
 
 def injury_risk_prediction_score(df: pd.DataFrame) -> pd.Series:
@@ -992,17 +1345,15 @@ def injury_risk_prediction_score(df: pd.DataFrame) -> pd.Series:
                    biomechanical_stress, previous_injuries, age
     Output: Risk score (0.0-1.0)
     """
-    d = df.copy()
-
     # ACWR (Acute:Chronic Workload Ratio)
-    acute = d.get("acute_workload", pd.Series(100, index=d.index))
-    chronic = d.get("chronic_workload", pd.Series(100, index=d.index))
+    acute = df.get("acute_workload", pd.Series(100, index=df.index))
+    chronic = df.get("chronic_workload", pd.Series(100, index=df.index))
     acwr = (acute / chronic.replace(0, np.nan)).fillna(1.0)
 
     # Risk factors
-    bio_stress = d.get("biomechanical_stress", pd.Series(0.5, index=d.index))
-    prev_injuries = d.get("previous_injuries", pd.Series(0, index=d.index))
-    age = d.get("age", pd.Series(25, index=d.index))
+    bio_stress = df.get("biomechanical_stress", pd.Series(0.5, index=df.index))
+    prev_injuries = df.get("previous_injuries", pd.Series(0, index=df.index))
+    age = df.get("age", pd.Series(25, index=df.index))
 
     # Injury risk calculation
     risk = (
@@ -1022,11 +1373,10 @@ def performance_trajectory_slope(df: pd.DataFrame) -> pd.Series:
     Input columns: player_id, ts, performance_metric, games_played
     Output: Trajectory slope (-1.0 to 1.0)
     """
-    d = df.copy().sort_values(["player_id", "ts"])
-
-    # Convert timestamp to numeric for regression
-    d["days_since_start"] = (pd.to_datetime(d["ts"]) -
-                            pd.to_datetime(d["ts"]).min()).dt.days
+    # Convert timestamp to numeric for regression (slope does not depend on row order)
+    ts = pd.to_datetime(df["ts"])
+    d = feature_buffer(df, ["player_id", "performance_metric"],
+                       days_since_start=(ts - ts.min()).dt.days)
 
     def calculate_slope(group):
         if len(group) < 5:
@@ -1052,9 +1402,9 @@ def performance_trajectory_slope(df: pd.DataFrame) -> pd.Series:
 
     trajectories = d.groupby("player_id").apply(calculate_slope)
 
-    result = d["player_id"].map(trajectories)
+    result = df["player_id"].map(trajectories)
 
-    return result.reindex(df.index).fillna(0.0).clip(-1.0, 1.0)
+    return result.fillna(0.0).clip(-1.0, 1.0)
 
 
 def draft_value_projection(df: pd.DataFrame) -> pd.Series:
@@ -1065,13 +1415,11 @@ def draft_value_projection(df: pd.DataFrame) -> pd.Series:
                    ceiling_projection, floor_projection, injury_risk
     Output: Draft value score (0.0-100.0)
     """
-    d = df.copy()
-
-    age = d.get("age", pd.Series(21, index=d.index))
-    performance = d.get("performance_percentile", pd.Series(50, index=d.index))
-    ceiling = d.get("ceiling_projection", pd.Series(75, index=d.index))
-    floor = d.get("floor_projection", pd.Series(25, index=d.index))
-    injury_risk = d.get("injury_risk", pd.Series(0.2, index=d.index))
+    age = df.get("age", pd.Series(21, index=df.index))
+    performance = df.get("performance_percentile", pd.Series(50, index=df.index))
+    ceiling = df.get("ceiling_projection", pd.Series(75, index=df.index))
+    floor = df.get("floor_projection", pd.Series(25, index=df.index))
+    injury_risk = df.get("injury_risk", pd.Series(0.2, index=df.index))
 
     # Age adjustment (younger players have more upside)
     age_factor = np.where(age <= 20, 1.2,
@@ -1098,7 +1446,7 @@ def optimized_rolling_calculation(df: pd.DataFrame,
                                  min_periods: int = 1,
                                  agg_func: str = 'mean') -> pd.Series:
     """
-    Optimized rolling window calculation with caching.
+    Optimized rolling window calculation on the shared RollingWindowEngine.
 
     Args:
         df: Input DataFrame
@@ -1106,35 +1454,89 @@ def optimized_rolling_calculation(df: pd.DataFrame,
         value_col: Column to calculate on
         window: Window specification (e.g., '30D', '7G')
         min_periods: Minimum periods for calculation
-        agg_func: Aggregation function ('mean', 'sum', 'std')
+        agg_func: Aggregation function ('mean', 'sum', 'count', 'std')
 
     Returns:
         Calculated rolling values
     """
-    # Sort for temporal consistency
-    d = df.copy().sort_values([groupby_col, 'ts'] if 'ts' in df.columns else [groupby_col])
+    # Shared sort/partition; time windows need 'ts', count windows fall back to row order
+    order_col = 'ts' if 'ts' in df.columns else None
+    engine = get_window_engine(df, groupby_col, order_col)
 
-    # Set index for rolling
-    if 'ts' in d.columns and 'D' in window:
-        d = d.set_index('ts')
+    return engine.rolling(df[value_col], window, agg=agg_func,
+                          min_periods=min_periods, name=value_col).rename(value_col)
 
-    # Apply rolling calculation
-    grouped = d.groupby(groupby_col)[value_col]
 
-    if agg_func == 'mean':
-        result = grouped.rolling(window, min_periods=min_periods).mean()
-    elif agg_func == 'sum':
-        result = grouped.rolling(window, min_periods=min_periods).sum()
-    elif agg_func == 'std':
-        result = grouped.rolling(window, min_periods=min_periods).std()
-    else:
-        raise ValueError(f"Unsupported aggregation function: {agg_func}")
+@dataclass
+class FeatureGroup:
+    """Features that share one entity key and sort order."""
+    by: Tuple[str, ...]
+    order_col: Optional[str]
+    features: List[str] = field(default_factory=list)
+
+
+def plan_feature_execution(features: list) -> List[FeatureGroup]:
+    """
+    Group requested features by their entity key and sort order.
+
+    Features sharing a layout in FEATURE_LAYOUTS (e.g. all batter_id/ts
+    features, all qb_id/game_no features) land in one group so the frame is
+    sorted and partitioned once per group. Row-wise features form a single
+    group with no key.
+
+    Args:
+        features: Feature names in request order
+
+    Returns:
+        Execution groups in first-seen order
+    """
+    groups: Dict[Tuple, FeatureGroup] = {}
 
-    # Reset index if needed
-    if isinstance(result.index, pd.MultiIndex):
-        result = result.reset_index(level=0, drop=True)
+    for feature_name in dict.fromkeys(features):
+        by, order_col = FEATURE_LAYOUTS.get(feature_name, ((), None))
+        key = (by, order_col)
+        if key not in groups:
+            groups[key] = FeatureGroup(by=by, order_col=order_col)
+        groups[key].features.append(feature_name)
 
-    return result.reindex(df.index)
+    return list(groups.values())
+
+
+def execute_feature_group(df: pd.DataFrame, group: FeatureGroup) -> Dict[str, pd.Series]:
+    """
+    Run every feature of a group against one shared sort/partition.
+
+    Kernels run inside one shared engine scope, so the group's
+    RollingWindowEngine / GameRollup is built by the first kernel that needs
+    it and reused by the rest. Missing or failing features yield NaN series,
+    as in parallel_feature_computation.
+    """
+    results = {}
+
+    with shared_window_engines():
+        for feature_name in group.features:
+            try:
+                if feature_name in FEATURE_IMPLEMENTATIONS:
+                    results[feature_name] = FEATURE_IMPLEMENTATIONS[feature_name](df)
+                else:
+                    results[feature_name] = pd.Series(np.nan, index=df.index)
+            except Exception as e:
+                warnings.warn(f"Failed to compute {feature_name}: {str(e)}")
+                results[feature_name] = pd.Series(np.nan, index=df.index)
+
+    return results
+
+
+def _execute_group_shared(handle: SharedFrameHandle, group: FeatureGroup) -> Dict[str, np.ndarray]:
+    """Worker task: run a feature group over a shared-memory frame, returning positional arrays."""
+    with attached_frame(handle) as df:
+        results = execute_feature_group(df, group)
+        values = {
+            name: np.array(series.reindex(df.index).to_numpy(), copy=True)
+            for name, series in results.items()
+        }
+        del df, results
+    return values
 
 
 def parallel_feature_computation(df: pd.DataFrame,
@@ -1143,6 +1545,12 @@ def parallel_feature_computation(df: pd.DataFrame,
     """
     Compute multiple features in parallel using joblib.
 
+    Features are first fused into execution groups (plan_feature_execution);
+    each group is one parallel task, so the frame is sorted and partitioned
+    once per shared layout rather than once per feature. The frame itself is
+    published once into shared memory and workers attach to it zero-copy, so
+    fan-out cost does not grow with the number of groups.
+
     Args:
         df: Input DataFrame
         features: List of feature names to compute
@@ -1151,27 +1559,31 @@ def parallel_feature_computation(df: pd.DataFrame,
     Returns:
         DataFrame with computed features
     """
-    from joblib import Parallel, delayed
+    plan = plan_feature_execution(features)
 
-    def compute_single_feature(feature_name, data):
-        try:
-            if feature_name in FEATURE_IMPLEMENTATIONS:
-                return feature_name, FEATURE_IMPLEMENTATIONS[feature_name](data)
-            else:
-                return feature_name, pd.Series(np.nan, index=data.index)
-        except Exception as e:
-            warnings.warn(f"Failed to compute {feature_name}: {str(e)}")
-            return feature_name, pd.Series(np.nan, index=data.index)
-
-    # Parallel computation
-    results = Parallel(n_jobs=n_jobs)(
-        delayed(compute_single_feature)(feat, df) for feat in features
-    )
+    if n_jobs == 1 or len(plan) <= 1:
+        group_results = [execute_feature_group(df, group) for group in plan]
+    else:
+        from joblib import Parallel, delayed
+
+        with SharedFrame(df) as frame:
+            shared_results = Parallel(n_jobs=n_jobs)(
+                delayed(_execute_group_shared)(frame.handle, group) for group in plan
+            )
+
+        group_results = [
+            {name: pd.Series(values, index=df.index) for name, values in results.items()}
+            for results in shared_results
+        ]
+
+    # Combine results in request order
+    computed = {}
+    for results in group_results:
+        computed.update(results)
 
-    # Combine results
     feature_df = pd.DataFrame(index=df.index)
-    for feature_name, feature_values in results:
-        feature_df[feature_name] = feature_values
+    for feature_name in dict.fromkeys(features):
+        feature_df[feature_name] = computed[feature_name]
 
     return feature_df
 
@@ -1179,19 +1591,37 @@ def parallel_feature_computation(df: pd.DataFrame,
 def incremental_update(existing_features: pd.DataFrame,
                       new_data: pd.DataFrame,
                       feature_list: list,
-                      lookback_days: int = 30) -> pd.DataFrame:
+                      lookback_days: int = 30,
+                      state_store: Optional[WindowStateStore] = None) -> pd.DataFrame:
     """
     Incrementally update features with new data.
 
+    With a ``state_store``, features in STREAMING_FEATURES are advanced from
+    the stored window state in O(1) per event (the store must already hold the
+    history); only the remaining features are recomputed over the lookback.
+
     Args:
         existing_features: Previously computed features
         new_data: New incoming data
         feature_list: Features to update
         lookback_days: Days of historical context needed
+        state_store: Optional persistent window state for streaming features
 
     Returns:
         Updated feature DataFrame
     """
+    if state_store is not None:
+        streamed = [f for f in feature_list if f in STREAMING_FEATURES]
+        remaining = [f for f in feature_list if f not in STREAMING_FEATURES]
+
+        updated = state_store.update_many(streamed, new_data)
+        if remaining:
+            recomputed = incremental_update(existing_features, new_data, remaining, lookback_days)
+            for feature_name in remaining:
+                updated[feature_name] = recomputed[feature_name].to_numpy()
+
+        return updated[list(dict.fromkeys(feature_list))]
+
     # Get relevant historical data for context
     if 'ts' in new_data.columns:
         min_date = pd.to_datetime(new_data['ts']).min() - pd.Timedelta(days=lookback_days)
@@ -1226,55 +1656,49 @@ def pitch_tunneling_score(df: pd.DataFrame) -> pd.Series:
                    pfx_x, pfx_z, start_speed
     Output: Tunneling score (0.0-100.0)
     """
-    d = df.copy().sort_values(["pitcher_id", "ts"])
-
-    # Group consecutive pitches
-    d["pitch_pair"] = d.groupby("pitcher_id").cumcount() // 2
-
-    def calculate_tunnel(group):
-        if len(group) < 2:
-            return pd.Series(50.0, index=group.index)
+    if df.empty:
+        return pd.Series(dtype=float, index=df.index)
 
-        scores = []
-        for i in range(len(group) - 1):
-            # Release point similarity
-            release_diff = np.sqrt(
-                (group.iloc[i]["release_x"] - group.iloc[i+1]["release_x"])**2 +
-                (group.iloc[i]["release_y"] - group.iloc[i+1]["release_y"])**2 +
-                (group.iloc[i]["release_z"] - group.iloc[i+1]["release_z"])**2
-            )
+    engine = get_window_engine(df, "pitcher_id", "ts")
+    order = engine.order
 
-            # Movement difference (want this to be large)
-            movement_diff = np.sqrt(
-                (group.iloc[i]["pfx_x"] - group.iloc[i+1]["pfx_x"])**2 +
-                (group.iloc[i]["pfx_z"] - group.iloc[i+1]["pfx_z"])**2
-            )
+    def sorted_delta(col):
+        # Difference between each sorted pitch and the next one (last row unused)
+        x = df[col].to_numpy(dtype=float)[order]
+        return np.append(x[:-1] - x[1:], np.nan)
 
-            # Velocity difference
-            velo_diff = abs(group.iloc[i]["start_speed"] - group.iloc[i+1]["start_speed"])
+    # Release point similarity
+    release_diff = np.sqrt(sorted_delta("release_x")**2 +
+                           sorted_delta("release_y")**2 +
+                           sorted_delta("release_z")**2)
 
-            # Tunneling score (similar release, different movement)
-            tunnel_score = (
-                (1 - min(release_diff / 0.5, 1)) * 40 +      # Release similarity
-                min(movement_diff / 2.0, 1) * 40 +            # Movement difference
-                (1 - min(velo_diff / 10.0, 1)) * 20          # Speed similarity
-            )
+    # Movement difference (want this to be large)
+    movement_diff = np.sqrt(sorted_delta("pfx_x")**2 + sorted_delta("pfx_z")**2)
 
-            scores.append(tunnel_score)
-            scores.append(tunnel_score)  # Apply to both pitches in pair
+    # Velocity difference
+    velo_diff = np.abs(sorted_delta("start_speed"))
 
-        if len(group) % 2 == 1:
-            scores.append(50.0)  # Default for unpaired pitch
+    # Tunneling score of the pair (i, i+1) (similar release, different movement)
+    pair_score = (
+        (1 - np.minimum(release_diff / 0.5, 1)) * 40 +      # Release similarity
+        np.minimum(movement_diff / 2.0, 1) * 40 +            # Movement difference
+        (1 - np.minimum(velo_diff / 10.0, 1)) * 20          # Speed similarity
+    )
 
-        return pd.Series(scores[:len(group)], index=group.index)
+    # Pitch k of a pitcher's sequence takes the score of pair (k // 2, k // 2 + 1),
+    # so both pitches of a pair share it; single-pitch pitchers stay at 50.
+    group_starts = np.unique(engine.group_start)
+    group_sizes = np.diff(np.append(group_starts, engine.size))
+    group_size = np.repeat(group_sizes, group_sizes)
+    position = np.arange(engine.size) - engine.group_start
 
-    tunnel_scores = d.groupby("pitcher_id").apply(calculate_tunnel)
+    scores = pair_score[engine.group_start + position // 2]
+    scores = np.where((group_size >= 2) & (engine.codes >= 0), scores, 50.0)
 
-    # Flatten if MultiIndex
-    if isinstance(tunnel_scores.index, pd.MultiIndex):
-        tunnel_scores = tunnel_scores.reset_index(level=0, drop=True)
+    tunnel_scores = np.empty(engine.size)
+    tunnel_scores[order] = scores
 
-    return tunnel_scores.reindex(df.index).fillna(50.0).clip(0.0, 100.0)
+    return pd.Series(tunnel_scores, index=df.index).fillna(50.0).clip(0.0, 100.0)
 
 
 def pitch_sequence_effectiveness(df: pd.DataFrame) -> pd.Series:
@@ -1284,8 +1708,6 @@ def pitch_sequence_effectiveness(df: pd.DataFrame) -> pd.Series:
     Input columns: pitcher_id, pitch_type, count, result, previous_pitch_type
     Output: Sequence effectiveness score (0.0-100.0)
     """
-    d = df.copy().sort_values(["pitcher_id", "ts"])
-
     # Define effective sequences
     effective_sequences = {
         ('FB', 'CB'): 1.2,  # Fastball to curveball
@@ -1305,15 +1727,24 @@ def pitch_sequence_effectiveness(df: pd.DataFrame) -> pd.Series:
         '3-1': 0.75,
     }
 
-    d["prev_pitch"] = d.groupby("pitcher_id")["pitch_type"].shift(1)
-    d["sequence"] = list(zip(d["prev_pitch"].fillna('FB'), d["pitch_type"]))
+    # Previous pitch of the same pitcher in time order ('FB' opens a sequence)
+    engine = get_window_engine(df, "pitcher_id", "ts")
+    pitch_type = df["pitch_type"].to_numpy(dtype=object)
+    sorted_types = pitch_type[engine.order]
+    has_prev = (np.arange(engine.size) > engine.group_start) & (engine.codes >= 0)
+    sorted_prev = np.where(has_prev, np.roll(sorted_types, 1), None)
+    prev_pitch = np.empty(engine.size, dtype=object)
+    prev_pitch[engine.order] = sorted_prev
+
+    sequence = pd.Series(list(zip(pd.Series(prev_pitch).fillna('FB'), pitch_type)),
+                         index=df.index)
 
     # Calculate effectiveness
-    base_effectiveness = d["sequence"].map(effective_sequences).fillna(1.0)
-    count_modifier = d["count"].map(count_leverage).fillna(1.0)
+    base_effectiveness = sequence.map(effective_sequences).fillna(1.0)
+    count_modifier = df["count"].map(count_leverage).fillna(1.0)
 
     # Result-based scoring
-    result_score = d["result"].map({
+    result_score = df["result"].map({
         'strike': 1.0,
         'ball': 0.3,
         'foul': 0.6,
@@ -1323,7 +1754,7 @@ def pitch_sequence_effectiveness(df: pd.DataFrame) -> pd.Series:
 
     effectiveness = (base_effectiveness * count_modifier * result_score * 100).clip(0, 100)
 
-    return effectiveness.reindex(df.index).fillna(50.0)
+    return effectiveness.fillna(50.0)
 
 
 # ==================== STATCAST DATA PROCESSING ====================
@@ -1457,6 +1888,65 @@ FEATURE_IMPLEMENTATIONS = {
 }
 
 
+# Entity key and sort order each feature partitions by; features sharing a
+# layout are fused by plan_feature_execution. Row-wise features are omitted.
+FEATURE_LAYOUTS = {
+    # Cardinals Baseball
+    "cardinals_batter_xwoba_30d": (("batter_id",), "ts"),
+    "cardinals_batter_barrel_rate_7g": (("batter_id",), "game_no"),
+    "cardinals_batter_chase_rate_below_zone_30d": (("batter_id",), "ts"),
+    "cardinals_batter_clutch_performance_season": (("batter_id",), None),
+    "cardinals_batter_sprint_speed_percentile": (("batter_id",), None),
+
+    # Cardinals Pitching
+    "cardinals_pitcher_whiff_rate_15d": (("pitcher_id",), "ts"),
+    "cardinals_pitcher_command_plus_30d": (("pitcher_id",), "ts"),
+    "cardinals_bullpen_fatigue_index_3d": (("team_id", "pitcher_id"), "ts"),
+    "cardinals_pitcher_tto_penalty_delta_2to3": (("pitcher_id", "season"), None),
+    "cardinals_pitcher_stuff_plus_rolling_7g": (("pitcher_id",), "game_no"),
+
+    # Titans Football
+    "titans_qb_pressure_to_sack_rate_adj_4g": (("qb_id",), "game_no"),
+    "titans_qb_epa_per_play_clean_pocket_5g": (("qb_id",), "game_no"),
+    "titans_rb_yards_after_contact_per_attempt_3g": (("rb_id",), "game_no"),
+    "titans_oline_pass_block_win_rate_season": (("oline_unit_id",), None),
+    "titans_hidden_yardage_per_drive_5g": (("offense_team",), "game_no"),
+
+    # Grizzlies Basketball
+    "grizzlies_player_defensive_rating_10g": (("player_id",), "game_no"),
+    "grizzlies_player_grit_grind_score_season": (("player_id",), None),
+    "grizzlies_lineup_net_rating_5g": (("lineup_id",), "game_no"),
+    "grizzlies_player_clutch_shooting_season": (("player_id",), None),
+    "grizzlies_player_load_management_index": (("player_id",), "ts"),
+
+    # Longhorns College
+    "longhorns_qb_passing_efficiency_rating_3g": (("qb_id",), "game_no"),
+    "longhorns_rb_breakaway_run_rate_5g": (("rb_id",), "game_no"),
+    "longhorns_nil_valuation_index": (("player_id",), None),
+
+    # Cross-Sport Analytics
+    "cross_sport_athlete_versatility_index": (("athlete_id",), None),
+    "performance_trajectory_slope": (("player_id",), "ts"),
+
+    # Pitch Analytics
+    "pitch_tunneling_score": (("pitcher_id",), "ts"),
+    "pitch_sequence_effectiveness": (("pitcher_id",), "ts"),
+}
+
+
+# Features whose windows are all named RollingWindowEngine.rolling() calls over
+# an order column, so WindowStateStore can advance them event by event.
+STREAMING_FEATURES = frozenset({
+    "cardinals_batter_xwoba_30d",
+    "cardinals_batter_chase_rate_below_zone_30d",
+    "cardinals_pitcher_whiff_rate_15d",
+    "cardinals_pitcher_command_plus_30d",
+    "cardinals_bullpen_fatigue_index_3d",
+    "cardinals_pitcher_stuff_plus_rolling_7g",
+    "grizzlies_player_load_management_index",
+})
+
+
 def compute_feature(feature_name: str, df: pd.DataFrame) -> pd.Series:
     """
     Compute a feature by name with proper error handling.
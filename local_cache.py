@@ -0,0 +1,329 @@
+"""
+Blaze Sports Intelligence In-Process (L1) Cache
+
+Process-local cache tier in front of Redis for both real-time pipelines:
+- Bounded by payload bytes, not entry count
+- LRU eviction once the byte budget is exceeded
+- Per-entry TTLs that follow the ``redis.cache_ttl`` tiers in analytics_config.yaml
+- Pattern invalidation mirroring the Redis keys it shadows, plus an optional
+  TTL cap bounding how long invalidations made in other processes go unseen
+- Hit / miss / eviction / expiration counters for the metrics endpoints
+- Single-flight coalescing so concurrent misses on one key compute once
+- Soft/hard TTLs with probabilistic early refresh (stale-while-revalidate)
+
+Entries hold the serialized payload exactly as stored in Redis (float32
+buffers or JSON strings), so a hit never hands out a shared mutable object.
+"""
+
+import asyncio
+import math
+import os
+import random
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import Future
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Union
+
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent / "analytics_config.yaml"
+
+# Fallback tiers (seconds) when analytics_config.yaml is unavailable
+DEFAULT_CACHE_TTL = {
+    'features': 300,
+    'raw_data': 60,
+    'aggregations': 600,
+    'metadata': 3600,
+    'live_games': 30,
+    'stale_features': 3600,
+    'l1_features': 15
+}
+
+DEFAULT_L1_MAX_BYTES = 64 * 1024 * 1024
+
+# Entries stay readable for HARD_TTL_FACTOR x their tier's (soft) TTL; past the
+# soft TTL they are served while one caller refreshes them in the background
+DEFAULT_HARD_TTL_FACTOR = 2.0
+DEFAULT_EARLY_REFRESH_BETA = 1.0
+
+
+def load_cache_ttl(config_path: Optional[Union[str, Path]] = None) -> Dict[str, int]:
+    """
+    Cache TTL tiers from the ``redis.cache_ttl`` section of the analytics config.
+
+    The path defaults to $BLAZE_ANALYTICS_CONFIG or analytics_config.yaml next
+    to this module. Missing tiers (or an unreadable file) fall back to
+    DEFAULT_CACHE_TTL.
+    """
+    path = Path(config_path or os.environ.get("BLAZE_ANALYTICS_CONFIG") or DEFAULT_CONFIG_PATH)
+    tiers = dict(DEFAULT_CACHE_TTL)
+
+    try:
+        import yaml
+
+        with open(path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+        tiers.update({
+            name: int(ttl)
+            for name, ttl in ((config.get('redis') or {}).get('cache_ttl') or {}).items()
+        })
+    except Exception as e:
+        warnings.warn(f"Could not read cache TTL tiers from {path} ({e}); using defaults")
+
+    return tiers
+
+
+def hard_ttl(soft_ttl: float, factor: float = DEFAULT_HARD_TTL_FACTOR) -> int:
+    """Storage (hard) TTL in whole seconds for an entry with the given soft TTL."""
+    return max(int(math.ceil(soft_ttl * factor)), int(math.ceil(soft_ttl)))
+
+
+def should_refresh(soft_expires_at: float, compute_seconds: float,
+                   beta: float = DEFAULT_EARLY_REFRESH_BETA, now: Optional[float] = None) -> bool:
+    """
+    Probabilistic early expiration (XFetch).
+
+    Always True once the soft TTL has passed. Before that, readers volunteer
+    for a refresh with a probability that rises as expiry approaches, scaled
+    by how long the value took to compute; ``beta`` > 1 refreshes earlier.
+    Readers of a popular key therefore do not all miss at the same instant.
+    """
+    now = time.time() if now is None else now
+    return now - compute_seconds * beta * math.log(1.0 - random.random()) >= soft_expires_at
+
+
+def payload_size(value: Any) -> int:
+    """Approximate size in bytes of a cached payload."""
+    nbytes = getattr(value, 'nbytes', None)
+    if nbytes is not None:
+        return int(nbytes)
+    if isinstance(value, str):
+        return len(value.encode())
+    return len(value)
+
+
+class L1Cache:
+    """Byte-bounded, thread-safe LRU cache with per-entry TTLs."""
+
+    def __init__(self, max_bytes: int = DEFAULT_L1_MAX_BYTES, default_ttl: float = DEFAULT_CACHE_TTL['features'],
+                 max_ttl: Optional[float] = None):
+        """
+        Args:
+            max_bytes: Upper bound on the summed payload sizes
+            default_ttl: TTL (seconds) for entries stored without one
+            max_ttl: Cap on every entry's TTL, bounding how long a copy can
+                outlive an invalidation made in another process
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.max_ttl = max_ttl
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()  # key -> (value, nbytes, expires_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[2] > time.monotonic()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently held."""
+        return self._bytes
+
+    def _drop(self, key: str) -> None:
+        _, nbytes, _ = self._entries.pop(key)
+        self._bytes -= nbytes
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached payload for ``key``, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry[2] <= time.monotonic():
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, nbytes: Optional[int] = None) -> bool:
+        """
+        Store ``value`` for ``ttl`` seconds, evicting least recently used entries.
+
+        Returns False (and stores nothing) when the payload alone exceeds the budget.
+        """
+        nbytes = payload_size(value) if nbytes is None else nbytes
+        ttl = self.default_ttl if ttl is None else ttl
+        if self.max_ttl is not None:
+            ttl = min(ttl, self.max_ttl)
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+            if nbytes > self.max_bytes or ttl <= 0:
+                return False
+
+            while self._bytes + nbytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+            self._entries[key] = (value, nbytes, time.monotonic() + ttl)
+            self._bytes += nbytes
+            return True
+
+    def invalidate(self, pattern: str = "*") -> int:
+        """Drop entries whose keys match a Redis-style glob ``pattern``."""
+        with self._lock:
+            if pattern == "*":
+                removed = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return removed
+
+            matched = [key for key in self._entries if fnmatchcase(key, pattern)]
+            for key in matched:
+                self._drop(key)
+            return len(matched)
+
+    def delete(self, *keys: str) -> int:
+        """Drop specific entries; returns how many were present."""
+        with self._lock:
+            present = [key for key in keys if key in self._entries]
+            for key in present:
+                self._drop(key)
+            return len(present)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self.invalidate("*")
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and occupancy for metrics reporting."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups * 100 if lookups else 0.0,
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes
+        }
+
+
+class SingleFlight:
+    """
+    Thread-level request coalescing.
+
+    The first caller for a key runs the computation; callers arriving while
+    it is in flight block on the same result (or exception) instead of
+    recomputing it.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run ``fn`` once per in-flight ``key``.
+
+        Returns:
+            (result, leader) where ``leader`` is True for the caller that ran ``fn``
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result(), False
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return result, True
+
+    def submit(self, key: Hashable, start: Callable[[], Future]) -> Tuple[Future, bool]:
+        """
+        Non-blocking variant of do(): ``start`` launches the work and returns its Future.
+
+        The key stays in flight until that Future completes, so every caller
+        can wait on it with a timeout of its own.
+
+        Returns:
+            (future, leader) where ``leader`` is True for the caller that started it
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = self._calls[key] = start()
+
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return future, True
+
+    def _forget(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Request coalescing for coroutines running on one event loop."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, coro_fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await ``coro_fn()`` once per in-flight ``key``.
+
+        Cancelling one waiter does not cancel the shared computation.
+
+        Returns:
+            (result, leader) where ``leader`` is True for the caller that started it
+        """
+        task = self._calls.get(key)
+        leader = task is None
+        if leader:
+            task = self._calls[key] = asyncio.ensure_future(coro_fn())
+            task.add_done_callback(
+                lambda done: self._calls.pop(key) if self._calls.get(key) is done else None
+            )
+
+        return await asyncio.shield(task), leader
@@ -165,6 +165,21 @@ def validate_feature_files(project_root: Path) -> bool:
     return result.returncode == 0
 
 
+def build_lookup_tables(project_root: Path) -> bool:
+    """Build the shared expected points lookup table."""
+    builder_path = project_root / "tools" / "features" / "build_ep_table.py"
+
+    if not builder_path.exists():
+        print("⚠️ EP table builder not found, skipping")
+        return True
+
+    result = run_command([
+        sys.executable, str(builder_path)
+    ], "Building expected points lookup table", check=False)
+
+    return result.returncode == 0
+
+
 def setup_redis_config(project_root: Path) -> None:
     """Setup Redis configuration for development."""
     print("🔄 Setting up Redis configuration...")
@@ -314,6 +329,9 @@ def main():
         if not install_python_dependencies(project_root):
             print("❌ Failed to install dependencies, but continuing...")
 
+        if not build_lookup_tables(project_root):
+            print("⚠️ EP table build failed; it will be built on first use")
+
         setup_redis_config(project_root)
         create_environment_file(project_root)
 
@@ -0,0 +1,233 @@
+"""
+Blaze Sports Intelligence Shared-Memory Frames
+
+Zero-copy DataFrame handoff to worker processes:
+- The input frame is published once into a single shared-memory block
+- Numeric, boolean and timestamp columns attach as read-only views
+- String/ID columns are dictionary-encoded (int32 codes + pickled category list)
+- Categorical and nullable (Int64, Float64, boolean) columns keep their
+  pandas dtype: codes or values plus the pickled dtype, and a missing mask
+- Only a small picklable handle crosses the process boundary, so fan-out
+  cost does not grow with the number of tasks reading the frame
+
+Workers see a RangeIndex; results are positional and the publishing side
+re-labels them with the original index.
+"""
+
+import os
+import pickle
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+_ALIGN = 64
+
+
+@dataclass(frozen=True)
+class SharedColumn:
+    """Location and decoding of one column inside a shared block."""
+    name: str
+    kind: str               # "numeric", "datetime", "category", "categorical" or "masked"
+    dtype: str
+    offset: int
+    nbytes: int
+    categories_offset: int = 0  # pickled category list, or pandas dtype for categorical/masked
+    categories_nbytes: int = 0
+    tz: Optional[str] = None
+    mask_offset: int = 0        # missing-value mask of masked columns
+    mask_nbytes: int = 0
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """Picklable descriptor of a published frame."""
+    block_name: str
+    n_rows: int
+    columns: Tuple[SharedColumn, ...]
+
+
+_MASKED_ARRAYS = {
+    "b": pd.arrays.BooleanArray,
+    "i": pd.arrays.IntegerArray,
+    "u": pd.arrays.IntegerArray,
+    "f": pd.arrays.FloatingArray,
+}
+
+
+def _column_array(values: pd.Series):
+    """Raw array plus decoding fields for one column: (array, kind, pickled side data, tz, mask)."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        ts = pd.DatetimeIndex(values).as_unit("ns")
+        tz = None
+        if ts.tz is not None:
+            tz = str(ts.tz)
+            ts = ts.tz_convert("UTC").tz_localize(None)
+        return ts.asi8, "datetime", None, tz, None
+
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # The dtype carries the categories (unused ones too) and their order
+        return values.cat.codes.to_numpy().astype(np.int32), "categorical", values.dtype, None, None
+
+    if isinstance(values.array, tuple(_MASKED_ARRAYS.values())):
+        numpy_dtype = values.dtype.numpy_dtype
+        array = values.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0))
+        return array, "masked", values.dtype, None, values.isna().to_numpy()
+
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        array = values.to_numpy()
+        if array.dtype.kind in "biuf":
+            return array, "numeric", None, None, None
+
+    codes, categories = pd.factorize(values)
+    return codes.astype(np.int32), "category", np.asarray(categories, dtype=object), None, None
+
+
+def _aligned(nbytes: int) -> int:
+    return -(-nbytes // _ALIGN) * _ALIGN
+
+
+class SharedFrame:
+    """
+    Owner of a published frame.
+
+    Use as a context manager (or call close()) so the block is unlinked once
+    every task reading it has finished.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        arrays = []
+        specs = []
+        offset = 0
+
+        for name in df.columns:
+            array, kind, categories, tz, mask = _column_array(df[name])
+            array = np.ascontiguousarray(array)
+            raw_categories = pickle.dumps(categories, protocol=pickle.HIGHEST_PROTOCOL) if categories is not None else b""
+            mask = np.ascontiguousarray(mask) if mask is not None else np.empty(0, dtype=bool)
+
+            column_offset = offset
+            offset += _aligned(array.nbytes)
+            categories_offset = offset
+            offset += _aligned(len(raw_categories))
+            mask_offset = offset
+            offset += _aligned(mask.nbytes)
+
+            arrays.append((array, column_offset, raw_categories, categories_offset, mask, mask_offset))
+            specs.append(SharedColumn(
+                name=name, kind=kind, dtype=array.dtype.str,
+                offset=column_offset, nbytes=array.nbytes,
+                categories_offset=categories_offset, categories_nbytes=len(raw_categories),
+                tz=tz, mask_offset=mask_offset, mask_nbytes=mask.nbytes
+            ))
+
+        self._block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        buffer = self._block.buf
+        for array, column_offset, raw_categories, categories_offset, mask, mask_offset in arrays:
+            buffer[column_offset:column_offset + array.nbytes] = array.view(np.uint8).reshape(-1)
+            buffer[categories_offset:categories_offset + len(raw_categories)] = raw_categories
+            buffer[mask_offset:mask_offset + mask.nbytes] = mask.view(np.uint8)
+
+        self.index = df.index
+        self.handle = SharedFrameHandle(self._block.name, len(df), tuple(specs))
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the shared block."""
+        return self._block.size
+
+    def close(self) -> None:
+        """Release and unlink the shared block."""
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _open_block(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without handing it to this process's resource tracker."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+
+    # Older Pythons register every attachment on POSIX, and the tracker would
+    # unlink the block (or warn about a leak) when the worker exits
+    block = shared_memory.SharedMemory(name=name)
+    if os.name == "posix":
+        resource_tracker.unregister(block._name, "shared_memory")
+    return block
+
+
+def _frame_from_block(block: shared_memory.SharedMemory, handle: SharedFrameHandle) -> pd.DataFrame:
+    """Read-only DataFrame over an attached block."""
+    buffer = block.buf
+    data = {}
+    for spec in handle.columns:
+        array = np.frombuffer(buffer, dtype=np.dtype(spec.dtype), count=handle.n_rows, offset=spec.offset)
+        array.flags.writeable = False
+
+        if spec.kind == "datetime":
+            column = pd.Series(array.view("datetime64[ns]"), copy=False)
+            if spec.tz is not None:
+                column = column.dt.tz_localize("UTC").dt.tz_convert(spec.tz)
+        elif spec.kind == "category":
+            start = spec.categories_offset
+            categories = pickle.loads(buffer[start:start + spec.categories_nbytes])
+            categories = np.append(categories, None)
+            column = categories[array]  # code -1 (missing) picks the trailing None
+        elif spec.kind == "categorical":
+            start = spec.categories_offset
+            dtype = pickle.loads(buffer[start:start + spec.categories_nbytes])
+            column = pd.Categorical.from_codes(array, dtype=dtype)
+        elif spec.kind == "masked":
+            start = spec.categories_offset
+            dtype = pickle.loads(buffer[start:start + spec.categories_nbytes])
+            mask = np.frombuffer(buffer, dtype=bool, count=handle.n_rows, offset=spec.mask_offset)
+            mask.flags.writeable = False
+            column = _MASKED_ARRAYS[dtype.kind](array, mask)
+        else:
+            column = array
+
+        data[spec.name] = column
+
+    return pd.DataFrame(data, index=pd.RangeIndex(handle.n_rows), copy=False)
+
+
+_pending_release = []
+
+
+@contextmanager
+def attached_frame(handle: SharedFrameHandle) -> Iterator[pd.DataFrame]:
+    """
+    Attach to a published frame for the duration of the block.
+
+    Results derived from the frame must be copied out before the block exits.
+    """
+    block = _open_block(handle.block_name)
+    try:
+        yield _frame_from_block(block, handle)
+    finally:
+        _pending_release.append(block)
+        _release_blocks()
+
+
+def _release_blocks() -> None:
+    """Close attachments whose views are gone; retry the rest next time."""
+    still_exported = []
+    for block in _pending_release:
+        try:
+            block.close()
+        except BufferError:
+            still_exported.append(block)
+    _pending_release[:] = still_exported
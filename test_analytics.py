@@ -12,9 +12,21 @@ import pytest
 import time
 from datetime import datetime, timedelta
 import warnings
+import sys
+from pathlib import Path
 
 # Import our feature implementations
 from features_impl import *
+from ep_table import EPTable, build_ep_table, expected_points, load_ep_table, save_ep_table
+from local_cache import AsyncSingleFlight, L1Cache, SingleFlight, hard_ttl, load_cache_ttl, should_refresh
+from shared_frame import SharedFrame, attached_frame
+
+sys.path.append(str(Path(__file__).parent / 'tools' / 'features'))
+from benchmark_kernels import batted_ball_frame, merge_broadcast_barrel_rate
+from benchmark_runner import BenchmarkRunner, sample_group, shard_features
+from drift_detector import FeatureDriftDetector, StreamingDriftMonitor
+from drift_sketches import FeatureSketch, KLLSketch
+from wire_format import decode_frame, decode_values, encode_frame, encode_values
 
 class TestCardinalBaseball:
     """Test suite for Cardinals baseball analytics."""
@@ -252,6 +264,71 @@ class TestAdvancedMetrics:
         assert result.min() >= -7.0
         assert result.max() <= 7.0
 
+    def test_expected_points_vectorized_parity(self):
+        """Vectorized EP model matches the scalar model on every state."""
+        rng = np.random.default_rng(5)
+        down = rng.choice([1, 2, 3, 4, np.nan], 5000).astype(float)
+        distance = rng.choice([np.nan] + list(range(0, 26)), 5000).astype(float)
+        yard_line = rng.choice([np.nan] + list(range(0, 101)), 5000).astype(float)
+
+        expected = [expected_points(d, dist, yl) for d, dist, yl in zip(down, distance, yard_line)]
+        result = expected_points_vectorized(down, distance, yard_line)
+
+        np.testing.assert_allclose(result, expected)
+
+    def test_expected_points_fractional_distance_parity(self):
+        """Fractional distances and off-field yard lines match the scalar model's branches."""
+        down = np.repeat([1, 2, 3, 4], 9).astype(float)
+        distance = np.tile([0.5, 1.0, 1.5, 1.99, 3.5, 4.0, 6.5, 7.0, 35.5], 4)
+        yard_line = np.tile([-5.0, 0.0, 12.5, 50.0, 99.5, 100.0, 104.0, 37.25, 80.0], 4)
+
+        expected = [expected_points(d, dist, yl) for d, dist, yl in zip(down, distance, yard_line)]
+        np.testing.assert_allclose(expected_points_vectorized(down, distance, yard_line), expected, atol=1e-12)
+        assert expected_points_vectorized([4], [1.5], [50])[0] == pytest.approx(-0.5)
+
+    def test_epa_matches_row_wise_model(self):
+        """calculate_epa agrees with the row-wise scalar EP model."""
+        df = self.football_df.copy()
+        df.loc[::9, 'next_down'] = np.nan
+
+        expected = (df.apply(lambda r: expected_points(r['next_down'], r['next_distance'], r['next_yard_line']), axis=1) -
+                    df.apply(lambda r: expected_points(r['down'], r['distance'], r['yard_line']), axis=1))
+
+        pd.testing.assert_series_equal(calculate_epa(df), expected.clip(-7.0, 7.0))
+
+    def test_ep_table_round_trip(self, tmp_path):
+        """Built table survives the memory-mapped save/load and matches the scalar model."""
+        path = save_ep_table(build_ep_table(), tmp_path / "ep_table_v1.npy")
+        table = load_ep_table(path)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["ep_table_v1.json", "ep_table_v1.npy"]
+        assert isinstance(table.table, np.memmap)
+        assert table.version == 1
+
+        down, distance, yard_line = np.meshgrid([1, 2, 3, 4], np.arange(0, 31), np.arange(0, 101))
+        expected = [expected_points(d, dist, yl)
+                    for d, dist, yl in zip(down.ravel(), distance.ravel(), yard_line.ravel())]
+
+        np.testing.assert_allclose(table.expected_points(down.ravel(), distance.ravel(), yard_line.ravel()),
+                                   expected, atol=1e-12)
+
+    def test_ep_table_rejects_other_versions(self, tmp_path):
+        """Tables built for another version are not silently used."""
+        path = save_ep_table(build_ep_table(), tmp_path / "ep_table_v2.npy", version=2)
+
+        with pytest.raises(ValueError):
+            load_ep_table(path)
+
+    def test_dvoa_expected_yards_from_table(self):
+        """DVOA expected yards from the table match the per-down rates."""
+        df = self.football_df
+        rates = np.select([df['down'] == 1, df['down'] == 2, df['down'] == 3], [0.45, 0.60, 0.85], 1.0)
+        expected_yards = df['distance'] * rates
+        expected = ((df['yards_gained'] - expected_yards) / expected_yards *
+                    (1 + (df['opponent_def_rank'] - 16.5) / 16.5 * 0.2) * 100.0).clip(-100.0, 100.0)
+
+        pd.testing.assert_series_equal(calculate_dvoa(df), expected)
+
     def test_dvoa_calculation(self):
         """Test DVOA calculation."""
         result = calculate_dvoa(self.football_df)
@@ -330,6 +407,98 @@ class TestCrossSportAnalytics:
         assert result.max() <= 100.0
 
 
+class TestRollingWindowEngine:
+    """Test suite for the shared per-entity rolling-window engine."""
+
+    def setup_method(self):
+        """Set up shuffled multi-entity data with gaps and nulls."""
+        rng = np.random.default_rng(7)
+        n = 2000
+        self.df = pd.DataFrame({
+            'player_id': rng.choice(['p1', 'p2', 'p3', 'p4'], n),
+            'ts': pd.Timestamp('2024-04-01') + pd.to_timedelta(rng.integers(0, 120 * 24, n), unit='h'),
+            'game_no': rng.integers(1, 60, n),
+            'value': rng.normal(50, 15, n)
+        }, index=rng.permutation(n) + 500)
+        self.df.loc[self.df.index[::37], 'value'] = np.nan
+
+    def _pandas_rolling(self, order_col, window, agg, min_periods):
+        d = self.df.sort_values(['player_id', order_col], kind='stable')
+        original_index = d.index
+        if order_col == 'ts':
+            d = d.set_index('ts')
+        rolled = getattr(d.groupby('player_id')['value']
+                         .rolling(window, min_periods=min_periods), agg)()
+        return pd.Series(rolled.to_numpy(), index=original_index).reindex(self.df.index)
+
+    def test_time_window_parity(self):
+        """Time windows match pandas groupby().rolling() under any row order."""
+        engine = RollingWindowEngine(self.df, 'player_id', 'ts')
+
+        for window, min_periods in [('30D', 10), ('15D', 3), ('7D', 1)]:
+            for agg in ['mean', 'sum', 'std']:
+                expected = self._pandas_rolling('ts', window, agg, min_periods)
+                result = engine.rolling(self.df['value'], window, agg=agg, min_periods=min_periods)
+
+                assert result.index.equals(self.df.index)
+                np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
+    def test_count_window_parity(self):
+        """Count windows ('7g') match positional pandas rolling per entity."""
+        engine = RollingWindowEngine(self.df, 'player_id', 'game_no')
+
+        expected = self._pandas_rolling('game_no', 7, 'mean', 3)
+        result = engine.rolling(self.df['value'], '7g', agg='mean', min_periods=3)
+
+        np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
+        with pytest.raises(ValueError):
+            engine.rolling(self.df['value'], '30D')
+
+    def test_shared_engine_scope(self):
+        """Engines are reused per frame and key only inside the shared scope."""
+        assert get_window_engine(self.df, 'player_id') is not get_window_engine(self.df, 'player_id')
+
+        with shared_window_engines():
+            engine = get_window_engine(self.df, 'player_id', 'ts')
+            assert get_window_engine(self.df, 'player_id', 'ts') is engine
+            assert get_window_engine(self.df, 'player_id', 'game_no') is not engine
+
+        assert get_window_engine(self.df, 'player_id', 'ts') is not engine
+
+    def test_game_rollup_matches_groupby(self):
+        """Aggregate per game -> roll -> scatter matches groupby + rolling + join."""
+        games = GameRollup(self.df, 'player_id', 'game_no')
+
+        per_game = self.df.groupby(['player_id', 'game_no'])['value'].mean()
+        rolled = (per_game.groupby(level='player_id').rolling(5, min_periods=2).mean()
+                  .reset_index(level=0, drop=True))
+        keys = pd.MultiIndex.from_frame(self.df[['player_id', 'game_no']])
+        expected = pd.Series(rolled.reindex(keys).to_numpy(), index=self.df.index)
+
+        result = games.scatter(games.rolling(games.aggregate(self.df['value'], 'mean'),
+                                             '5g', agg='mean', min_periods=2))
+
+        assert result.index.equals(self.df.index)
+        np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
+        sums = games.scatter(games.aggregate(self.df['value'], 'sum'))
+        expected_sums = self.df.groupby(['player_id', 'game_no'])['value'].transform('sum')
+        np.testing.assert_allclose(sums, expected_sums, rtol=1e-9)
+
+    def test_game_rollup_missing_keys(self):
+        """Rows with a missing entity or game get NaN instead of another row's value."""
+        df = self.df.copy()
+        df.loc[df.index[:3], 'player_id'] = None
+        df.loc[df.index[3:6], 'game_no'] = np.nan
+
+        games = GameRollup(df, 'player_id', 'game_no')
+        result = games.scatter(games.aggregate(df['value'].fillna(1.0), 'count'))
+
+        assert result.iloc[:6].isna().all()
+        assert result.iloc[6:].notna().all()
+
+
 class TestPerformanceOptimization:
     """Test suite for performance and optimization features."""
 
@@ -403,6 +572,186 @@ class TestPerformanceOptimization:
             # Expected for some feature dependencies
             print(f"Incremental update test note: {str(e)}")
 
+    def _event_stream(self, n=3000):
+        rng = np.random.default_rng(21)
+        df = pd.DataFrame({
+            'batter_id': rng.choice(['b1', 'b2', 'b3'], n),
+            'pitcher_id': rng.choice(['p1', 'p2'], n),
+            'team_id': 'STL',
+            'player_id': rng.choice(['pl1', 'pl2'], n),
+            'ts': pd.Timestamp('2024-04-01') + pd.to_timedelta(
+                np.sort(rng.integers(0, 60 * 24 * 60, n)), unit='min'),
+            'game_no': np.arange(n) // 40,
+            'exit_velocity': rng.normal(88, 8, n),
+            'launch_angle': rng.normal(12, 15, n),
+            'swing': rng.random(n) < 0.45,
+            'whiff': rng.random(n) < 0.2,
+            'sz_bot': rng.normal(1.8, 0.2, n),
+            'plate_z': rng.normal(2.5, 1.0, n),
+            'location_score': rng.random(n),
+            'called_strike_rate': rng.random(n),
+            'pitches': rng.integers(1, 30, n),
+            'role': rng.choice(['RP', 'SP'], n),
+            'back_to_back': rng.random(n) < 0.2,
+            'velocity': rng.normal(93, 2, n),
+            'spin_rate': rng.normal(2300, 200, n),
+            'movement': rng.normal(10, 3, n),
+            'minutes_played': rng.uniform(10, 40, n),
+            'distance_covered': rng.uniform(1000, 5000, n),
+            'accelerations': rng.uniform(20, 100, n)
+        })
+        df.loc[df.index[::50], 'exit_velocity'] = np.nan
+        return df
+
+    def test_window_state_store_matches_batch(self, tmp_path):
+        """Streaming window state gives the same values as a batch recompute."""
+        df = self._event_stream()
+        features = sorted(STREAMING_FEATURES)
+        batch = pd.DataFrame({name: FEATURE_IMPLEMENTATIONS[name](df) for name in features})
+
+        store = WindowStateStore()
+        chunks = [df.iloc[i:i + 97] for i in range(0, len(df), 97)]
+        split = len(chunks) // 2
+
+        streamed = [store.update_many(features, chunk) for chunk in chunks[:split]]
+
+        # Persist mid-stream and continue from the restored state
+        store.save(tmp_path / 'window_state.pkl')
+        store = WindowStateStore.load(tmp_path / 'window_state.pkl')
+        streamed += [incremental_update(pd.DataFrame(), chunk, features, state_store=store)
+                     for chunk in chunks[split:]]
+
+        pd.testing.assert_frame_equal(pd.concat(streamed), batch, rtol=1e-9, atol=1e-9)
+
+    def test_window_state_store_contract(self):
+        """Unsupported features and out-of-order events are rejected."""
+        df = self._event_stream(200)
+        store = WindowStateStore()
+
+        with pytest.raises(ValueError):
+            store.update('pitch_tunneling_score', df)
+
+        store.update('cardinals_pitcher_whiff_rate_15d', df.iloc[100:])
+        with pytest.raises(ValueError):
+            store.update('cardinals_pitcher_whiff_rate_15d', df.iloc[:100])
+
+    def test_streaming_windows_are_keyed_by_name(self):
+        """Window state follows the window's name, not the order or engine it was called from."""
+        from features_impl import RollingWindowEngine, StreamingWindowEngine
+
+        df = self._event_stream(300)
+        states = {}
+        engines = [StreamingWindowEngine(states, df, 'pitcher_id', 'ts', 'whiff_rate') for _ in range(2)]
+
+        with pytest.raises(ValueError):
+            engines[0].rolling(df['swing'], '15D', agg='sum')
+
+        engines[0].rolling(df['swing'], '15D', agg='sum', name='swings')
+        whiffs = engines[1].rolling(df['whiff'], '15D', agg='sum', name='whiffs')
+
+        expected = RollingWindowEngine(df, 'pitcher_id', 'ts').rolling(df['whiff'], '15D', agg='sum')
+        pd.testing.assert_series_equal(whiffs, expected)
+        assert {call[:2] for call, _ in states} == {('whiff_rate', 'swings'), ('whiff_rate', 'whiffs')}
+
+    def test_window_state_store_rejects_batches_atomically(self):
+        """A batch with one late event leaves every entity's state untouched, so a retry does not double count."""
+        import pickle
+
+        name = 'cardinals_pitcher_whiff_rate_15d'
+        df = self._event_stream(300)
+        store, reference = WindowStateStore(), WindowStateStore()
+        store.update(name, df.iloc[:200])
+        reference.update(name, df.iloc[:200])
+        before = pickle.dumps(store.states)
+
+        # The late event belongs to the pitcher sorted last, after the first one's events were pushed
+        late = df.iloc[100:200][df['pitcher_id'].iloc[100:200] != df['pitcher_id'].iloc[200]].iloc[[0]]
+        with pytest.raises(ValueError):
+            store.update(name, pd.concat([df.iloc[200:], late]))
+        assert pickle.dumps(store.states) == before
+
+        pd.testing.assert_series_equal(store.update(name, df.iloc[200:]), reference.update(name, df.iloc[200:]))
+
+        # Expired events are evicted: only the last 15 days stay buffered per pitcher
+        for (_, entity), state in store.states['cardinals_pitcher_whiff_rate_15d'].items():
+            assert state.keys[-1] - state.keys[0] < pd.Timedelta('15D').value
+
+    def _fused_frame(self, n=3000):
+        rng = np.random.default_rng(11)
+        return pd.DataFrame({
+            'batter_id': rng.choice(['b1', 'b2', 'b3', 'b4'], n),
+            'pitcher_id': rng.choice(['p1', 'p2', 'p3'], n),
+            'ts': pd.Timestamp('2024-04-01') + pd.to_timedelta(rng.integers(0, 90 * 24, n), unit='h'),
+            'xwoba': rng.uniform(0.2, 0.5, n),
+            'swing': rng.choice([True, False], n),
+            'whiff': rng.choice([True, False], n, p=[0.25, 0.75]),
+            'sz_bot': rng.normal(1.8, 0.2, n),
+            'plate_z': rng.normal(2.5, 1.0, n),
+            'edge_pct': rng.uniform(0, 1, n),
+            'zone_pct': rng.uniform(0, 1, n),
+            'chase_pct': rng.uniform(0, 1, n),
+            'bb_pct': rng.uniform(0, 0.2, n)
+        }, index=rng.permutation(n))
+
+    def test_feature_execution_plan(self):
+        """Features sharing an entity key and sort order are fused into one group."""
+        plan = plan_feature_execution([
+            'cardinals_batter_xwoba_30d',
+            'cardinals_pitcher_whiff_rate_15d',
+            'cardinals_batter_chase_rate_below_zone_30d',
+            'titans_qb_pressure_to_sack_rate_adj_4g',
+            'longhorns_qb_passing_efficiency_rating_3g',
+            'cardinals_pitcher_command_plus_30d',
+            'cardinals_batter_xwoba_30d'
+        ])
+
+        layouts = [(g.by, g.order_col, g.features) for g in plan]
+        assert layouts == [
+            (('batter_id',), 'ts', ['cardinals_batter_xwoba_30d',
+                                    'cardinals_batter_chase_rate_below_zone_30d']),
+            (('pitcher_id',), 'ts', ['cardinals_pitcher_whiff_rate_15d',
+                                     'cardinals_pitcher_command_plus_30d']),
+            (('qb_id',), 'game_no', ['titans_qb_pressure_to_sack_rate_adj_4g',
+                                     'longhorns_qb_passing_efficiency_rating_3g'])
+        ]
+
+    def test_fused_execution_matches_per_feature(self, monkeypatch):
+        """Fused groups sort once per layout and match per-feature results."""
+        df = self._fused_frame()
+        features = [
+            'cardinals_batter_xwoba_30d',
+            'cardinals_pitcher_whiff_rate_15d',
+            'cardinals_batter_chase_rate_below_zone_30d',
+            'cardinals_pitcher_command_plus_30d'
+        ]
+
+        expected = {name: FEATURE_IMPLEMENTATIONS[name](df) for name in features}
+
+        built = []
+        engine_cls = RollingWindowEngine
+
+        class CountingEngine(engine_cls):
+            def __init__(self, *args, **kwargs):
+                built.append(args[1:])
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr('features_impl.RollingWindowEngine', CountingEngine)
+
+        result = parallel_feature_computation(df, features, n_jobs=1)
+
+        assert list(result.columns) == features
+        assert result.index.equals(df.index)
+        assert len(built) == 2
+        for name in features:
+            pd.testing.assert_series_equal(result[name], expected[name], check_names=False)
+
+    def test_game_rollup_matches_merge_broadcast(self):
+        """Per-game scatter matches groupby + rolling + merge (timed in benchmark_kernels.py)."""
+        df = batted_ball_frame(50_000)
+
+        np.testing.assert_allclose(cardinals_batter_barrel_rate_7g(df), merge_broadcast_barrel_rate(df),
+                                   rtol=1e-9, atol=1e-9)
+
     def test_memory_efficiency(self):
         """Test memory efficiency with large datasets."""
         n_rows = 100000
@@ -474,6 +823,29 @@ class TestStatcastProcessing:
         assert result.min() >= 0.0
         assert result.max() <= 100.0
 
+    def test_pitch_tunneling_matches_pairwise_loop(self):
+        """Vectorized tunneling scores match the per-pair reference loop."""
+        df = self.df.sample(frac=1.0, random_state=3)
+        df.loc[df.index[:5], 'pfx_x'] = np.nan
+        df = pd.concat([df, df.iloc[:1].assign(pitcher_id='pitcher_solo')])
+        df.index = np.arange(len(df))[::-1]
+
+        expected = pd.Series(50.0, index=df.index)
+        for _, group in df.sort_values(['pitcher_id', 'ts'], kind='stable').groupby('pitcher_id'):
+            rows = group.to_dict('records')
+            for k in range(len(rows) if len(rows) >= 2 else 0):
+                a, b = rows[k // 2], rows[k // 2 + 1]
+                release_diff = np.sqrt(sum((a[c] - b[c]) ** 2 for c in ['release_x', 'release_y', 'release_z']))
+                movement_diff = np.sqrt((a['pfx_x'] - b['pfx_x']) ** 2 + (a['pfx_z'] - b['pfx_z']) ** 2)
+                velo_diff = abs(a['start_speed'] - b['start_speed'])
+                expected[group.index[k]] = ((1 - min(release_diff / 0.5, 1)) * 40 +
+                                            min(movement_diff / 2.0, 1) * 40 +
+                                            (1 - min(velo_diff / 10.0, 1)) * 20)
+
+        result = pitch_tunneling_score(df)
+
+        np.testing.assert_allclose(result, expected.fillna(50.0).clip(0.0, 100.0))
+
     def test_pitch_sequencing(self):
         """Test pitch sequencing effectiveness."""
         # Add required columns for sequencing
@@ -487,6 +859,1387 @@ class TestStatcastProcessing:
         assert result.max() <= 100.0
 
 
+def _wide_feature_frame(n=600, seed=5):
+    """One shuffled, non-default-indexed frame carrying every registered feature's inputs."""
+    rng = np.random.default_rng(seed)
+    ids = lambda prefix, k: rng.choice([f'{prefix}_{i}' for i in range(k)], n)
+    flags = lambda p: rng.random(n) < p
+
+    df = pd.DataFrame({
+        'batter_id': ids('b', 6), 'pitcher_id': ids('p', 5), 'team_id': ids('t', 2),
+        'qb_id': ids('qb', 3), 'rb_id': ids('rb', 3), 'oline_unit_id': ids('ol', 2),
+        'offense_team': ids('off', 3), 'player_id': ids('pl', 6), 'lineup_id': ids('lu', 3),
+        'athlete_id': ids('a', 4), 'sport': ids('s', 3), 'position': ids('pos', 4),
+        'game_no': rng.integers(1, 25, n), 'drive_id': rng.integers(1, 12, n),
+        'ts': pd.Timestamp('2024-04-01') + pd.to_timedelta(rng.integers(0, 60 * 24, n), unit='h'),
+        'role': rng.choice(['RP', 'SP'], n), 'tto': rng.integers(1, 4, n),
+        'pitch_type': rng.choice(['FB', 'CB', 'SL', 'CH'], n),
+        'count': rng.choice(['0-0', '0-2', '3-1'], n),
+        'result': rng.choice(['strike', 'ball', 'foul', 'hit'], n),
+        'play_type': rng.choice(['run', 'pass'], n),
+        'down': rng.integers(1, 5, n), 'next_down': rng.integers(1, 5, n),
+        'distance': rng.integers(1, 15, n), 'next_distance': rng.integers(1, 15, n),
+        'yard_line': rng.integers(1, 99, n), 'next_yard_line': rng.integers(1, 99, n),
+        'swing': flags(0.45), 'whiff': flags(0.25), 'back_to_back': flags(0.2),
+        'pressure': flags(0.3), 'sack': flags(0.1), 'pass_block_win': flags(0.6),
+        'clutch_situation': flags(0.3), 'fg_made': flags(0.45), 'is_breakaway': flags(0.1)
+    }, index=rng.permutation(n) * 3 + 7)
+
+    numeric = [
+        'exit_velocity', 'launch_angle', 'sz_bot', 'plate_z', 'pitches', 'xwoba',
+        'edge_pct', 'zone_pct', 'chase_pct', 'bb_pct', 'location_score', 'called_strike_rate',
+        'leverage_index', 'win_probability_added', 'sprint_speed', 'woba_value', 'velocity',
+        'spin_rate', 'movement', 'opp_pass_block_win_rate', 'expected_points_added',
+        'rushing_yards', 'yards_before_contact', 'start_yardline', 'expected_start',
+        'return_yards', 'penalty_yards', 'def_possessions', 'points_allowed', 'charges_drawn',
+        'contested_shots', 'deflections', 'hustle_plays', 'off_rating', 'def_rating',
+        'shot_value', 'minutes_played', 'distance_covered', 'accelerations', 'completions',
+        'attempts', 'yards', 'touchdowns', 'interceptions', 'all_purpose_yards',
+        'social_followers', 'media_mentions', 'game_impact_score', 'bb', 'hbp', 'single',
+        'double', 'triple', 'hr', 'ab', 'sf', 'k', 'ip', 'fly_balls', 'yards_gained',
+        'opponent_def_rank', 'performance_score', 'games_played', 'skill_diversity',
+        'performance_metric', 'acute_workload', 'chronic_workload', 'biomechanical_stress',
+        'previous_injuries', 'age', 'performance_percentile', 'ceiling_projection',
+        'floor_projection', 'injury_risk', 'release_x', 'release_y', 'release_z',
+        'pfx_x', 'pfx_z', 'start_speed', 'play_result'
+    ]
+    extra = pd.DataFrame(rng.uniform(1, 20, (n, len(numeric))), columns=numeric, index=df.index)
+    return pd.concat([df, extra], axis=1)
+
+
+class TestFeatureInputContract:
+    """Feature kernels read the caller's frame without copying or mutating it."""
+
+    @pytest.mark.parametrize('feature_name', sorted(FEATURE_IMPLEMENTATIONS))
+    def test_input_frame_not_mutated_or_copied(self, feature_name, monkeypatch):
+        """Each kernel leaves the input untouched and never copies the whole frame."""
+        df = _wide_feature_frame()
+        snapshot = df.copy(deep=True)
+        columns = df.columns
+
+        copied = []
+        frame_copy = pd.DataFrame.copy
+
+        def spy_copy(self, *args, **kwargs):
+            if self is df:
+                copied.append(feature_name)
+            return frame_copy(self, *args, **kwargs)
+
+        monkeypatch.setattr(pd.DataFrame, 'copy', spy_copy)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            result = FEATURE_IMPLEMENTATIONS[feature_name](df)
+
+        assert not copied, f"{feature_name} copied its input frame"
+        assert df.columns is columns
+        pd.testing.assert_frame_equal(df, snapshot)
+        assert result.index.equals(df.index)
+
+    @pytest.mark.parametrize('feature_name', [
+        'cardinals_batter_barrel_rate_7g',
+        'titans_qb_pressure_to_sack_rate_adj_4g',
+        'titans_hidden_yardage_per_drive_5g',
+        'grizzlies_lineup_net_rating_5g',
+        'cardinals_pitcher_tto_penalty_delta_2to3',
+        'longhorns_rb_breakaway_run_rate_5g'
+    ])
+    def test_results_follow_input_rows(self, feature_name):
+        """Values stay attached to their rows regardless of input row order."""
+        df = _wide_feature_frame()
+        ordered = df.sort_index()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            shuffled_result = FEATURE_IMPLEMENTATIONS[feature_name](df)
+            ordered_result = FEATURE_IMPLEMENTATIONS[feature_name](ordered)
+
+        pd.testing.assert_series_equal(shuffled_result.sort_index(), ordered_result,
+                                       check_names=False)
+
+
+class TestWireFormat:
+    """Test suite for the columnar request/response wire format."""
+
+    def test_frame_round_trip(self):
+        """Typed columns survive encoding; numeric columns decode as views."""
+        n = 500
+        df = pd.DataFrame({
+            'batter_id': np.random.randint(1, 50, n),
+            'team_id': np.random.choice(['STL', 'CHC'], n).astype(object),
+            'ts': pd.date_range('2024-04-01', periods=n, freq='h'),
+            'ts_local': pd.date_range('2024-04-01', periods=n, freq='h', tz='US/Central'),
+            'exit_velocity': np.random.normal(89, 8, n),
+            'swing': np.random.choice([True, False], n)
+        })
+        df.loc[3, 'team_id'] = None
+
+        payload = encode_frame(df)
+        decoded = decode_frame(payload)
+
+        pd.testing.assert_frame_equal(decoded, df)
+        assert not decoded['exit_velocity'].to_numpy().flags.writeable
+
+        with pytest.raises(ValueError):
+            decode_frame(b'JUNK' + payload[4:])
+
+    def test_object_columns_keep_value_types(self):
+        """Object bool/int/float columns with missing values decode to the same values, not strings."""
+        df = pd.DataFrame({
+            'swing': pd.Series([True, None, False, True], dtype=object),
+            'pitcher_id': pd.Series([12, None, 7, 12], dtype=object),
+            'velocity': pd.Series([91.5, 88, None, 91.5], dtype=object),
+            'team_id': pd.Series(['STL', None, 'CHC', 'STL'], dtype=object)
+        })
+
+        decoded = decode_frame(encode_frame(df))
+
+        pd.testing.assert_frame_equal(decoded, df)
+        assert decoded['swing'].tolist() == [True, None, False, True]
+        assert decoded['swing'].astype(bool).tolist() == [True, False, False, True]
+        assert decoded['pitcher_id'].tolist() == [12, None, 7, 12]
+
+    def test_values_are_float32_buffers(self):
+        """Feature results encode to raw float32 bytes."""
+        values = np.random.normal(0, 1, 1000)
+        payload = encode_values(values)
+
+        assert len(payload) == 4 * len(values)
+        np.testing.assert_array_equal(decode_values(payload), values.astype(np.float32))
+
+
+class _DictRedis(dict):
+    """In-memory stand-in for the few Redis calls the feature cache makes."""
+
+    def setex(self, key, ttl, value):
+        self[key] = value
+
+    def keys(self, pattern='*'):
+        from fnmatch import fnmatchcase
+        return [key for key in list(self) if fnmatchcase(key, pattern)]
+
+    def scan_iter(self, match='*', count=None):
+        return iter(type(self).keys(self, match))
+
+    def zadd(self, key, mapping):
+        dict.setdefault(self, key, {}).update(mapping)
+
+    def zremrangebyscore(self, key, low, high):
+        members = dict.get(self, key, {})
+        expired = [m for m, score in members.items() if float(low) <= score <= float(high)]
+        for member in expired:
+            del members[member]
+        return len(expired)
+
+    def zrange(self, key, start, end):
+        members = dict.get(self, key, {})
+        return [m.encode() for m in sorted(members, key=members.get)]
+
+    def expire(self, key, ttl):
+        return key in self
+
+    def rpush(self, key, *values):
+        dict.setdefault(self, key, []).extend(values)
+        return len(self[key])
+
+    def ltrim(self, key, start, end):
+        items = dict.get(self, key, [])
+        self[key] = items[start:len(items) + end + 1 if end < 0 else end + 1]
+
+    def lrange(self, key, start, end):
+        items = dict.get(self, key, [])
+        return items[start:len(items) + end + 1 if end < 0 else end + 1]
+
+    def delete(self, *keys):
+        return sum(self.pop(key, None) is not None for key in keys)
+
+    def mget(self, keys):
+        return [dict.get(self, key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return _DictRedisPipeline(self)
+
+    def close(self):
+        pass
+
+
+class _DictRedisPipeline:
+    """Queues commands and replays them against a _DictRedis on execute()."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    def execute(self):
+        # Prefer the class methods so per-command spies on the client only see direct calls
+        results = [
+            getattr(type(self.client), name)(self.client, *args) if hasattr(type(self.client), name)
+            else getattr(self.client, name)(*args)
+            for name, args in self.commands
+        ]
+        self.commands = []
+        return results
+
+
+def _offline_pipeline(**kwargs):
+    """RealTimeFeaturePipeline backed by an in-memory Redis stand-in."""
+    from realtime_pipeline import RealTimeFeaturePipeline
+
+    pipeline = RealTimeFeaturePipeline(**kwargs)
+    pipeline.redis_client = _DictRedis()
+    pipeline.cache.redis_client = pipeline.redis_client
+    return pipeline
+
+
+class TestFeatureCacheKeys:
+    """Test suite for content-addressed feature cache keys."""
+
+    def test_content_hash(self):
+        """Hashes depend on column names, dtypes, shapes and values, not dict order."""
+        from realtime_pipeline import FeatureCache
+
+        data = {'batter_id': [1, 2, 3], 'team_id': ['STL', 'STL', None], 'ev': [88.0, 91.5, 79.2]}
+
+        base = FeatureCache.content_hash(data)
+        assert base == FeatureCache.content_hash(dict(reversed(list(data.items()))))
+        assert base != FeatureCache.content_hash({**data, 'ev': [88.0, 91.5, 79.3]})
+        assert base != FeatureCache.content_hash({**data, 'batter_id': [1.0, 2.0, 3.0]})
+        assert base != FeatureCache.content_hash({**data, 'team_id': ['STL', 'STL', 'CHC']})
+        assert FeatureCache.content_hash(encode_frame(data)) == FeatureCache.content_hash(encode_frame(data))
+
+        # Same bytes, different layout
+        flat = np.arange(4)
+        assert FeatureCache.content_hash({'x': flat}) != FeatureCache.content_hash({'x': flat.reshape(2, 2)})
+        assert (FeatureCache.content_hash({'a': flat[:0], 'b': flat[:1]}) !=
+                FeatureCache.content_hash({'a': flat[:1], 'b': flat[:0]}))
+
+    def test_pipeline_hashes_once_and_honours_caller_keys(self, monkeypatch):
+        """A request is hashed once for get + set; caller keys skip hashing entirely."""
+        import realtime_pipeline
+        from realtime_pipeline import FeatureCache
+
+        pipeline = _offline_pipeline()
+
+        calls = []
+        content_hash = FeatureCache.content_hash
+        monkeypatch.setattr(FeatureCache, 'content_hash',
+                            staticmethod(lambda data: calls.append(1) or content_hash(data)))
+
+        data = realtime_pipeline.create_sample_data('baseball', 'STL', 50)
+        first = pipeline.compute_feature_sync('cardinals_batter_xwoba_30d', data)
+        second = pipeline.compute_feature_sync('cardinals_batter_xwoba_30d', data)
+
+        assert len(calls) == 2
+        assert not first.cache_hit and second.cache_hit
+
+        streamed = pipeline.compute_feature_sync('cardinals_batter_xwoba_30d', data,
+                                                 cache_key=('game_7', 'evt_120'))
+        assert len(calls) == 2
+        assert 'feature:cardinals_batter_xwoba_30d:game_7:evt_120' in pipeline.redis_client
+        np.testing.assert_array_equal(streamed.values, first.values)
+
+
+    def test_unhashable_input_fails_only_its_request(self):
+        """Ragged or dict columns return an error response instead of aborting the batch."""
+        import asyncio
+        import realtime_pipeline
+        from realtime_pipeline import FeatureRequest
+
+        pipeline = _offline_pipeline()
+        name = 'cardinals_batter_xwoba_30d'
+        data = realtime_pipeline.create_sample_data('baseball', 'STL', 50)
+
+        requests = [
+            FeatureRequest(name, {'batter_id': [[1, 2], [3]]}, 'ragged', datetime.now()),
+            FeatureRequest(name, data, 'good', datetime.now()),
+            FeatureRequest(name, {'batter_id': {'a': 1}}, 'mapping', datetime.now())
+        ]
+        ragged, good, mapping = asyncio.run(pipeline.compute_features_batch(requests))
+
+        assert ragged.error.startswith('Invalid input') and mapping.error.startswith('Invalid input')
+        assert good.error is None and len(good.values) == 50
+
+        single = pipeline.compute_feature_sync(name, {'batter_id': [[1, 2], [3]]})
+        assert single.error.startswith('Invalid input')
+
+
+class TestL1Cache:
+    """Test suite for the in-process cache tier."""
+
+    def test_byte_budget_lru_eviction(self):
+        """Least recently used entries are evicted once the byte budget is exceeded."""
+        cache = L1Cache(max_bytes=100)
+        cache.set('a', b'x' * 40)
+        cache.set('b', b'x' * 40)
+        assert cache.get('a') is not None  # 'b' is now least recently used
+
+        cache.set('c', b'x' * 40)
+        assert 'b' not in cache and 'a' in cache and 'c' in cache
+        assert cache.nbytes == 80
+
+        assert not cache.set('huge', b'x' * 101)
+        assert cache.stats()['evictions'] == 1
+        assert cache.get('b') is None
+        assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+    def test_ttl_and_invalidation(self, monkeypatch):
+        """Entries expire after their TTL and can be dropped by key pattern."""
+        import local_cache
+
+        now = [1000.0]
+        monkeypatch.setattr(local_cache.time, 'monotonic', lambda: now[0])
+
+        cache = L1Cache(max_bytes=1_000)
+        cache.set('feature:xwoba:1', b'abcd', ttl=30)
+        cache.set('feature:whiff:1', b'abcd', ttl=300)
+        cache.set('feature:whiff:2', b'abcd', ttl=300)
+
+        now[0] += 31
+        assert cache.get('feature:xwoba:1') is None
+        assert cache.stats()['expirations'] == 1
+
+        assert cache.invalidate('feature:whiff:*') == 2
+        assert len(cache) == 0 and cache.nbytes == 0
+
+    def test_ttl_tiers_follow_config(self, tmp_path):
+        """TTL tiers come from redis.cache_ttl, with defaults for missing tiers."""
+        assert load_cache_ttl()['live_games'] == 30
+
+        config = tmp_path / 'analytics_config.yaml'
+        config.write_text("redis:\n  cache_ttl:\n    features: 120\n")
+        tiers = load_cache_ttl(config)
+        assert tiers['features'] == 120 and tiers['metadata'] == 3600
+
+    def test_pipeline_serves_repeat_requests_from_l1(self):
+        """Repeat requests skip Redis; invalidate_cache clears both tiers; counters reach get_metrics()."""
+        import realtime_pipeline
+
+        pipeline = _offline_pipeline()
+        data = realtime_pipeline.create_sample_data('baseball', 'STL', 50)
+
+        first = pipeline.compute_feature_sync('cardinals_batter_xwoba_30d', data)
+        redis_gets = []
+        pipeline.redis_client.get = lambda key: redis_gets.append(key)
+        second = pipeline.compute_feature_sync('cardinals_batter_xwoba_30d', data)
+
+        assert second.cache_hit and not redis_gets
+        np.testing.assert_array_equal(second.values, first.values)
+
+        stats = pipeline.get_metrics()['l1_cache']
+        assert stats['hits'] == 1 and stats['misses'] == 1 and stats['entries'] == 1
+
+        pipeline.invalidate_cache('cardinals_batter_xwoba_30d')
+        assert pipeline.get_metrics()['l1_cache']['entries'] == 0
+        assert not pipeline.redis_client
+
+    def test_invalidations_reach_other_workers_within_l1_ttl(self, monkeypatch):
+        """Another process's L1 copy outlives an invalidation by at most l1_ttl_seconds."""
+        import local_cache
+        from realtime_pipeline import FeatureCache
+
+        now = [1000.0]
+        monkeypatch.setattr(local_cache.time, 'monotonic', lambda: now[0])
+
+        client = _DictRedis()
+        worker, other = (FeatureCache(client, ttl_seconds=300, stale_ttl_seconds=600, l1_ttl_seconds=10)
+                         for _ in range(2))
+        key = worker.make_key('cardinals_batter_xwoba_30d', ('g1', 7))
+        worker.set('cardinals_batter_xwoba_30d', None, np.array([0.3, 0.4]), key=key, game_id='g1')
+        assert other.lookup(key) is not None
+
+        worker.invalidate_index('game', 'g1')
+        assert worker.lookup(key) is None and other.lookup(key) is not None
+
+        now[0] += 11
+        assert other.lookup(key) is None
+
+
+class TestBatchedRedisAccess:
+    """Test suite for batch-level Redis round trips."""
+
+    @staticmethod
+    def _count_round_trips(client, monkeypatch):
+        """Patch the fake Redis so every network round trip is recorded by command."""
+        trips = []
+        for name in ('get', 'setex', 'mget'):
+            method = getattr(client, name)
+            monkeypatch.setattr(client, name, lambda *a, _m=method, _n=name: trips.append(_n) or _m(*a),
+                                raising=False)
+        pipeline = client.pipeline
+
+        def counted_pipeline(transaction=True):
+            pipe = pipeline(transaction)
+            execute = pipe.execute
+            pipe.execute = lambda: trips.append('pipeline') or execute()
+            return pipe
+
+        monkeypatch.setattr(client, 'pipeline', counted_pipeline, raising=False)
+        return trips
+
+    def test_batch_uses_one_mget_and_one_setex_flush(self, monkeypatch):
+        """A multi-feature batch makes two Redis round trips, and cached batches one."""
+        import asyncio
+        import realtime_pipeline
+        from realtime_pipeline import FeatureRequest
+
+        pipeline = _offline_pipeline(l1_max_bytes=0)
+        trips = self._count_round_trips(pipeline.redis_client, monkeypatch)
+
+        data = realtime_pipeline.create_sample_data('baseball', 'STL', 50)
+        features = ['cardinals_batter_xwoba_30d', 'cardinals_pitcher_whiff_rate_15d',
+                    'cardinals_batter_barrel_rate_7g', 'nonexistent_feature']
+
+        def batch():
+            requests = [FeatureRequest(name, data, f"req_{name}", datetime.now()) for name in features]
+            return asyncio.run(pipeline.compute_features_batch(requests))
+
+        first = batch()
+        assert trips == ['mget', 'pipeline']
+        assert [r.error is None for r in first] == [True, True, True, False]
+        assert sum(key.startswith('feature:') for key in pipeline.redis_client) == 3
+
+        trips.clear()
+        second = batch()
+        assert trips == ['mget']
+        assert [r.cache_hit for r in second] == [True, True, True, False]
+        for a, b in zip(first[:3], second[:3]):
+            np.testing.assert_array_equal(a.values, b.values)
+
+    def test_stream_results_and_acks_flush_together(self, monkeypatch):
+        """One read's result writes and XACKs go out in a single pipelined flush."""
+        import asyncio
+        from realtime_pipeline import FeatureStreamProcessor
+
+        pipeline = _offline_pipeline()
+        client = pipeline.redis_client
+        trips = self._count_round_trips(client, monkeypatch)
+        processor = FeatureStreamProcessor(pipeline)
+
+        acks = []
+        client.xgroup_create = lambda *a, **k: None
+        client.xack = lambda stream, group, *ids: acks.append(ids)
+
+        def xreadgroup(*args, **kwargs):
+            processor.stop()
+            return [(b'sports_events', [(f'1-{i}'.encode(), {b'sport': b'hockey', b'team': b'NSH'})
+                                        for i in range(3)])]
+
+        client.xreadgroup = xreadgroup
+        asyncio.run(processor.process_stream())
+
+        assert acks == [(b'1-0', b'1-1', b'1-2')]
+        assert trips == ['pipeline']
+
+
+class TestRequestCoalescing:
+    """Test suite for single-flight deduplication of concurrent computations."""
+
+    def test_single_flight_shares_results_and_errors(self):
+        """Callers arriving mid-flight get the leader's result or exception."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def slow(value):
+            calls.append(value)
+            release.wait(2)
+            if value == 'boom':
+                raise RuntimeError('feature failed')
+            return value
+
+        with ThreadPoolExecutor(4) as pool:
+            futures = [pool.submit(flight.do, 'key', lambda: slow('ok')) for _ in range(4)]
+            while len(calls) < 1:
+                time.sleep(0.001)
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert calls == ['ok']
+        assert sorted(leader for _, leader in results) == [False, False, False, True]
+        assert all(value == 'ok' for value, _ in results) and len(flight) == 0
+
+        release.clear()
+        with ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(flight.do, 'key', lambda: slow('boom')) for _ in range(2)]
+            time.sleep(0.05)
+            release.set()
+            for f in futures:
+                with pytest.raises(RuntimeError):
+                    f.result()
+
+    def test_async_single_flight_survives_waiter_cancellation(self):
+        """Coroutines share one task; cancelling a waiter leaves the others unaffected."""
+        import asyncio
+
+        async def scenario():
+            flight = AsyncSingleFlight()
+            calls = []
+
+            async def compute():
+                calls.append(1)
+                await asyncio.sleep(0.05)
+                return {'features': {'xwoba': 0.41}}
+
+            waiters = [asyncio.ensure_future(flight.do('game_7', compute)) for _ in range(5)]
+            await asyncio.sleep(0)
+            waiters[0].cancel()
+            done = await asyncio.gather(*waiters[1:])
+            return calls, done, len(flight)
+
+        calls, done, in_flight = asyncio.run(scenario())
+        assert len(calls) == 1 and in_flight == 0
+        assert all(result == {'features': {'xwoba': 0.41}} for result, _ in done)
+
+    def test_pipeline_coalesces_concurrent_misses(self, monkeypatch):
+        """Concurrent identical requests compute once and each gets its own response."""
+        import threading
+        import realtime_pipeline
+        from concurrent.futures import ThreadPoolExecutor
+
+        pipeline = _offline_pipeline()
+        data = realtime_pipeline.create_sample_data('baseball', 'STL', 50)
+
+        import execution_backends
+
+        calls = []
+        compute = execution_backends.compute_feature
+
+        def slow_compute(name, df):
+            calls.append(name)
+            time.sleep(0.2)
+            return compute(name, df)
+
+        monkeypatch.setattr(execution_backends, 'compute_feature', slow_compute)
+
+        barrier = threading.Barrier(6)
+
+        def request(i):
+            barrier.wait()
+            return pipeline.compute_feature_sync('cardinals_batter_xwoba_30d', data, request_id=f"client_{i}")
+
+        with ThreadPoolExecutor(6) as pool:
+            responses = list(pool.map(request, range(6)))
+
+        assert len(calls) == 1
+        assert [r.request_id for r in responses] == [f"client_{i}" for i in range(6)]
+        for response in responses[1:]:
+            np.testing.assert_array_equal(response.values, responses[0].values)
+
+        metrics = pipeline.get_metrics()
+        assert metrics['requests_total'] == 6
+        assert metrics['requests_coalesced'] + metrics['cache_hits'] == 5
+
+
+class TestExecutionBackends:
+    """Test suite for shared-memory frames and the process execution backend."""
+
+    def test_shared_frame_round_trip(self):
+        """Attached frames are read-only, positional views with the source's values."""
+        df = pd.DataFrame({
+            'batter_id': ['goldschmidt_p', None, 'arenado_n'],
+            'exit_velocity': [103.2, 88.1, np.nan],
+            'swing': [True, False, True],
+            'ts': pd.date_range('2025-09-25', periods=3, freq='h', tz='America/Chicago')
+        }, index=[7, 3, 9])
+
+        with SharedFrame(df) as frame:
+            with attached_frame(frame.handle) as shared:
+                assert list(shared.index) == [0, 1, 2]
+                pd.testing.assert_frame_equal(shared, df.reset_index(drop=True))
+                assert not shared['exit_velocity'].to_numpy().flags.writeable
+                del shared
+
+    def test_attaching_leaves_the_resource_tracker_alone(self, monkeypatch):
+        """A worker's attachment is never left registered, so its exit cannot unlink the publisher's block."""
+        from multiprocessing import resource_tracker
+
+        calls = []
+        with SharedFrame(pd.DataFrame({'pitches': [92, 15, 104]})) as frame:
+            monkeypatch.setattr(resource_tracker, 'register', lambda name, rtype: calls.append(('register', name)))
+            monkeypatch.setattr(resource_tracker, 'unregister', lambda name, rtype: calls.append(('unregister', name)))
+            with attached_frame(frame.handle) as shared:
+                del shared
+            monkeypatch.undo()
+
+        registered = [name for call, name in calls if call == 'register']
+        assert registered == [name for call, name in calls if call == 'unregister']
+
+    def test_shared_frame_keeps_categorical_and_nullable_dtypes(self):
+        """Workers see the same pandas dtypes as the thread backend."""
+        df = pd.DataFrame({
+            'role': pd.Categorical(['SP', 'RP', None, 'SP'], categories=['SP', 'RP', 'CL'], ordered=True),
+            'pitches': pd.array([92, None, 15, 104], dtype='Int64'),
+            'velocity': pd.array([95.1, 88.0, None, 91.4], dtype='Float64'),
+            'back_to_back': pd.array([False, True, None, False], dtype='boolean')
+        })
+
+        with SharedFrame(df) as frame:
+            with attached_frame(frame.handle) as shared:
+                pd.testing.assert_frame_equal(shared, df)
+                assert shared['role'].cat.categories.tolist() == ['SP', 'RP', 'CL'] and shared['role'].cat.ordered
+                assert shared['pitches'].sum() == 211 and shared['pitches'].isna().tolist() == [False, True, False, False]
+                del shared
+
+    def test_process_backend_matches_thread_backend(self):
+        """Worker processes reproduce in-process results; failures warn and fall back to NaN."""
+        import realtime_pipeline
+        from benchmark_backends import run_benchmark
+        from execution_backends import get_execution_backend
+
+        df = pd.DataFrame(realtime_pipeline.create_sample_data('baseball', 'STL', 500))
+        df.index = df.index + 1000
+        features = ['cardinals_batter_xwoba_30d', 'cardinals_pitcher_whiff_rate_15d', 'nonexistent_feature']
+
+        thread, process = get_execution_backend('thread', 2), get_execution_backend('process', 2)
+        try:
+            with pytest.warns(UserWarning, match='nonexistent_feature'):
+                expected = thread.compute_many(df, features)
+            with pytest.warns(UserWarning, match='nonexistent_feature'):
+                actual = process.compute_many(df, features)
+
+            for name in features:
+                pd.testing.assert_series_equal(actual[name], expected[name], check_names=False)
+            assert actual['nonexistent_feature'].isna().all()
+
+            with pytest.raises(ValueError):
+                process.compute('nonexistent_feature', df)
+        finally:
+            thread.shutdown()
+            process.shutdown()
+
+        results = run_benchmark(['football'], rows=200, rounds=1, workers=1, clients=1)
+        assert [r['backend'] for r in results] == ['thread', 'process']
+        assert all(r['features_per_sec'] > 0 for r in results)
+
+        with pytest.raises(ValueError):
+            get_execution_backend('gpu')
+
+    def test_parallel_feature_computation_shares_one_frame(self):
+        """joblib fan-out matches serial results and ships only a size-independent handle."""
+        import pickle
+
+        df = _wide_feature_frame(n=800)
+        df.index = df.index * 3 + 11
+        features = list(FEATURE_IMPLEMENTATIONS)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            serial = parallel_feature_computation(df, features, n_jobs=1)
+            parallel = parallel_feature_computation(df, features, n_jobs=2)
+
+        pd.testing.assert_frame_equal(parallel, serial, check_dtype=False)
+
+        with SharedFrame(df.head(10)) as small, SharedFrame(df) as full:
+            handle_bytes = len(pickle.dumps(full.handle))
+            assert handle_bytes < 1.2 * len(pickle.dumps(small.handle))
+            assert handle_bytes * 20 < len(pickle.dumps(df))
+
+
+class TestFeatureScheduler:
+    """Test suite for latency-class priority scheduling and deadline admission."""
+
+    def test_latency_class_then_priority_ordering(self):
+        """Queued work runs real_time before near_real_time before batch, then by priority."""
+        import threading
+        from scheduler import FeatureScheduler
+
+        scheduler = FeatureScheduler(max_workers=1, latency_classes={
+            'barrel': 'real_time', 'whiff': 'near_real_time', 'xwoba': 'batch'
+        })
+        gate, started = threading.Event(), threading.Event()
+        order = []
+
+        scheduler.submit(lambda: (started.set(), gate.wait(2)), 'xwoba')
+        started.wait(2)
+        futures = [
+            scheduler.submit(lambda: order.append('xwoba'), 'xwoba', priority=1),
+            scheduler.submit(lambda: order.append('whiff'), 'whiff', priority=1),
+            scheduler.submit(lambda: order.append('barrel_p3'), 'barrel', priority=3),
+            scheduler.submit(lambda: order.append('barrel_p1'), 'barrel', priority=1),
+            scheduler.submit(lambda: order.append('unknown'), 'not_in_yaml', priority=1)
+        ]
+        assert scheduler.stats()['queued'] == {'real_time': 2, 'near_real_time': 1, 'batch': 2}
+
+        gate.set()
+        for future in futures:
+            future.result(timeout=2)
+        scheduler.shutdown()
+
+        assert order == ['barrel_p1', 'barrel_p3', 'whiff', 'xwoba', 'unknown']
+
+    def test_admission_rejects_defers_and_expires(self):
+        """Unmeetable deadlines reject latency-critical work, defer batch work, and expire queued work."""
+        import threading
+        from scheduler import DeadlineExceeded, FeatureScheduler
+
+        scheduler = FeatureScheduler(max_workers=1, latency_classes={'barrel': 'real_time', 'xwoba': 'batch'})
+        scheduler.observe('barrel', 50.0)
+        scheduler.observe('xwoba', 50.0)
+
+        rejected = scheduler.submit(lambda: 'barrel', 'barrel', budget_ms=10)
+        with pytest.raises(DeadlineExceeded, match='Deadline cannot be met'):
+            rejected.result(timeout=1)
+
+        deferred = scheduler.submit(lambda: 'xwoba', 'xwoba', budget_ms=10)
+        assert deferred.result(timeout=2) == 'xwoba'
+
+        gate, started = threading.Event(), threading.Event()
+        scheduler.submit(lambda: (started.set(), gate.wait(2)), 'quick')
+        started.wait(2)
+        expiring = scheduler.submit(lambda: 'barrel', 'barrel', budget_ms=80)
+        time.sleep(0.12)
+        gate.set()
+        with pytest.raises(DeadlineExceeded, match='Deadline exceeded in queue'):
+            expiring.result(timeout=2)
+        scheduler.shutdown()
+
+        stats = scheduler.stats()
+        assert (stats['rejected'], stats['deferred'], stats['expired']) == (1, 1, 1)
+
+    def test_pipeline_schedules_by_yaml_latency_requirement(self):
+        """The pipeline reads latency classes from the feature YAML and reports deadline misses."""
+        import asyncio
+        from realtime_pipeline import FeatureRequest, create_sample_data
+
+        pipeline = _offline_pipeline()
+        scheduler = pipeline.scheduler
+        assert scheduler.latency_class('cardinals_batter_barrel_rate_7g') == 'real_time'
+        assert scheduler.latency_class('cardinals_pitcher_whiff_rate_15d') == 'near_real_time'
+        assert scheduler.latency_class('calculate_epa') == 'batch'
+
+        data = create_sample_data('baseball', 'STL', 50)
+        scheduler.observe('cardinals_pitcher_whiff_rate_15d', 1000.0)
+
+        def request(name, i):
+            return FeatureRequest(feature_name=name, input_data=data, request_id=f"req_{i}",
+                                  timestamp=datetime.now(), timeout_ms=100)
+
+        async def scenario():
+            return await asyncio.gather(
+                pipeline.compute_feature_async(request('cardinals_pitcher_whiff_rate_15d', 0)),
+                pipeline.compute_feature_async(request('cardinals_batter_barrel_rate_7g', 1))
+            )
+
+        missed, served = asyncio.run(scenario())
+        pipeline.close()
+
+        assert missed.error == 'Deadline cannot be met' and len(missed.values) == 0
+        assert served.error is None and len(served.values) == 50
+        assert pipeline.get_metrics()['scheduler']['rejected'] == 1
+
+
+class TestStaleFallback:
+    """Test suite for serving last-known values once a request's deadline passes."""
+
+    @staticmethod
+    def _slow_backend(monkeypatch, delay=0.3):
+        import execution_backends
+
+        compute = execution_backends.compute_feature
+        monkeypatch.setattr(execution_backends, 'compute_feature',
+                            lambda name, df: time.sleep(delay) or compute(name, df))
+
+    @staticmethod
+    def _wait_for(condition, timeout=2.0):
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            time.sleep(0.01)
+        return condition()
+
+    def test_deadline_serves_last_value_and_refreshes_in_background(self, monkeypatch):
+        """A slow miss returns the game's stale value at the deadline; the fresh result lands in the cache."""
+        import realtime_pipeline
+
+        pipeline = _offline_pipeline()
+        name = 'cardinals_batter_xwoba_30d'
+        old = pipeline.compute_feature_sync(name, realtime_pipeline.create_sample_data('baseball', 'STL', 50),
+                                            game_id='stl_g1')
+        assert not old.stale
+
+        self._slow_backend(monkeypatch)
+        data = realtime_pipeline.create_sample_data('baseball', 'STL', 50)
+
+        start = time.time()
+        response = pipeline.compute_feature_sync(name, data, timeout_ms=50, game_id='stl_g1')
+        assert time.time() - start < 0.2
+        assert response.stale and response.cache_hit and response.error is None
+        assert 0 <= response.age_seconds < 5
+        np.testing.assert_array_equal(response.values, old.values)
+        assert pipeline.get_metrics()['stale_responses'] == 1
+
+        key = pipeline.cache.make_key(name, pipeline.cache.content_hash(data))
+        assert self._wait_for(lambda: pipeline.cache.get(name, key=key) is not None)
+
+        fresh = pipeline.compute_feature_sync(name, data, timeout_ms=50, game_id='stl_g1')
+        assert fresh.cache_hit and not fresh.stale and len(fresh.values) == 50
+
+        # A last-known value with a different row count is never served
+        longer = realtime_pipeline.create_sample_data('baseball', 'STL', 80)
+        response = pipeline.compute_feature_sync(name, longer, timeout_ms=50, game_id='stl_g1')
+        assert not response.stale and len(response.values) == 80
+
+        # Nor one from another scope, and unscoped requests keep none
+        other = realtime_pipeline.create_sample_data('baseball', 'STL', 30)
+        scoped = pipeline.compute_feature_sync(name, other, timeout_ms=50, stale_key='game_2')
+        assert not scoped.stale and len(scoped.values) == 30
+        assert pipeline.cache.get_stale(name, 'game_2') is not None
+
+        unscoped = pipeline.compute_feature_sync(name, realtime_pipeline.create_sample_data('baseball', 'STL', 30),
+                                                 timeout_ms=50)
+        assert not unscoped.stale and len(unscoped.values) == 30
+        assert pipeline.cache.get_stale(name) is None
+        assert not any(key == f'feature_last:{name}' for key in pipeline.redis_client)
+        assert pipeline.get_metrics()['stale_responses'] == 1
+
+    def test_batch_and_rejected_requests_fall_back(self, monkeypatch):
+        """Batch misses past the deadline are served stale, cached late, and never stored as fresh."""
+        import asyncio
+        import realtime_pipeline
+        from realtime_pipeline import FeatureRequest
+
+        pipeline = _offline_pipeline()
+        names = ['cardinals_batter_xwoba_30d', 'cardinals_pitcher_whiff_rate_15d']
+        previous = {n: pipeline.compute_feature_sync(n, realtime_pipeline.create_sample_data('baseball', 'STL', 60),
+                                                     game_id='stl_g1')
+                    for n in names}
+
+        self._slow_backend(monkeypatch)
+        data = realtime_pipeline.create_sample_data('baseball', 'STL', 60)
+        pipeline.scheduler.observe(names[1], 1000.0)
+
+        requests = [FeatureRequest(n, data, f"req_{n}", datetime.now(), timeout_ms=50, game_id='stl_g1')
+                    for n in names]
+        computed, rejected = asyncio.run(pipeline.compute_features_batch(requests))
+
+        assert computed.stale and rejected.stale
+        np.testing.assert_array_equal(computed.values, previous[names[0]].values)
+        np.testing.assert_array_equal(rejected.values, previous[names[1]].values)
+        assert pipeline.get_metrics()['scheduler']['rejected'] == 1
+
+        key = pipeline.cache.make_key(names[0], requests[0].cache_key)
+        assert self._wait_for(lambda: pipeline.cache.get(names[0], key=key) is not None)
+        assert len(pipeline.cache.get(names[0], key=key)) == 60
+        _, age = pipeline.cache.get_stale(names[0], 'stl_g1')
+        assert age < 1
+
+        assert pipeline.invalidate_cache(names[0]) >= 2
+        assert pipeline.cache.get_stale(names[0], 'stl_g1') is None
+
+
+class TestStaleWhileRevalidate:
+    """Test suite for soft/hard TTLs and probabilistic early refresh."""
+
+    def test_early_refresh_probability(self):
+        """Refresh is certain past the soft TTL and grows likelier as expiry approaches."""
+        import random
+
+        random.seed(7)
+        assert hard_ttl(300) == 600 and hard_ttl(30, factor=1.0) == 30
+        assert all(should_refresh(100.0, 0.5, now=100.0) for _ in range(100))
+        assert not any(should_refresh(100.0, 0.0, now=99.9) for _ in range(100))
+        assert not any(should_refresh(100.0, 0.5, beta=0.0, now=99.9) for _ in range(100))
+
+        def rate(now, beta=1.0):
+            return np.mean([should_refresh(100.0, 0.5, beta=beta, now=now) for _ in range(2000)])
+
+        assert rate(90.0) < 0.01 < rate(99.0) < rate(99.8) < 1.0
+        assert rate(99.0, beta=2.0) > rate(99.0)
+
+    def test_expired_entry_served_while_one_refresh_runs(self, monkeypatch):
+        """Past the soft TTL readers keep hitting the old entry and one background refresh rewrites it."""
+        import threading
+        import execution_backends
+        import realtime_pipeline
+
+        pipeline = _offline_pipeline(cache_ttl=0.2)
+        pipeline.cache.early_refresh_beta = 0.0
+        data = realtime_pipeline.create_sample_data('baseball', 'STL', 50)
+        name = 'cardinals_batter_xwoba_30d'
+
+        calls = []
+        refreshing = threading.Event()
+        compute = execution_backends.compute_feature
+
+        def tracked_compute(feature_name, df):
+            calls.append(feature_name)
+            if len(calls) > 1:
+                refreshing.wait(2)
+            return compute(feature_name, df)
+
+        monkeypatch.setattr(execution_backends, 'compute_feature', tracked_compute)
+
+        first = pipeline.compute_feature_sync(name, data)
+        key = pipeline.cache.make_key(name, pipeline.cache.content_hash(data))
+        assert pipeline.cache.lookup(key)[1] is False
+
+        time.sleep(0.25)
+        assert pipeline.cache.lookup(key)[1] is True
+        hits = [pipeline.compute_feature_sync(name, data) for _ in range(5)]
+        refreshing.set()
+
+        assert all(r.cache_hit and not r.stale for r in hits)
+        for response in hits:
+            np.testing.assert_array_equal(response.values, first.values)
+
+        deadline = time.time() + 2
+        while pipeline.get_metrics()['background_refreshes'] < 1 and time.time() < deadline:
+            time.sleep(0.01)
+        assert pipeline.get_metrics()['background_refreshes'] == 1
+        assert len(calls) == 2
+        assert pipeline.cache.lookup(key)[1] is False
+
+
+class TestIndexedInvalidation:
+    """Test suite for index-based cache invalidation by game, entity and feature."""
+
+    def test_game_event_invalidates_only_that_game(self):
+        """invalidate_game drops exactly the game's entries from both tiers, without KEYS."""
+        import realtime_pipeline
+
+        pipeline = _offline_pipeline()
+        client = pipeline.redis_client
+        client.keys = lambda *a: pytest.fail('KEYS must not be used for invalidation')
+
+        data = {game: realtime_pipeline.create_sample_data('baseball', 'STL', rows)
+                for game, rows in (('stl_g1', 40), ('stl_g2', 60))}
+        features = ['cardinals_batter_xwoba_30d', 'cardinals_pitcher_whiff_rate_15d']
+        for game in data:
+            for name in features:
+                pipeline.compute_feature_sync(name, data[game], game_id=game,
+                                              entity_id='goldschmidt_p' if game == 'stl_g2' else None)
+
+        def cached(game, name):
+            key = pipeline.cache.make_key(name, pipeline.cache.content_hash(data[game]))
+            return key in pipeline.cache.l1, key in client
+
+        assert pipeline.invalidate_game('stl_g1') == 2
+        assert all(cached('stl_g1', name) == (False, False) for name in features)
+        assert all(cached('stl_g2', name) == (True, True) for name in features)
+        assert pipeline.cache.get_stale(features[0], 'stl_g1') is not None  # fallbacks outlive game events
+        assert pipeline.invalidate_game('stl_g1') == 0
+
+        assert pipeline.invalidate_entity('goldschmidt_p') == 2
+        assert all(cached('stl_g2', name) == (False, False) for name in features)
+
+    def test_games_invalidated_in_fixed_round_trips(self):
+        """invalidate_games pipelines every game's ZRANGE and issues a single DEL."""
+        import realtime_pipeline
+
+        pipeline = _offline_pipeline()
+        client = pipeline.redis_client
+        games = ['stl_g1', 'stl_g2', 'stl_g3']
+        for rows, game in enumerate(games, start=20):
+            pipeline.compute_feature_sync('cardinals_batter_xwoba_30d',
+                                          realtime_pipeline.create_sample_data('baseball', 'STL', rows), game_id=game)
+
+        calls = []
+        client.zrange = lambda *a: pytest.fail('ZRANGE must be pipelined')
+        delete = client.delete
+        client.delete = lambda *keys: calls.append(keys) or delete(*keys)
+
+        assert pipeline.invalidate_games(games + ['stl_g9']) == 3
+        assert len(calls) == 1
+        assert not any(key.startswith('feature:') for key in client)
+        assert pipeline.cache.get_stale('cardinals_batter_xwoba_30d', 'stl_g2') is not None
+        assert pipeline.invalidate_games(games) == 0
+
+    def test_feature_and_full_invalidation(self):
+        """Feature invalidation goes through its index; clearing everything uses SCAN."""
+        import realtime_pipeline
+
+        pipeline = _offline_pipeline()
+        client = pipeline.redis_client
+        data = realtime_pipeline.create_sample_data('baseball', 'STL', 50)
+        for name in ('cardinals_batter_xwoba_30d', 'cardinals_pitcher_whiff_rate_15d'):
+            pipeline.compute_feature_sync(name, data, game_id='stl_g1')
+
+        index = client.zrange(pipeline.cache.index_key('feature', 'cardinals_batter_xwoba_30d'), 0, -1)
+        assert len(index) == 2  # the entry and the last-known value
+
+        assert pipeline.invalidate_cache('cardinals_batter_xwoba_30d') == 2
+        assert not any('cardinals_batter_xwoba_30d' in key for key in client)
+
+        scanned = []
+        scan_iter = client.scan_iter
+        client.scan_iter = lambda match='*', count=None: scanned.append(match) or scan_iter(match, count)
+        client.keys = lambda *a: pytest.fail('KEYS must not be used for invalidation')
+        remaining = len(client)
+        assert pipeline.invalidate_cache() == remaining  # Redis deletes only
+        assert scanned == ['feature:*', 'feature_last:*', 'feature_idx:*']
+        assert not client and pipeline.cache.l1_stats()['entries'] == 0
+
+        pipeline.cache.l1.set('feature:cardinals_batter_xwoba_30d:l1_only', b'\0' * 8, 60)
+        assert pipeline.cache.invalidate_pattern('feature:*') == 0
+        assert pipeline.cache.l1_stats()['entries'] == 0
+
+
+class TestMicroBatchStream:
+    """Test suite for the micro-batching stream consumer."""
+
+    @staticmethod
+    def _events(sport, team, game_id, rows, start=0, **columns):
+        import realtime_pipeline
+
+        data = realtime_pipeline.create_sample_data(sport, team, rows + start)
+        data.update({k: [v] * (rows + start) for k, v in columns.items()})
+        return [
+            {**{k.encode(): str(int(v[i]) if isinstance(v[i], bool) else v[i]).encode() for k, v in data.items()},
+             b'sport': sport.encode(), b'team': team.encode(), b'game_id': game_id.encode()}
+            for i in range(start, start + rows)
+        ]
+
+    def test_groups_by_game_and_keeps_window_history(self, monkeypatch):
+        """Each micro-batch computes once per game over its entities' windows and acks in bulk."""
+        import asyncio
+        import json
+        from realtime_pipeline import FeatureStreamProcessor
+
+        pipeline = _offline_pipeline()
+        client = pipeline.redis_client
+        processor = FeatureStreamProcessor(pipeline, batch_size=8, batch_window_ms=200, window_rows=10)
+
+        reads = [
+            [(b'sports_events', [(f'1-{i}'.encode(), e) for i, e in enumerate(
+                self._events('baseball', 'STL', 'g1', 4, batter_id=31, pitcher_id=7))])],
+            [(b'sports_events', [(f'2-{i}'.encode(), e) for i, e in enumerate(
+                self._events('football', 'TEN', 'g2', 2, qb_id=7) + [{b'sport': b'hockey', b'team': b'NSH'}])])],
+            [],
+            [(b'sports_events', [(f'3-{i}'.encode(), e) for i, e in enumerate(
+                self._events('baseball', 'STL', 'g1', 8, start=4, batter_id=31, pitcher_id=7))])],
+        ]
+        counts = []
+
+        def xreadgroup(group, consumer, streams, count, block):
+            counts.append(count)
+            if len(reads) == 1:
+                processor.stop()
+            messages = reads.pop(0)
+            if not messages:
+                time.sleep(block / 1000)  # nothing arrived before the window closed
+            return messages
+
+        acks, batches = [], []
+        client.xgroup_create = lambda *a, **k: None
+        client.xreadgroup = xreadgroup
+        client.xack = lambda stream, group, *ids: acks.append(ids)
+        compute_batch = pipeline.compute_features_batch
+
+        async def counted_batch(requests):
+            assert all(r.stale_key == r.game_id for r in requests)
+            batches.append(sorted((r.feature_name, len(r.input_data['team_id'])) for r in requests))
+            return await compute_batch(requests)
+
+        pipeline.compute_features_batch = counted_batch
+        asyncio.run(processor.process_stream())
+
+        # First micro-batch: 4 + 3 messages (the second read asks for the 4 remaining)
+        assert counts[:2] == [8, 4]
+        assert len(acks[0]) == 7 and len(acks[1]) == 8
+        assert batches[0] == sorted(
+            [(name, 4) for name in ('cardinals_batter_xwoba_30d', 'cardinals_pitcher_whiff_rate_15d',
+                                    'cardinals_bullpen_fatigue_index_3d')] +
+            [(name, 2) for name in ('titans_qb_pressure_to_sack_rate_adj_4g', 'titans_qb_epa_per_play_clean_pocket_5g')]
+        )
+
+        # Second micro-batch for g1 sees each entity's history, trimmed to window_rows
+        assert {length for _, length in batches[1]} == {10}
+        assert len(client[processor.window_key('baseball', 'STL', ('pitcher_id',), ('7',))]) == 10
+
+        stored = json.loads(client['feature_results:cardinals_batter_xwoba_30d:3-7'])
+        assert stored['request_id'] == '3-7_cardinals_batter_xwoba_30d' and len(stored['values']) == 1
+        assert not any(key.startswith('feature_results:') and key.endswith(':2-2') for key in client)
+
+    def test_multi_game_features_see_earlier_games(self):
+        """A QB's window spans games, so the next game's rolling features include the previous one."""
+        import asyncio
+        import json
+        from realtime_pipeline import FeatureStreamProcessor
+
+        pipeline = _offline_pipeline()
+        client = pipeline.redis_client
+        processor = FeatureStreamProcessor(pipeline, batch_size=8, window_rows=10)
+        client.xack = lambda *a: None
+        compute_batch = pipeline.compute_features_batch
+        lengths = []
+
+        async def counted_batch(requests):
+            lengths.append({r.feature_name: len(r.input_data['qb_id']) for r in requests})
+            return await compute_batch(requests)
+
+        pipeline.compute_features_batch = counted_batch
+        for n, game in enumerate(('g1', 'g2', 'g3')):
+            events = self._events('football', 'TEN', game, 3, qb_id=7, game_no=n + 1, pressure=True, sack=True)
+            events += self._events('football', 'TEN', game, 1, qb_id=9, game_no=n + 1)
+            asyncio.run(processor.process_batch(
+                [(b'sports_events', f'{n}-{i}'.encode(), e) for i, e in enumerate(events)]))
+
+        assert [sorted(set(batch.values())) for batch in lengths] == [[4], [8], [12]]
+        stored = json.loads(client['feature_results:titans_qb_pressure_to_sack_rate_adj_4g:2-0'])
+        assert len(stored['values']) == 1 and stored['values'][0] > 0.0
+        assert len(client[processor.window_key('football', 'TEN', ('qb_id',), ('9',))]) == 3
+
+
+    def test_failed_batches_are_still_acknowledged(self):
+        """Compute failures and undecodable messages are logged and the whole batch is acked."""
+        import asyncio
+        from realtime_pipeline import FeatureStreamProcessor
+
+        pipeline = _offline_pipeline()
+        client = pipeline.redis_client
+        processor = FeatureStreamProcessor(pipeline, batch_size=8, window_rows=10)
+
+        acks = []
+        client.xack = lambda stream, group, *ids: acks.append(ids)
+
+        async def failing_batch(requests):
+            raise RuntimeError('backend down')
+
+        pipeline.compute_features_batch = failing_batch
+        events = self._events('baseball', 'STL', 'g1', 3)
+        batch = [(b'sports_events', f'1-{i}'.encode(), e) for i, e in enumerate(events)]
+        batch.append((b'sports_events', b'1-3', {b'sport': b'\xff'}))
+
+        asyncio.run(processor.process_batch(batch))
+
+        assert acks == [(b'1-0', b'1-1', b'1-2', b'1-3')]
+        assert not any(key.startswith('feature_results:') for key in client)
+
+    def test_stale_responses_are_not_split_per_event(self):
+        """A last-known value from an earlier window is never published under this batch's events."""
+        import asyncio
+        from dataclasses import replace
+        from realtime_pipeline import FeatureStreamProcessor
+
+        pipeline = _offline_pipeline()
+        client = pipeline.redis_client
+        processor = FeatureStreamProcessor(pipeline, batch_size=8, window_rows=10)
+        client.xack = lambda *a: None
+        compute_batch = pipeline.compute_features_batch
+
+        async def stale_batch(requests):
+            responses = await compute_batch(requests)
+            return [replace(r, stale=True) if r.feature_name == 'cardinals_batter_xwoba_30d' else r
+                    for r in responses]
+
+        pipeline.compute_features_batch = stale_batch
+        events = self._events('baseball', 'STL', 'g1', 4)
+        asyncio.run(processor.process_batch([(b'sports_events', f'1-{i}'.encode(), e) for i, e in enumerate(events)]))
+
+        assert not any(key.startswith('feature_results:cardinals_batter_xwoba_30d:') for key in client)
+        assert 'feature_results:cardinals_pitcher_whiff_rate_15d:1-3' in client
+
+class TestDriftDetection:
+    """Test suite for streaming (sketch-based) and vectorized drift detection."""
+
+    def test_sketch_memory_merge_and_round_trip(self):
+        """Sketches stay small, merge like one sketch and survive serialization."""
+        rng = np.random.default_rng(7)
+        values = rng.normal(87, 8, 400_000)
+
+        whole = KLLSketch(seed=1)
+        for chunk in np.array_split(values, 100):
+            whole.update(chunk)
+        assert whole.n == len(values) and len(whole) < 2000
+
+        halves = [FeatureSketch(seed=2), FeatureSketch(seed=3)]
+        for sketch, half in zip(halves, np.array_split(values, 2)):
+            sketch.update(np.append(half, np.nan))
+        merged = halves[0].merge(halves[1])
+
+        exact = np.quantile(values, [0.1, 0.5, 0.9])
+        np.testing.assert_allclose(whole.quantile([0.1, 0.5, 0.9]), exact, atol=0.5)
+        np.testing.assert_allclose(merged.kll.quantile([0.1, 0.5, 0.9]), exact, atol=0.5)
+        assert merged.stats()['count'] == len(values) and merged.stats()['null_rate'] == pytest.approx(2 / (len(values) + 2))
+        assert merged.stats()['std'] == pytest.approx(values.std(ddof=1))
+
+        restored = FeatureSketch.from_dict(merged.to_dict())
+        np.testing.assert_array_equal(restored.kll.quantile([0.25, 0.75]), merged.kll.quantile([0.25, 0.75]))
+
+    def test_streaming_results_track_batch_detection(self):
+        """KS and PSI from sketches agree with the batch tests on the raw values."""
+        rng = np.random.default_rng(11)
+        baseline = pd.DataFrame({'stable': rng.normal(0, 1, 50_000), 'shifted': rng.normal(0, 1, 50_000)})
+        candidate = pd.DataFrame({'stable': rng.normal(0, 1, 50_000), 'shifted': rng.normal(0.5, 1, 50_000)})
+
+        monitor = StreamingDriftMonitor()
+        for start in range(0, 50_000, 1_000):
+            monitor.observe_frame(baseline.iloc[start:start + 1_000], baseline=True)
+        for start in range(0, 50_000, 1_000):
+            monitor.observe_frame(candidate.iloc[start:start + 1_000])
+
+        # Candidate histograms are cut at the baseline's deciles
+        assert monitor.candidate['shifted'].bin_counts.sum() == 50_000
+
+        streaming = monitor.detect_drift()
+        batch = FeatureDriftDetector().detect_drift(baseline, candidate, ['stable', 'shifted'])
+
+        assert not streaming['stable']['drift_detected'] and streaming['shifted']['drift_detected']
+        for feature in ('stable', 'shifted'):
+            assert streaming[feature]['ks_test']['ks_statistic'] == pytest.approx(
+                batch[feature]['ks_test']['ks_statistic'], abs=0.02)
+            assert streaming[feature]['psi_test']['psi'] == pytest.approx(
+                batch[feature]['psi_test']['psi'], abs=0.02)
+        assert monitor.detector.drift_history[-1]['features_with_drift'] == 1
+
+        finished = monitor.rotate()
+        assert set(finished) == {'stable', 'shifted'} and monitor.candidate == {}
+
+
+    def test_vectorized_detection_matches_per_feature_tests(self):
+        """Batched numeric tests give the per-feature KS / PSI / stats results."""
+        rng = np.random.default_rng(5)
+
+        def frame(rows, shift):
+            df = pd.DataFrame({f'f{j}': rng.normal(shift * (j % 3), 1, rows) for j in range(12)})
+            df.loc[rng.random(rows) < 0.1, 'f0'] = np.nan
+            df['pitches'] = rng.integers(0, 5, rows) + int(shift > 0)
+            df['constant'] = 1.0
+            df['empty'] = np.nan
+            df['swing'] = rng.random(rows) < 0.4
+            return df
+
+        # Asymptotic KS p-values at large n, ks_2samp's exact ones below EXACT_KS_MAX_N
+        for rows, p_tolerance in ((3000, 0.05), (80, 1e-9)):
+            baseline, candidate = frame(rows, 0), frame(rows * 5 // 6, 0.3)
+            detector = FeatureDriftDetector()
+            results = detector.detect_drift(baseline, candidate, list(baseline.columns))
+            assert list(results) == list(baseline.columns)
+
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                for feature in baseline.columns:
+                    expected = detector._detect_feature_drift(baseline[feature], candidate[feature], feature)
+                    for section in ('ks_test', 'psi_test', 'baseline_stats', 'candidate_stats'):
+                        for key, value in expected[section].items():
+                            if key == 'p_value':
+                                assert results[feature][section][key] == pytest.approx(
+                                    value, rel=p_tolerance, abs=1e-6, nan_ok=True)
+                            elif isinstance(value, float):
+                                assert results[feature][section][key] == pytest.approx(value, nan_ok=True)
+                            else:
+                                assert results[feature][section][key] == value
+                    assert results[feature]['drift_detected'] == expected['drift_detected']
+
+    def test_baseline_profiles_score_candidates_without_baseline(self, tmp_path):
+        """Saved per-version profiles reproduce raw-baseline results and carry YAML thresholds."""
+        rng = np.random.default_rng(9)
+        baseline = pd.DataFrame({
+            'cardinals_batter_xwoba_30d': rng.normal(0.33, 0.04, 20_000),
+            'pitches': rng.integers(0, 30, 20_000),
+            'role': rng.choice(['RP', 'SP'], 20_000)
+        })
+        candidate = pd.DataFrame({
+            'cardinals_batter_xwoba_30d': rng.normal(0.3425, 0.04, 8_000),
+            'pitches': rng.integers(0, 30, 8_000)
+        })
+        definitions = {'cardinals_batter_xwoba_30d': {'version': 2, 'quality_checks': {'drift_threshold': 0.15}}}
+
+        detector = FeatureDriftDetector()
+        with pytest.warns(UserWarning, match='role'):
+            profiles = detector.build_profiles(baseline, definitions, list(baseline.columns))
+        detector.save_profiles(profiles, tmp_path)
+        assert (tmp_path / 'cardinals_batter_xwoba_30d' / 'v2.json').exists()
+        assert len(profiles['pitches'].quantile_sample) == 1000
+
+        # An older version on disk is ignored unless pinned
+        stale = FeatureDriftDetector().build_profiles(candidate, feature_columns=['pitches'])
+        stale['pitches'].version = 0
+        detector.save_profiles(stale, tmp_path)
+        assert FeatureDriftDetector.load_profiles(tmp_path)['pitches'].version == 1
+        assert FeatureDriftDetector.load_profiles(tmp_path, {'pitches': 0})['pitches'].version == 0
+
+        loaded = FeatureDriftDetector.load_profiles(tmp_path)
+        scored = detector.detect_drift_from_profiles(loaded, candidate)
+        expected = detector.detect_drift(baseline, candidate, list(candidate.columns))
+
+        for feature in candidate.columns:
+            assert scored[feature]['ks_test']['ks_statistic'] == pytest.approx(
+                expected[feature]['ks_test']['ks_statistic'], abs=1e-3)
+            assert scored[feature]['psi_test']['psi'] == pytest.approx(expected[feature]['psi_test']['psi'])
+            assert scored[feature]['baseline_stats'] == pytest.approx(expected[feature]['baseline_stats'])
+
+        # KS ~0.12 exceeds the default threshold but not the feature's YAML drift_threshold
+        xwoba = scored['cardinals_batter_xwoba_30d']
+        assert xwoba['ks_test']['threshold'] == 0.15 and not xwoba['drift_detected']
+        assert expected['cardinals_batter_xwoba_30d']['drift_detected']
+        assert detector.detect_drift_from_profiles(loaded, candidate, ['role'])['role']['error']
+
+    def test_history_is_bounded_and_trend_is_queryable(self, tmp_path):
+        """Memory keeps a fixed number of summaries; the dated log answers trend queries."""
+        rng = np.random.default_rng(13)
+        baseline = pd.DataFrame({'xwoba': rng.normal(0.33, 0.04, 500), 'pitches': rng.integers(0, 30, 500)})
+
+        detector = FeatureDriftDetector(history_size=3, history_dir=tmp_path)
+        for shift in (0.0, 0.0, 0.04, 0.05, 0.06):
+            candidate = baseline.assign(xwoba=baseline['xwoba'] + shift)
+            detector.detect_drift(baseline, candidate, ['xwoba', 'pitches'])
+
+        assert len(detector.drift_history) == 3
+        assert 'results' not in detector.drift_history[-1]
+        assert detector.drift_history[-1]['drifted_features'] == ['xwoba']
+
+        # Move today's partition back four days, then log one more check today
+        today = datetime.now()
+        old_day = (today - timedelta(days=4)).date().isoformat()
+        (tmp_path / f"date={today.date().isoformat()}").rename(tmp_path / f"date={old_day}")
+        detector.detect_drift(baseline, baseline, ['xwoba', 'pitches'])
+
+        trend = detector.drift_trend('xwoba', days=7, now=today)
+        assert len(trend) == 6 and trend['timestamp'].is_monotonic_increasing
+        assert list(trend['drift_detected']) == [False, False, True, True, True, False]
+        assert trend['candidate_mean'].iloc[4] == pytest.approx(baseline['xwoba'].mean() + 0.06)
+        assert len(detector.drift_trend('xwoba', days=2, now=today)) == 1
+        assert detector.drift_trend('calculate_epa', days=7, now=today).empty
+
+class TestBenchmarkRunner:
+    """Test suite for the sharded CI benchmark runner."""
+
+    def test_shards_partition_features_stably(self):
+        """Every feature lands in exactly one shard, and sample groups follow the sport."""
+        names = list(FEATURE_IMPLEMENTATIONS)
+        shards = [shard_features(names, index, 3) for index in range(3)]
+
+        assert sorted(sum(shards, [])) == sorted(names)
+        assert shard_features(names, 1, 3) == shards[1]
+        with pytest.raises(ValueError):
+            shard_features(names, 3, 3)
+
+        assert sample_group('cardinals_batter_xwoba_30d') == 'baseball'
+        assert sample_group('longhorns_qb_epa_per_play_5g') == 'longhorns_football'
+        assert sample_group('longhorns_basketball_offensive_rating') == 'longhorns_basketball'
+
+    def test_runner_times_features_in_and_out_of_process(self):
+        """Runs report median/p95 per size, in-process and across pinned workers."""
+        rows = 200
+        sample_data = {'baseball': pd.DataFrame({
+            'batter_id': np.random.randint(1, 20, rows),
+            'pitcher_id': np.random.randint(1, 10, rows),
+            'game_no': np.random.randint(1, 50, rows),
+            'ts': pd.date_range('2025-01-01', periods=rows, freq='h'),
+            'exit_velocity': np.random.normal(89, 8, rows),
+            'launch_angle': np.random.normal(12, 15, rows),
+            'swing': np.random.random(rows) < 0.6,
+            'whiff': np.random.random(rows) < 0.25
+        })}
+        features = ['cardinals_batter_xwoba_30d', 'cardinals_batter_barrel_rate_7g', 'calculate_epa']
+
+        for workers in (1, 2):
+            results = BenchmarkRunner(sample_data, sizes=(50, 200), iterations=3, workers=workers).run(features)
+
+            assert list(results) == features
+            for name in features[:2]:
+                timing = results[name]['200_rows']
+                assert timing['min_ms'] <= timing['median_ms'] <= timing['p95_ms'] <= timing['max_ms']
+                assert timing['throughput_rows_per_ms'] > 0
+            assert 'error' in results['calculate_epa']
+
 def test_feature_registry():
     """Test that all features in registry are callable."""
     for name, func in FEATURE_IMPLEMENTATIONS.items():
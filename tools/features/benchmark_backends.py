@@ -0,0 +1,122 @@
+"""
+Blaze Sports Intelligence Execution Backend Benchmark
+
+Compares the thread and process execution backends on the create_sample_data
+workloads served by the real-time pipeline. Concurrent clients each compute
+their sport's feature set over one frame; throughput is features per second.
+"""
+
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from execution_backends import EXECUTION_BACKENDS, get_execution_backend
+from realtime_pipeline import create_sample_data
+
+
+BENCHMARK_FEATURES = {
+    "baseball": [
+        "cardinals_batter_xwoba_30d",
+        "cardinals_batter_barrel_rate_7g",
+        "cardinals_batter_chase_rate_below_zone_30d",
+        "cardinals_pitcher_whiff_rate_15d",
+        "cardinals_pitcher_command_plus_30d",
+        "cardinals_pitcher_stuff_plus_rolling_7g"
+    ],
+    "football": [
+        "titans_qb_pressure_to_sack_rate_adj_4g",
+        "titans_qb_epa_per_play_clean_pocket_5g",
+        "calculate_epa",
+        "calculate_dvoa"
+    ]
+}
+
+
+def benchmark_backend(backend, df: pd.DataFrame, features: List[str],
+                      rounds: int = 10, clients: int = 4) -> Dict[str, Any]:
+    """
+    Time ``rounds`` batches of ``clients`` concurrent compute_many() calls.
+
+    One untimed round warms the workers (imports, lookup tables) first.
+    """
+    def run_round():
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            list(pool.map(lambda _: backend.compute_many(df, features), range(clients)))
+
+    run_round()
+
+    round_ms = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run_round()
+        round_ms.append((time.perf_counter() - start) * 1000)
+
+    total_seconds = sum(round_ms) / 1000
+    return {
+        "backend": backend.name,
+        "rows": len(df),
+        "features": len(features),
+        "clients": clients,
+        "rounds": rounds,
+        "features_per_sec": rounds * clients * len(features) / total_seconds,
+        "round_ms_median": float(np.median(round_ms)),
+        "round_ms_p95": float(np.percentile(round_ms, 95))
+    }
+
+
+def run_benchmark(sports: List[str], rows: int = 20000, rounds: int = 10,
+                  workers: int = 4, clients: int = 4,
+                  backends: List[str] = None) -> List[Dict[str, Any]]:
+    """Benchmark every backend on every sport workload."""
+    results = []
+    for name in backends or list(EXECUTION_BACKENDS):
+        backend = get_execution_backend(name, workers)
+        try:
+            for sport in sports:
+                df = pd.DataFrame(create_sample_data(sport, rows=rows))
+                result = benchmark_backend(backend, df, BENCHMARK_FEATURES[sport], rounds, clients)
+                results.append({"sport": sport, "workers": workers, **result})
+        finally:
+            backend.shutdown()
+    return results
+
+
+def main():
+    """CLI entry point for the backend benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark thread vs process feature execution backends")
+    parser.add_argument("--sport", nargs="+", default=list(BENCHMARK_FEATURES),
+                        choices=list(BENCHMARK_FEATURES), help="Sample workloads to run")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows per sample frame")
+    parser.add_argument("--rounds", type=int, default=10, help="Timed rounds per backend")
+    parser.add_argument("--workers", type=int, default=4, help="Worker threads/processes per backend")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent requests per round")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sport, args.rows, args.rounds, args.workers, args.clients)
+
+    for result in results:
+        print(f"{result['sport']:<9} {result['backend']:<8} "
+              f"{result['features_per_sec']:>9.1f} features/s  "
+              f"median {result['round_ms_median']:.1f}ms  p95 {result['round_ms_p95']:.1f}ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Results written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,171 @@
+"""
+Blaze Sports Intelligence Kernel Benchmarks
+
+Wall-clock measurements of feature kernels. test_analytics.py only checks
+their results; timings depend on the machine and are reported here instead:
+- rollup: per-game scatter vs groupby + rolling + merge broadcast
+- tunneling: pitch tunneling score at 70k pitches vs a 700k-pitch season
+- drift: vectorized drift detection vs per-feature KS / PSI tests
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from features_impl import cardinals_batter_barrel_rate_7g, pitch_tunneling_score
+from drift_detector import FeatureDriftDetector
+
+
+def best_of(fn: Callable[[], Any], repeats: int = 3):
+    """Fastest of ``repeats`` calls (seconds) and the last call's result."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def batted_ball_frame(rows: int, seed: int = 2) -> pd.DataFrame:
+    """Batted balls over a season for ~600 batters, on a shuffled index."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'batter_id': rng.integers(0, 600, rows),
+        'game_no': rng.integers(1, 163, rows),
+        'exit_velocity': rng.normal(88, 8, rows),
+        'launch_angle': rng.normal(12, 15, rows)
+    }, index=rng.permutation(rows))
+
+
+def merge_broadcast_barrel_rate(df: pd.DataFrame) -> pd.Series:
+    """Barrel rate over 7 games via groupby + rolling + merge (the pre-rollup approach)."""
+    d = df.assign(is_barrel=(df['exit_velocity'] >= 98.0) &
+                            df['launch_angle'].between(26.0, 30.0))
+    per_game = (d.groupby(['batter_id', 'game_no'])
+                .agg(barrels=('is_barrel', 'sum'), total_pa=('is_barrel', 'count'))
+                .reset_index())
+    per_game['rate'] = per_game['barrels'] / per_game['total_pa'] * 100.0
+    per_game['rate_7g'] = (per_game.groupby('batter_id')['rate']
+                           .rolling(7, min_periods=3).mean()
+                           .reset_index(level=0, drop=True))
+    merged = d.merge(per_game[['batter_id', 'game_no', 'rate_7g']],
+                     on=['batter_id', 'game_no'], how='left')['rate_7g']
+    return merged.set_axis(df.index).fillna(0.0).clip(0.0, 50.0)
+
+
+def benchmark_game_rollup(rows: int = 500_000, repeats: int = 3) -> Dict[str, Any]:
+    """Per-game rollup vs merge broadcast for the 7-game barrel rate."""
+    df = batted_ball_frame(rows)
+    merge_time, expected = best_of(lambda: merge_broadcast_barrel_rate(df), repeats)
+    rollup_time, result = best_of(lambda: cardinals_batter_barrel_rate_7g(df), repeats)
+
+    return {
+        "rows": rows,
+        "merge_broadcast_s": merge_time,
+        "game_rollup_s": rollup_time,
+        "speedup": merge_time / rollup_time if rollup_time > 0 else float("inf"),
+        "max_abs_diff": float(np.max(np.abs(result.to_numpy() - expected.to_numpy())))
+    }
+
+
+def pitch_season_frame(pitches: int, seed: int = 11) -> pd.DataFrame:
+    """Release points and movement for ~800 pitchers over a 190-day season."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'pitcher_id': rng.integers(0, 800, pitches),
+        'ts': pd.Timestamp('2024-03-28') + pd.to_timedelta(rng.integers(0, 190 * 86400, pitches), unit='s'),
+        'release_x': rng.normal(-2.0, 0.5, pitches),
+        'release_y': rng.normal(54.0, 2.0, pitches),
+        'release_z': rng.normal(6.0, 0.8, pitches),
+        'pfx_x': rng.normal(0.0, 1.5, pitches),
+        'pfx_z': rng.normal(0.0, 1.0, pitches),
+        'start_speed': rng.normal(92, 5, pitches)
+    })
+
+
+def benchmark_tunneling_scaling(small: int = 70_000, large: int = 700_000,
+                                repeats: int = 1) -> Dict[str, Any]:
+    """
+    Tunneling score at two season sizes. 10x the pitches should cost
+    roughly 10x (the sort is n log n), never quadratic.
+    """
+    timings = {}
+    for pitches in (small, large):
+        df = pitch_season_frame(pitches)
+        timings[pitches], _ = best_of(lambda: pitch_tunneling_score(df), repeats)
+
+    return {
+        "small_pitches": small,
+        "large_pitches": large,
+        "small_s": timings[small],
+        "large_s": timings[large],
+        "scaling": timings[large] / max(timings[small], 1e-9)
+    }
+
+
+def benchmark_vectorized_drift(features: int = 200, rows: int = 5000,
+                               repeats: int = 3) -> Dict[str, Any]:
+    """Drift detection over a wide numeric frame: one batched pass vs a test per feature."""
+    rng = np.random.default_rng(5)
+    baseline = pd.DataFrame(rng.normal(size=(rows, features))).add_prefix('feature_')
+    candidate = pd.DataFrame(rng.normal(0.05, 1, size=(rows, features))).add_prefix('feature_')
+    detector = FeatureDriftDetector()
+
+    def per_feature():
+        return {name: detector._detect_feature_drift(baseline[name], candidate[name], name)
+                for name in baseline.columns}
+
+    vectorized_time, _ = best_of(lambda: detector.detect_drift(baseline, candidate), repeats)
+    per_feature_time, _ = best_of(per_feature, repeats)
+
+    return {
+        "features": features,
+        "rows": rows,
+        "per_feature_s": per_feature_time,
+        "vectorized_s": vectorized_time,
+        "speedup": per_feature_time / vectorized_time if vectorized_time > 0 else float("inf")
+    }
+
+
+KERNEL_BENCHMARKS = {
+    "rollup": benchmark_game_rollup,
+    "tunneling": benchmark_tunneling_scaling,
+    "drift": benchmark_vectorized_drift
+}
+
+
+def main():
+    """CLI entry point for the kernel benchmarks."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark feature kernels outside the unit suite")
+    parser.add_argument("--only", nargs="+", default=list(KERNEL_BENCHMARKS),
+                        choices=list(KERNEL_BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only:
+        results[name] = KERNEL_BENCHMARKS[name]()
+        print(f"{name:<10} " + "  ".join(
+            f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in results[name].items()
+        ))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Results written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,168 @@
+"""
+Blaze Sports Intelligence Feature Benchmark Runner
+
+Parallel, shardable timing of FEATURE_IMPLEMENTATIONS for CI:
+- Sample data is generated once per sport family; smaller sizes are the
+  leading rows of the largest frame
+- Features run across a process pool, one worker pinned per CPU
+- perf_counter_ns timings after untimed warmup calls, reported as median / p95
+- CI jobs split the feature set by a stable hash of the feature name
+"""
+
+import multiprocessing
+import os
+import queue
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+BENCHMARK_SIZES = (100, 1000, 5000)
+
+# Sample frames of the current worker process, keyed by sample_group()
+_SAMPLE_DATA: Dict[str, pd.DataFrame] = {}
+
+
+def sample_group(feature_name: str) -> str:
+    """Sport family whose sample data a feature is benchmarked on (mirrors _generate_sample_data)."""
+    if 'cardinals' in feature_name or 'baseball' in feature_name:
+        return "baseball"
+    if 'titans' in feature_name or 'football' in feature_name:
+        return "football"
+    if 'longhorns' in feature_name:
+        return "longhorns_basketball" if 'basketball' in feature_name else "longhorns_football"
+    if 'nil' in feature_name:
+        return "nil"
+    if 'perfect_game' in feature_name:
+        return "perfect_game"
+    return "generic"
+
+
+def shard_features(feature_names: Sequence[str], shard_index: int = 0, shard_count: int = 1) -> List[str]:
+    """Features assigned to one CI shard (CRC32 of the name, stable across runs and machines)."""
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"Shard index {shard_index} out of range for {shard_count} shards")
+    return [name for name in feature_names if zlib.crc32(name.encode()) % shard_count == shard_index]
+
+
+def available_cpus() -> List[int]:
+    """CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def time_feature(func, df: pd.DataFrame, iterations: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """Time ``func(df)`` with perf_counter_ns after ``warmup`` untimed calls."""
+    for _ in range(warmup):
+        func(df)
+
+    elapsed_ns = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        func(df)
+        elapsed_ns.append(time.perf_counter_ns() - start)
+
+    times = np.array(elapsed_ns) / 1e6
+    median_ms = float(np.median(times))
+    return {
+        "median_ms": median_ms,
+        "p95_ms": float(np.percentile(times, 95)),
+        "mean_ms": float(np.mean(times)),
+        "std_ms": float(np.std(times)),
+        "min_ms": float(np.min(times)),
+        "max_ms": float(np.max(times)),
+        "throughput_rows_per_ms": len(df) / median_ms if median_ms > 0 else float("inf")
+    }
+
+
+def _init_worker(sample_data: Dict[str, pd.DataFrame], cpu_queue=None) -> None:
+    """Load the sample frames once per worker and pin it to its own CPU."""
+    _SAMPLE_DATA.update(sample_data)
+
+    if cpu_queue is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {cpu_queue.get_nowait()})
+        except (queue.Empty, OSError):
+            pass
+
+
+def _benchmark_feature(feature_name: str, sizes: Sequence[int], iterations: int,
+                       warmup: int) -> Dict[str, Any]:
+    """Worker task: time one feature at every size."""
+    from features_impl import FEATURE_IMPLEMENTATIONS
+
+    try:
+        func = FEATURE_IMPLEMENTATIONS[feature_name]
+        data = _SAMPLE_DATA[sample_group(feature_name)]
+        return {
+            f"{size}_rows": time_feature(func, data.iloc[:size].copy(), iterations, warmup)
+            for size in sizes
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+class BenchmarkRunner:
+    """Times features over cached per-sport sample frames, in parallel worker processes."""
+
+    def __init__(self, sample_data: Dict[str, pd.DataFrame], sizes: Sequence[int] = BENCHMARK_SIZES,
+                 iterations: int = 5, warmup: int = 1, workers: Optional[int] = None,
+                 pin_cpus: bool = True, mp_context=None):
+        """
+        Args:
+            sample_data: sample_group() -> frame with at least max(sizes) rows
+            sizes: Row counts to benchmark each feature at
+            iterations: Timed calls per feature and size
+            warmup: Untimed calls before timing
+            workers: Worker processes (default: one per available CPU; 1 runs in-process)
+            pin_cpus: Pin each worker to its own CPU (Linux only)
+            mp_context: multiprocessing context (default: forkserver, else spawn)
+        """
+        self.sample_data = sample_data
+        self.sizes = tuple(sizes)
+        self.iterations = iterations
+        self.warmup = warmup
+        self.workers = workers or len(available_cpus())
+        self.pin_cpus = pin_cpus
+
+        if mp_context is None:
+            methods = multiprocessing.get_all_start_methods()
+            mp_context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self.mp_context = mp_context
+
+    def run(self, feature_names: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Benchmark features; results are keyed by feature name in input order."""
+        feature_names = list(dict.fromkeys(feature_names))
+
+        if self.workers <= 1:
+            _init_worker(self.sample_data)
+            return {
+                name: _benchmark_feature(name, self.sizes, self.iterations, self.warmup)
+                for name in feature_names
+            }
+
+        cpu_queue = None
+        if self.pin_cpus:
+            cpus = available_cpus()
+            cpu_queue = self.mp_context.Queue()
+            for i in range(self.workers):
+                cpu_queue.put(cpus[i % len(cpus)])
+
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=self.mp_context,
+                                 initializer=_init_worker, initargs=(self.sample_data, cpu_queue)) as pool:
+            futures = {
+                name: pool.submit(_benchmark_feature, name, self.sizes, self.iterations, self.warmup)
+                for name in feature_names
+            }
+            results = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = {"error": str(e)}
+            return results
@@ -0,0 +1,53 @@
+"""
+Blaze Sports Intelligence Expected Points Table Builder
+
+Regenerates the versioned EP / expected-yards lookup table shared by the
+football features (calculate_epa, calculate_dvoa, titans_hidden_yardage_per_drive_5g).
+Run after changing the reference models in ep_table.py.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from ep_table import (
+    EP_TABLE_VERSION,
+    EP,
+    build_ep_table,
+    load_ep_table,
+    save_ep_table,
+    table_path
+)
+
+
+def main():
+    """CLI entry point for building the EP table."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the Blaze expected points lookup table")
+    parser.add_argument("--output", help="Output .npy path (default: features/tables/ep_table_v<version>.npy)")
+    parser.add_argument("--model", default="blaze_simplified_ep", help="Model name recorded in metadata")
+
+    args = parser.parse_args()
+
+    output = Path(args.output) if args.output else table_path()
+
+    table = build_ep_table()
+    save_ep_table(table, output, version=EP_TABLE_VERSION, model=args.model)
+
+    # Round-trip through the memory-mapped loader to verify the file
+    loaded = load_ep_table(output)
+    if not np.array_equal(np.asarray(loaded.table), table):
+        print(f"❌ Round-trip check failed for {output}")
+        return 1
+
+    print(f"✅ EP table v{EP_TABLE_VERSION} written to {output}")
+    print(f"Shape: {table.shape}, size: {table.nbytes / 1024:.1f} KB")
+    print(f"EP range: {table[EP].min():.2f} to {table[EP].max():.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -26,6 +26,7 @@ from dataclasses import dataclass, asdict
 # Import our validation tools
 from validator import FeatureValidator
 from drift_detector import FeatureDriftDetector
+from benchmark_runner import BENCHMARK_SIZES, BenchmarkRunner, sample_group, shard_features
 from test_generator import PropertyTestGenerator
 
 
@@ -251,64 +252,58 @@ class CIValidationPipeline:
 
         return test_results
 
-    def benchmark_performance(self) -> Dict[str, Any]:
-        """Benchmark feature computation performance."""
+    def benchmark_performance(self, workers: int = None, shard_index: int = 0, shard_count: int = 1,
+                              iterations: int = 5, warmup: int = 1) -> Dict[str, Any]:
+        """
+        Benchmark feature computation performance.
+
+        Args:
+            workers: Benchmark worker processes (default: one per CPU)
+            shard_index: This CI job's shard (features are split by name hash)
+            shard_count: Number of CI jobs sharing the benchmark
+            iterations: Timed calls per feature and size
+            warmup: Untimed calls before timing
+        """
         # Import implementations
         sys.path.append(str(self.project_root))
         from features_impl import FEATURE_IMPLEMENTATIONS
 
+        feature_names = shard_features(list(FEATURE_IMPLEMENTATIONS), shard_index, shard_count)
+
+        # Load feature definitions for sample data generation
+        features_dir = self.project_root / "features"
+        validator = FeatureValidator(features_dir=str(features_dir))
+
+        # One sample frame per sport family at the largest size; smaller sizes use its leading rows
+        representatives = {}
+        for feature_name in feature_names:
+            representatives.setdefault(sample_group(feature_name), feature_name)
+        sample_data = {
+            group: self._generate_sample_data(
+                feature_name, validator.features.get(feature_name), rows=max(BENCHMARK_SIZES)
+            )
+            for group, feature_name in representatives.items()
+        }
+
+        runner = BenchmarkRunner(sample_data, iterations=iterations, warmup=warmup, workers=workers)
+
         benchmark_results = {
             "timestamp": datetime.now().isoformat(),
-            "feature_benchmarks": {},
+            "shard": {"index": shard_index, "count": shard_count},
+            "feature_benchmarks": runner.run(feature_names),
             "system_info": {
                 "python_version": sys.version,
                 "pandas_version": pd.__version__,
-                "numpy_version": np.__version__
+                "numpy_version": np.__version__,
+                "workers": runner.workers
             }
         }
 
-        # Load feature definitions for sample data generation
-        features_dir = self.project_root / "features"
-        validator = FeatureValidator(features_dir=str(features_dir))
-
-        for feature_name, func in FEATURE_IMPLEMENTATIONS.items():
-            try:
-                # Generate different sizes of sample data
-                sizes = [100, 1000, 5000]
-                size_benchmarks = {}
-
-                for size in sizes:
-                    sample_data = self._generate_sample_data(
-                        feature_name,
-                        validator.features.get(feature_name),
-                        rows=size
-                    )
-
-                    # Run multiple iterations for stable timing
-                    times = []
-                    for _ in range(5):
-                        start_time = time.time()
-                        result = func(sample_data)
-                        execution_time = (time.time() - start_time) * 1000
-                        times.append(execution_time)
-
-                    size_benchmarks[f"{size}_rows"] = {
-                        "mean_ms": np.mean(times),
-                        "std_ms": np.std(times),
-                        "min_ms": np.min(times),
-                        "max_ms": np.max(times),
-                        "throughput_rows_per_ms": size / np.mean(times)
-                    }
-
-                benchmark_results["feature_benchmarks"][feature_name] = size_benchmarks
-
-            except Exception as e:
-                benchmark_results["feature_benchmarks"][feature_name] = {
-                    "error": str(e)
-                }
-
         # Save detailed benchmark results
-        benchmark_file = self.output_dir / "performance_benchmarks.json"
+        if shard_count == 1:
+            benchmark_file = self.output_dir / "performance_benchmarks.json"
+        else:
+            benchmark_file = self.output_dir / f"performance_benchmarks.shard{shard_index}of{shard_count}.json"
         with open(benchmark_file, 'w') as f:
             json.dump(benchmark_results, f, indent=2, default=str)
 
@@ -658,11 +653,15 @@ class CIValidationPipeline:
 def main():
     """CLI entry point for CI validation."""
     import argparse
+    from functools import partial
 
     parser = argparse.ArgumentParser(description="Run CI validation for Blaze Sports Intelligence features")
     parser.add_argument("--project-root", default=".", help="Project root directory")
     parser.add_argument("--output-dir", default="ci_reports", help="Output directory for reports")
     parser.add_argument("--step", help="Run specific validation step only")
+    parser.add_argument("--benchmark-workers", type=int, help="Benchmark worker processes (default: one per CPU)")
+    parser.add_argument("--shard-index", type=int, default=0, help="Benchmark shard run by this job")
+    parser.add_argument("--shard-count", type=int, default=1, help="Number of benchmark shards")
 
     args = parser.parse_args()
 
@@ -675,7 +674,8 @@ def main():
             "schema": pipeline.validate_feature_schemas,
             "implementations": pipeline.test_feature_implementations,
             "property-tests": pipeline.run_property_tests,
-            "benchmarks": pipeline.benchmark_performance,
+            "benchmarks": partial(pipeline.benchmark_performance, args.benchmark_workers,
+                                  args.shard_index, args.shard_count),
             "drift": pipeline.check_drift_detection,
             "latency": pipeline.validate_latency_requirements
         }
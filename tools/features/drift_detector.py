@@ -6,6 +6,9 @@ Advanced drift detection system using:
 - Population Stability Index (PSI) for categorical drift
 - Statistical significance testing
 - Configurable thresholds per feature
+- Streaming mode: KS and PSI from mergeable per-feature sketches (constant memory)
+- Persisted baseline profiles per feature version, so scoring needs only candidate data
+- Bounded in-memory history plus a date-partitioned JSONL log for drift trends
 """
 
 import pandas as pd
@@ -15,23 +18,201 @@ from scipy import stats
 from datetime import datetime, timedelta
 import warnings
 import json
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
+from drift_sketches import DEFAULT_SKETCH_K, FeatureSketch
+
+
+DEFAULT_HISTORY_SIZE = 100
+
+# Effective sample size below which KS p-values use the exact distribution
+EXACT_KS_MAX_N = 100
+
+
+def _is_continuous(series: pd.Series) -> bool:
+    """Numeric, non-boolean column (handled by the vectorized tests)."""
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def _ks_statistics(baseline: np.ndarray, candidate: np.ndarray,
+                   baseline_counts: np.ndarray, candidate_counts: np.ndarray) -> np.ndarray:
+    """
+    Two-sample KS statistic for every row (feature) of two 2-D arrays, NaNs ignored.
+
+    Both samples are sorted together once per feature; the running sum of
+    +1/n_baseline and -1/n_candidate weights is the gap between the two
+    empirical CDFs, read at the last of each run of tied values.
+    """
+    values = np.concatenate([baseline, candidate], axis=1)
+    weights = np.concatenate([
+        ~np.isnan(baseline) / np.maximum(baseline_counts, 1)[:, None],
+        ~np.isnan(candidate) / -np.maximum(candidate_counts, 1)[:, None]
+    ], axis=1)
+
+    order = np.argsort(values, axis=1)
+    values = np.take_along_axis(values, order, axis=1)
+    gap = np.abs(np.cumsum(np.take_along_axis(weights, order, axis=1), axis=1))
+
+    evaluated = ~np.isnan(values)
+    evaluated[:, :-1] &= values[:, :-1] != values[:, 1:]
+    return np.max(gap * evaluated, axis=1, initial=0.0)
+
+
+def _ks_p_values(ks_stats: np.ndarray, baseline_counts: np.ndarray, candidate_counts: np.ndarray,
+                 baseline: np.ndarray = None, candidate: np.ndarray = None) -> np.ndarray:
+    """
+    Two-sided KS p-values for the two-sample statistics of every feature.
+
+    Features with fewer than EXACT_KS_MAX_N effective samples get exact
+    p-values: ks_2samp's when the raw rows (NaN-padded, as for
+    _ks_statistics) are given, otherwise the exact Kolmogorov distribution
+    at the effective sample size. The rest use the asymptotic distribution,
+    which is cheap and within a few percent of the exact value there.
+    """
+    effective_n = baseline_counts * candidate_counts / np.maximum(baseline_counts + candidate_counts, 1)
+    p_values = stats.kstwobign.sf(ks_stats * np.sqrt(effective_n))
+
+    for j in np.flatnonzero((effective_n > 0) & (effective_n < EXACT_KS_MAX_N)):
+        if baseline is not None and candidate is not None:
+            p_values[j] = stats.ks_2samp(baseline[j][~np.isnan(baseline[j])],
+                                         candidate[j][~np.isnan(candidate[j])]).pvalue
+        else:
+            p_values[j] = stats.kstwo.sf(ks_stats[j], max(round(effective_n[j]), 1))
+    return p_values
+
+
+def _quantile_edges(baseline: np.ndarray, counts: np.ndarray, bins: int) -> np.ndarray:
+    """
+    np.percentile(linspace(0, 100, bins + 1)) of every row, NaNs ignored.
+
+    Returns:
+        (features, bins + 1) array of edges (NaN for empty rows)
+    """
+    ordered = np.sort(baseline, axis=1)
+    position = (np.linspace(0, 100, bins + 1) / 100) * np.maximum(counts - 1, 0)[:, None]
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, np.maximum(counts - 1, 0)[:, None])
+    low_values = np.take_along_axis(ordered, lower, axis=1)
+    high_values = np.take_along_axis(ordered, upper, axis=1)
+    # Same interpolation as numpy's, so values on an edge fall in the same bin
+    fraction = position - lower
+    difference = high_values - low_values
+    return np.where(fraction >= 0.5, high_values - difference * (1 - fraction),
+                    low_values + difference * fraction)
+
+
+def _bin_edges(baseline: np.ndarray, counts: np.ndarray, bins: int) -> np.ndarray:
+    """PSI bin edges of every row: baseline quantiles, open-ended at both ends."""
+    edges = _quantile_edges(baseline, counts, bins)
+    edges[:, 0] = -np.inf
+    edges[:, -1] = np.inf
+    return edges
+
+
+def _bin_proportions(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Share of each row's values in each of its bins.
+
+    Bins follow pd.cut(duplicates='drop'): right-closed, with zero-width bins
+    from repeated quantiles left empty (and dropped by _psi).
+    """
+    at_or_below = np.stack([(values <= edge[:, None]).sum(axis=1) for edge in edges.T], axis=1)
+    with np.errstate(invalid="ignore"):
+        counts = np.diff(at_or_below, axis=1) * (np.diff(edges, axis=1) > 0)
+    return counts / np.maximum(counts.sum(axis=1), 1)[:, None]
+
+
+def _psi(baseline_props: np.ndarray, candidate_props: np.ndarray,
+         edges: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """PSI and number of (non-zero-width) bins for every row."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kept = np.diff(edges, axis=1) > 0
+        components = (candidate_props - baseline_props) * np.log(candidate_props / baseline_props)
+    return np.nansum(np.where(kept, components, np.nan), axis=1), kept.sum(axis=1)
+
+
+def _quantile_sample(baseline: np.ndarray, counts: np.ndarray, size: int) -> np.ndarray:
+    """
+    Evenly spaced order statistics of every row (all values for short rows),
+    NaN-padded to a common width. Their ECDF is within 1/size of the row's.
+    """
+    ordered = np.sort(baseline, axis=1)
+    width = int(min(size, counts.max(initial=0)))
+    sample = np.full((len(baseline), width), np.nan)
+    for j, count in enumerate(counts):
+        take = min(size, count)
+        sample[j, :take] = ordered[j, ((np.arange(take) + 0.5) * count / take).astype(np.int64)]
+    return sample
+
+
+def _column_stats(values: np.ndarray, counts: np.ndarray) -> List[Dict[str, float]]:
+    """_calculate_stats for every row (feature) of a 2-D array in one pass."""
+    missing = np.isnan(values)
+    filled = np.where(missing, 0.0, values)
+
+    means = filled.sum(axis=1) / np.maximum(counts, 1)
+    squares = np.where(missing, 0.0, values - means[:, None]) ** 2
+    stds = np.sqrt(squares.sum(axis=1) / np.maximum(counts - 1, 1))
+    mins = np.fmin.reduce(values, axis=1, initial=np.inf)
+    maxs = np.fmax.reduce(values, axis=1, initial=-np.inf)
+    null_rates = missing.mean(axis=1) if values.shape[1] else np.full(len(values), np.nan)
+
+    return [
+        {
+            "count": int(counts[j]),
+            "mean": float(means[j]) if counts[j] > 0 else np.nan,
+            "std": float(stds[j]) if counts[j] > 1 else np.nan,
+            "min": float(mins[j]) if counts[j] > 0 else np.nan,
+            "max": float(maxs[j]) if counts[j] > 0 else np.nan,
+            "null_rate": float(null_rates[j])
+        }
+        for j in range(len(values))
+    ]
+
+
+def _stack_padded(rows: List[List[float]], fill: float) -> np.ndarray:
+    """Stack ragged rows into one 2-D array, padding on the right with ``fill``."""
+    stacked = np.full((len(rows), max(len(row) for row in rows)), fill)
+    for j, row in enumerate(rows):
+        stacked[j, :len(row)] = row
+    return stacked
+
+
+@dataclass
+class BaselineProfile:
+    """Compact baseline of one feature version, scored against instead of the raw baseline frame."""
+    feature_name: str
+    version: int
+    bin_edges: List[float]  # PSI bins; first and last edges are -inf / inf
+    bin_proportions: List[float]
+    quantile_sample: List[float]  # Sorted order statistics standing in for the baseline in KS
+    stats: Dict[str, float]
+    drift_threshold: Optional[float] = None  # quality_checks.drift_threshold from the feature YAML
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
 
 class FeatureDriftDetector:
     """Comprehensive feature drift detection system."""
 
-    def __init__(self, drift_thresholds: Dict[str, float] = None):
+    def __init__(self, drift_thresholds: Dict[str, float] = None,
+                 history_size: int = DEFAULT_HISTORY_SIZE, history_dir: str = None):
         """
         Initialize drift detector.
 
         Args:
             drift_thresholds: Custom drift thresholds per feature
+            history_size: Check summaries kept in memory (oldest dropped first)
+            history_dir: Directory for the append-only per-feature drift log
+                (``date=YYYY-MM-DD/drift.jsonl`` partitions); None keeps no log
         """
         self.drift_thresholds = drift_thresholds or {}
         self.default_ks_threshold = 0.1
         self.default_psi_threshold = 0.1
-        self.drift_history = []
+        self.drift_history = deque(maxlen=history_size)
+        self.history_dir = Path(history_dir) if history_dir else None
 
     def kolmogorov_smirnov_test(self, baseline: pd.Series, candidate: pd.Series,
                                feature_name: str = None) -> Dict[str, float]:
@@ -165,6 +346,9 @@ class FeatureDriftDetector:
         """
         Detect drift across multiple features using both KS and PSI tests.
 
+        Numeric features are tested together as 2-D arrays (one sort per
+        feature, one stats pass); boolean and categorical ones one at a time.
+
         Args:
             baseline: Historical/reference dataset
             candidate: Current dataset to compare
@@ -180,46 +364,373 @@ class FeatureDriftDetector:
             feature_columns = list(set(baseline_numeric) & set(candidate_numeric))
 
         drift_results = {}
+        vectorized = []
 
         for feature in feature_columns:
             if feature not in baseline.columns or feature not in candidate.columns:
                 drift_results[feature] = {
                     "error": f"Feature '{feature}' missing from one or both datasets"
                 }
-                continue
+            elif _is_continuous(baseline[feature]) and _is_continuous(candidate[feature]):
+                vectorized.append(feature)
+            else:
+                drift_results[feature] = self._detect_feature_drift(
+                    baseline[feature], candidate[feature], feature
+                )
+
+        # Numeric features are tested together as columns of 2-D arrays
+        if vectorized:
+            vectorized = list(dict.fromkeys(vectorized))
+            drift_results.update(self._detect_drift_vectorized(
+                np.ascontiguousarray(baseline[vectorized].to_numpy(dtype=np.float64, na_value=np.nan).T),
+                np.ascontiguousarray(candidate[vectorized].to_numpy(dtype=np.float64, na_value=np.nan).T),
+                vectorized
+            ))
+        drift_results = {feature: drift_results[feature] for feature in feature_columns}
 
-            baseline_values = baseline[feature]
-            candidate_values = candidate[feature]
+        # Store in history
+        self._record_history(drift_results)
 
-            # Perform both KS and PSI tests
-            ks_result = self.kolmogorov_smirnov_test(
-                baseline_values, candidate_values, feature
-            )
+        return drift_results
 
-            psi_result = self.population_stability_index(
-                baseline_values, candidate_values, feature_name=feature
-            )
+    def _detect_feature_drift(self, baseline_values: pd.Series, candidate_values: pd.Series,
+                              feature: str) -> Dict:
+        """KS and PSI for a single (categorical or boolean) feature."""
+        ks_result = self.kolmogorov_smirnov_test(baseline_values, candidate_values, feature)
+        psi_result = self.population_stability_index(baseline_values, candidate_values, feature_name=feature)
+
+        return {
+            "ks_test": ks_result,
+            "psi_test": psi_result,
+            "drift_detected": ks_result.get("drift_detected", False) or
+                             psi_result.get("drift_detected", False),
+            "baseline_stats": self._calculate_stats(baseline_values),
+            "candidate_stats": self._calculate_stats(candidate_values)
+        }
+
+    def _detect_drift_vectorized(self, baseline: np.ndarray, candidate: np.ndarray,
+                                 features: List[str], bins: int = 10) -> Dict[str, Dict]:
+        """
+        KS and PSI for numeric features (one row of each array per feature)
+        in a few array passes.
+
+        Matches kolmogorov_smirnov_test / population_stability_index except
+        that KS p-values for large samples come from the asymptotic Kolmogorov
+        distribution (see _ks_p_values).
+        """
+        baseline_counts = (~np.isnan(baseline)).sum(axis=1)
+        candidate_counts = (~np.isnan(candidate)).sum(axis=1)
+
+        edges = _bin_edges(baseline, baseline_counts, bins)
+
+        ks_stats = _ks_statistics(baseline, candidate, baseline_counts, candidate_counts)
+
+        return self._drift_results(
+            features,
+            ks_stats=ks_stats,
+            p_values=_ks_p_values(ks_stats, baseline_counts, candidate_counts, baseline, candidate),
+            baseline_counts=baseline_counts,
+            candidate_counts=candidate_counts,
+            edges=edges,
+            baseline_props=_bin_proportions(baseline, edges),
+            candidate_props=_bin_proportions(candidate, edges),
+            baseline_stats=_column_stats(baseline, baseline_counts),
+            candidate_stats=_column_stats(candidate, candidate_counts)
+        )
+
+    def _drift_results(self, features: List[str], ks_stats: np.ndarray, p_values: np.ndarray,
+                       baseline_counts: np.ndarray, candidate_counts: np.ndarray,
+                       edges: np.ndarray, baseline_props: np.ndarray, candidate_props: np.ndarray,
+                       baseline_stats: List[Dict], candidate_stats: List[Dict],
+                       thresholds: Dict[str, float] = None) -> Dict[str, Dict]:
+        """Assemble per-feature results from the vectorized KS and bin arrays."""
+        thresholds = thresholds or {}
+
+        psi, bin_counts = _psi(baseline_props, candidate_props, edges)
+        baseline_entropy = stats.entropy(baseline_props, axis=1)
+        candidate_entropy = stats.entropy(candidate_props, axis=1)
+
+        drift_results = {}
+        for j, feature in enumerate(features):
+            if baseline_counts[j] == 0 or candidate_counts[j] == 0:
+                ks_result = {
+                    "ks_statistic": np.nan,
+                    "p_value": np.nan,
+                    "drift_detected": False,
+                    "error": "Insufficient data after removing nulls"
+                }
+                psi_result = {
+                    "psi": np.nan,
+                    "drift_detected": False,
+                    "error": "Insufficient data"
+                }
+            else:
+                ks_threshold = self.drift_thresholds.get(feature, thresholds.get(feature, self.default_ks_threshold))
+                psi_threshold = self.drift_thresholds.get(feature, thresholds.get(feature, self.default_psi_threshold))
+                ks_result = {
+                    "ks_statistic": float(ks_stats[j]),
+                    "p_value": float(p_values[j]),
+                    "drift_detected": bool(ks_stats[j] > ks_threshold),
+                    "threshold": ks_threshold,
+                    "sample_sizes": {
+                        "baseline": int(baseline_counts[j]),
+                        "candidate": int(candidate_counts[j])
+                    }
+                }
+                psi_result = {
+                    "psi": float(psi[j]),
+                    "drift_detected": bool(abs(psi[j]) > psi_threshold),
+                    "threshold": psi_threshold,
+                    "bin_count": int(bin_counts[j]),
+                    "baseline_entropy": float(baseline_entropy[j]),
+                    "candidate_entropy": float(candidate_entropy[j])
+                }
 
-            # Combine results
             drift_results[feature] = {
                 "ks_test": ks_result,
                 "psi_test": psi_result,
-                "drift_detected": ks_result.get("drift_detected", False) or
-                                 psi_result.get("drift_detected", False),
-                "baseline_stats": self._calculate_stats(baseline_values),
-                "candidate_stats": self._calculate_stats(candidate_values)
+                "drift_detected": ks_result["drift_detected"] or psi_result["drift_detected"],
+                "baseline_stats": baseline_stats[j],
+                "candidate_stats": candidate_stats[j]
             }
 
-        # Store in history
+        return drift_results
+
+    def build_profiles(self, baseline: pd.DataFrame, feature_definitions: Dict[str, Dict] = None,
+                       feature_columns: List[str] = None, bins: int = 10,
+                       sample_size: int = 1000) -> Dict[str, BaselineProfile]:
+        """
+        Summarize a baseline dataset into one profile per numeric feature.
+
+        Args:
+            baseline: Historical/reference dataset
+            feature_definitions: Feature name -> YAML definition (version and
+                quality_checks.drift_threshold), e.g. FeatureValidator.features
+            feature_columns: Columns to profile (default: all numeric columns)
+            bins: Number of quantile bins for PSI
+            sample_size: Order statistics kept for KS (ECDF error <= 1/sample_size)
+
+        Returns:
+            Dictionary mapping feature names to baseline profiles
+        """
+        definitions = feature_definitions or {}
+        if feature_columns is None:
+            feature_columns = list(baseline.select_dtypes(include=[np.number]).columns)
+
+        features = [f for f in dict.fromkeys(feature_columns)
+                    if f in baseline.columns and _is_continuous(baseline[f])]
+        skipped = sorted(set(feature_columns) - set(features))
+        if skipped:
+            warnings.warn(f"No baseline profile for missing or non-numeric features: {skipped}")
+        if not features:
+            return {}
+
+        values = np.ascontiguousarray(baseline[features].to_numpy(dtype=np.float64, na_value=np.nan).T)
+        counts = (~np.isnan(values)).sum(axis=1)
+        edges = _bin_edges(values, counts, bins)
+        proportions = _bin_proportions(values, edges)
+        sample = _quantile_sample(values, counts, sample_size)
+        feature_stats = _column_stats(values, counts)
+
+        created_at = datetime.now().isoformat()
+        profiles = {}
+        for j, feature in enumerate(features):
+            definition = definitions.get(feature, {})
+            profiles[feature] = BaselineProfile(
+                feature_name=feature,
+                version=int(definition.get("version", 1)),
+                bin_edges=edges[j].tolist(),
+                bin_proportions=proportions[j].tolist(),
+                quantile_sample=sample[j, :min(sample_size, counts[j])].tolist(),
+                stats=feature_stats[j],
+                drift_threshold=(definition.get("quality_checks") or {}).get("drift_threshold"),
+                created_at=created_at
+            )
+
+        return profiles
+
+    def save_profiles(self, profiles: Dict[str, BaselineProfile], profile_dir: str) -> List[str]:
+        """
+        Save profiles as ``<profile_dir>/<feature>/v<version>.json``.
+
+        Returns:
+            Paths written
+        """
+        paths = []
+        for profile in profiles.values():
+            path = Path(profile_dir) / profile.feature_name / f"v{profile.version}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(asdict(profile), f, indent=2)
+            paths.append(str(path))
+        return paths
+
+    @staticmethod
+    def load_profiles(profile_dir: str, feature_versions: Dict[str, int] = None) -> Dict[str, BaselineProfile]:
+        """
+        Load saved profiles: the latest version of each feature, or the
+        version pinned in ``feature_versions`` (e.g. from the feature YAMLs).
+        """
+        profiles = {}
+        feature_versions = feature_versions or {}
+
+        for feature_dir in sorted(Path(profile_dir).glob("*")):
+            versions = {
+                int(path.stem[1:]): path for path in feature_dir.glob("v*.json")
+                if path.stem[1:].isdigit()
+            }
+            if not versions:
+                continue
+
+            version = feature_versions.get(feature_dir.name, max(versions))
+            if version not in versions:
+                warnings.warn(f"No v{version} baseline profile for {feature_dir.name}")
+                continue
+
+            with open(versions[version], 'r') as f:
+                profiles[feature_dir.name] = BaselineProfile(**json.load(f))
+
+        return profiles
+
+    def detect_drift_from_profiles(self, profiles: Dict[str, BaselineProfile], candidate: pd.DataFrame,
+                                   feature_columns: List[str] = None) -> Dict[str, Dict]:
+        """
+        Detect drift of a candidate dataset against saved baseline profiles.
+
+        KS compares against the profile's quantile sample, PSI uses its bins
+        and proportions. Per-feature thresholds come from drift_thresholds,
+        then the profile's drift_threshold, then the defaults.
+
+        Args:
+            profiles: Feature name -> baseline profile (see load_profiles)
+            candidate: Current dataset to compare
+            feature_columns: Features to check (default: profiled features in the candidate)
+
+        Returns:
+            Results in the same shape as detect_drift
+        """
+        if feature_columns is None:
+            feature_columns = [f for f in profiles if f in candidate.columns]
+
+        drift_results = {}
+        scored = []
+
+        for feature in feature_columns:
+            if feature not in profiles:
+                drift_results[feature] = {"error": f"No baseline profile for feature '{feature}'"}
+            elif feature not in candidate.columns:
+                drift_results[feature] = {"error": f"Feature '{feature}' missing from candidate dataset"}
+            else:
+                scored.append(feature)
+
+        if scored:
+            scored = list(dict.fromkeys(scored))
+            selected = [profiles[feature] for feature in scored]
+
+            values = np.ascontiguousarray(candidate[scored].to_numpy(dtype=np.float64, na_value=np.nan).T)
+            candidate_counts = (~np.isnan(values)).sum(axis=1)
+            samples = _stack_padded([profile.quantile_sample for profile in selected], np.nan)
+            sample_counts = np.array([len(profile.quantile_sample) for profile in selected])
+            edges = _stack_padded([profile.bin_edges for profile in selected], np.inf)
+            ks_stats = _ks_statistics(samples, values, sample_counts, candidate_counts)
+            baseline_counts = np.array([profile.stats["count"] for profile in selected])
+
+            drift_results.update(self._drift_results(
+                scored,
+                ks_stats=ks_stats,
+                p_values=_ks_p_values(ks_stats, baseline_counts, candidate_counts),
+                baseline_counts=baseline_counts,
+                candidate_counts=candidate_counts,
+                edges=edges,
+                baseline_props=_stack_padded([profile.bin_proportions for profile in selected], 0.0),
+                candidate_props=_bin_proportions(values, edges),
+                baseline_stats=[profile.stats for profile in selected],
+                candidate_stats=_column_stats(values, candidate_counts),
+                thresholds={
+                    profile.feature_name: profile.drift_threshold
+                    for profile in selected if profile.drift_threshold is not None
+                }
+            ))
+        drift_results = {feature: drift_results[feature] for feature in feature_columns}
+
+        self._record_history(drift_results)
+
+        return drift_results
+
+    def _record_history(self, drift_results: Dict[str, Dict]) -> None:
+        """Keep a summary of a drift check in memory and append its per-feature rows to the log."""
+        now = datetime.now()
+        timestamp = now.isoformat()
+
         self.drift_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "results": drift_results,
-            "features_checked": len(feature_columns),
+            "timestamp": timestamp,
+            "features_checked": len(drift_results),
             "features_with_drift": sum(1 for r in drift_results.values()
-                                     if r.get("drift_detected", False))
+                                     if r.get("drift_detected", False)),
+            "drifted_features": [f for f, r in drift_results.items() if r.get("drift_detected", False)]
         })
 
-        return drift_results
+        if self.history_dir is None:
+            return
+
+        rows = []
+        for feature, result in drift_results.items():
+            row = {"timestamp": timestamp, "feature": feature}
+            if "error" in result:
+                row["error"] = result["error"]
+            else:
+                row.update({
+                    "drift_detected": bool(result.get("drift_detected", False)),
+                    "ks_statistic": result.get("ks_test", {}).get("ks_statistic", np.nan),
+                    "ks_p_value": result.get("ks_test", {}).get("p_value", np.nan),
+                    "psi": result.get("psi_test", {}).get("psi", np.nan),
+                    "baseline_mean": result.get("baseline_stats", {}).get("mean", np.nan),
+                    "candidate_mean": result.get("candidate_stats", {}).get("mean", np.nan),
+                    "candidate_null_rate": result.get("candidate_stats", {}).get("null_rate", np.nan)
+                })
+            rows.append(json.dumps(row, default=str))
+
+        partition = self.history_dir / f"date={now.date().isoformat()}"
+        partition.mkdir(parents=True, exist_ok=True)
+        with open(partition / "drift.jsonl", 'a') as f:
+            f.write("".join(f"{row}\n" for row in rows))
+
+    def drift_trend(self, feature_name: str, days: int = 30, now: datetime = None) -> pd.DataFrame:
+        """
+        Drift check results for one feature over the last ``days`` days, from the on-disk log.
+
+        Args:
+            feature_name: Feature to query
+            days: Number of days (including today) to read
+            now: Reference time (default: now)
+
+        Returns:
+            One row per check, oldest first (empty if there is no log)
+        """
+        if self.history_dir is None:
+            raise ValueError("drift_trend requires a history_dir")
+
+        today = (now or datetime.now()).date()
+        marker = json.dumps(feature_name)
+        rows = []
+
+        for offset in range(days - 1, -1, -1):
+            path = self.history_dir / f"date={(today - timedelta(days=offset)).isoformat()}" / "drift.jsonl"
+            if not path.exists():
+                continue
+            with open(path, 'r') as f:
+                for line in f:
+                    # Cheap substring test before parsing the line
+                    if marker in line:
+                        row = json.loads(line)
+                        if row["feature"] == feature_name:
+                            rows.append(row)
+
+        trend = pd.DataFrame(rows)
+        if not trend.empty:
+            trend["timestamp"] = pd.to_datetime(trend["timestamp"])
+            trend = trend.sort_values("timestamp", ignore_index=True)
+        return trend
 
     def _calculate_stats(self, series: pd.Series) -> Dict[str, float]:
         """Calculate basic statistics for a feature series."""
@@ -240,6 +751,137 @@ class FeatureDriftDetector:
                 "null_rate": float(series.isnull().mean())
             }
 
+    def ks_from_sketches(self, baseline: FeatureSketch, candidate: FeatureSketch,
+                         feature_name: str = None) -> Dict[str, float]:
+        """
+        KS test on two feature sketches.
+
+        The statistic is the largest CDF gap over the sketches' retained
+        items; the p-value is the asymptotic (Kolmogorov distribution) one.
+
+        Args:
+            baseline: Sketch of historical/reference feature values
+            candidate: Sketch of current feature values
+            feature_name: Name of feature (for threshold lookup)
+
+        Returns:
+            Same keys as kolmogorov_smirnov_test
+        """
+        if baseline.count == 0 or candidate.count == 0:
+            return {
+                "ks_statistic": np.nan,
+                "p_value": np.nan,
+                "drift_detected": False,
+                "error": "Insufficient data after removing nulls"
+            }
+
+        grid = np.union1d(baseline.kll.items, candidate.kll.items)
+        ks_stat = float(np.max(np.abs(baseline.kll.cdf(grid) - candidate.kll.cdf(grid))))
+        p_value = float(_ks_p_values(np.array([ks_stat]), np.array([baseline.count]),
+                                     np.array([candidate.count]))[0])
+
+        threshold = self.drift_thresholds.get(feature_name, self.default_ks_threshold)
+
+        return {
+            "ks_statistic": ks_stat,
+            "p_value": p_value,
+            "drift_detected": ks_stat > threshold,
+            "threshold": threshold,
+            "sample_sizes": {
+                "baseline": baseline.count,
+                "candidate": candidate.count
+            }
+        }
+
+    def psi_from_sketches(self, baseline: FeatureSketch, candidate: FeatureSketch,
+                          bins: int = 10, feature_name: str = None) -> Dict[str, float]:
+        """
+        PSI on two feature sketches.
+
+        Bins are the candidate's fixed histogram bins when it has them (they
+        are cut at the baseline's quantiles), else the baseline's quantiles.
+
+        Args:
+            baseline: Sketch of historical feature values
+            candidate: Sketch of current feature values
+            bins: Number of quantile bins when the candidate has no histogram
+            feature_name: Feature name for threshold lookup
+
+        Returns:
+            Same keys as population_stability_index
+        """
+        if baseline.count == 0 or candidate.count == 0:
+            return {
+                "psi": np.nan,
+                "drift_detected": False,
+                "error": "Insufficient data"
+            }
+
+        if candidate.bin_edges is not None:
+            bin_edges = candidate.bin_edges
+        elif baseline.bin_edges is not None:
+            bin_edges = baseline.bin_edges
+        else:
+            bin_edges = baseline.quantile_edges(bins)
+
+        # Empty bins get a small share so the log ratio stays finite
+        baseline_props = np.maximum(baseline.proportions(bin_edges), 0.001)
+        candidate_props = np.maximum(candidate.proportions(bin_edges), 0.001)
+
+        psi = float(np.sum((candidate_props - baseline_props) * np.log(candidate_props / baseline_props)))
+        threshold = self.drift_thresholds.get(feature_name, self.default_psi_threshold)
+
+        return {
+            "psi": psi,
+            "drift_detected": abs(psi) > threshold,
+            "threshold": threshold,
+            "bin_count": len(bin_edges) + 1,
+            "baseline_entropy": float(stats.entropy(baseline_props)),
+            "candidate_entropy": float(stats.entropy(candidate_props))
+        }
+
+    def detect_drift_from_sketches(self, baseline: Dict[str, FeatureSketch],
+                                   candidate: Dict[str, FeatureSketch],
+                                   feature_columns: List[str] = None) -> Dict[str, Dict]:
+        """
+        Detect drift from per-feature sketches using both KS and PSI tests.
+
+        Args:
+            baseline: Feature name -> baseline sketch
+            candidate: Feature name -> candidate sketch
+            feature_columns: Features to check (default: all sketched on both sides)
+
+        Returns:
+            Results in the same shape as detect_drift
+        """
+        if feature_columns is None:
+            feature_columns = sorted(set(baseline) & set(candidate))
+
+        drift_results = {}
+
+        for feature in feature_columns:
+            if feature not in baseline or feature not in candidate:
+                drift_results[feature] = {
+                    "error": f"Feature '{feature}' missing from one or both sketch sets"
+                }
+                continue
+
+            ks_result = self.ks_from_sketches(baseline[feature], candidate[feature], feature)
+            psi_result = self.psi_from_sketches(baseline[feature], candidate[feature], feature_name=feature)
+
+            drift_results[feature] = {
+                "ks_test": ks_result,
+                "psi_test": psi_result,
+                "drift_detected": ks_result.get("drift_detected", False) or
+                                 psi_result.get("drift_detected", False),
+                "baseline_stats": baseline[feature].stats(),
+                "candidate_stats": candidate[feature].stats()
+            }
+
+        self._record_history(drift_results)
+
+        return drift_results
+
     def generate_drift_report(self, drift_results: Dict[str, Dict],
                             output_format: str = "markdown") -> str:
         """
@@ -478,30 +1120,98 @@ class FeatureDriftDetector:
             raise ValueError("format must be 'json', 'csv', or 'parquet'")
 
 
+class StreamingDriftMonitor:
+    """
+    Continuous drift monitoring in constant memory.
+
+    Keeps one FeatureSketch per feature for the baseline and one for the
+    current (candidate) window, updated as feature values are produced.
+    Candidate histograms use fixed bins cut at the baseline's quantiles, so
+    PSI comes from exact bin counts. Sketches from several monitors (workers,
+    games, days) can be combined with merge().
+    """
+
+    def __init__(self, detector: FeatureDriftDetector = None, bins: int = 10,
+                 k: int = DEFAULT_SKETCH_K):
+        """
+        Args:
+            detector: Detector supplying thresholds and history (default: a new one)
+            bins: Histogram bins per feature
+            k: KLL sketch size (rank error is roughly 1/k)
+        """
+        self.detector = detector or FeatureDriftDetector()
+        self.bins = bins
+        self.k = k
+        self.baseline: Dict[str, FeatureSketch] = {}
+        self.candidate: Dict[str, FeatureSketch] = {}
+        self._lock = threading.Lock()
+
+    def _new_sketch(self, feature_name: str, baseline: bool) -> FeatureSketch:
+        if baseline or feature_name not in self.baseline:
+            return FeatureSketch(k=self.k)
+        return FeatureSketch(self.baseline[feature_name].quantile_edges(self.bins), k=self.k)
+
+    def observe(self, feature_name: str, values, baseline: bool = False) -> None:
+        """Fold a batch of feature values into the baseline or candidate sketch."""
+        if isinstance(values, pd.Series):
+            values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        with self._lock:
+            sketches = self.baseline if baseline else self.candidate
+            if feature_name not in sketches:
+                sketches[feature_name] = self._new_sketch(feature_name, baseline)
+            sketches[feature_name].update(values)
+
+    def observe_frame(self, df: pd.DataFrame, baseline: bool = False) -> None:
+        """Fold every numeric column of a frame into its feature's sketch."""
+        for feature in df.select_dtypes(include=[np.number]).columns:
+            self.observe(feature, df[feature], baseline)
+
+    def merge(self, other: "StreamingDriftMonitor") -> None:
+        """Merge another monitor's sketches (built against the same baseline) into this one."""
+        with self._lock:
+            for sketches, others in ((self.baseline, other.baseline), (self.candidate, other.candidate)):
+                for feature, sketch in others.items():
+                    if feature in sketches:
+                        sketches[feature].merge(sketch)
+                    else:
+                        sketches[feature] = FeatureSketch.from_dict(sketch.to_dict())
+
+    def rotate(self) -> Dict[str, FeatureSketch]:
+        """Start a new candidate window and return the finished one."""
+        with self._lock:
+            finished, self.candidate = self.candidate, {}
+        return finished
+
+    def detect_drift(self, feature_columns: List[str] = None) -> Dict[str, Dict]:
+        """Compare the candidate window against the baseline (see detect_drift_from_sketches)."""
+        with self._lock:
+            return self.detector.detect_drift_from_sketches(self.baseline, self.candidate, feature_columns)
+
+
 def main():
     """CLI entry point for drift detection."""
     import argparse
 
     parser = argparse.ArgumentParser(description="Detect feature drift in Blaze Sports Intelligence")
-    parser.add_argument("baseline", help="Baseline dataset file (CSV/parquet)")
-    parser.add_argument("candidate", help="Candidate dataset file (CSV/parquet)")
+    parser.add_argument("baseline", help="Baseline dataset file (CSV/parquet); the candidate when "
+                                         "scoring against --profile-dir")
+    parser.add_argument("candidate", nargs="?", help="Candidate dataset file (CSV/parquet)")
     parser.add_argument("--features", nargs="+", help="Features to check (default: all numeric)")
     parser.add_argument("--output", help="Output report file", default="drift_report.md")
     parser.add_argument("--format", choices=["markdown", "html"], default="markdown")
     parser.add_argument("--thresholds", help="JSON file with custom drift thresholds")
+    parser.add_argument("--profile-dir", help="Directory of saved baseline profiles")
+    parser.add_argument("--save-profiles", action="store_true",
+                        help="Profile the baseline dataset into --profile-dir and exit")
+    parser.add_argument("--features-dir", default="features",
+                        help="Feature YAMLs (profile versions and drift thresholds)")
+    parser.add_argument("--history-dir", help="Append per-feature results to this date-partitioned drift log")
 
     args = parser.parse_args()
 
-    # Load datasets
-    if args.baseline.endswith('.csv'):
-        baseline_df = pd.read_csv(args.baseline)
-    else:
-        baseline_df = pd.read_parquet(args.baseline)
-
-    if args.candidate.endswith('.csv'):
-        candidate_df = pd.read_csv(args.candidate)
-    else:
-        candidate_df = pd.read_parquet(args.candidate)
+    def load_dataset(path):
+        return pd.read_csv(path) if path.endswith('.csv') else pd.read_parquet(path)
 
     # Load custom thresholds if provided
     thresholds = {}
@@ -509,9 +1219,34 @@ def main():
         with open(args.thresholds, 'r') as f:
             thresholds = json.load(f)
 
-    # Initialize detector and run drift detection
-    detector = FeatureDriftDetector(thresholds)
-    results = detector.detect_drift(baseline_df, candidate_df, args.features)
+    detector = FeatureDriftDetector(thresholds, history_dir=args.history_dir)
+
+    if args.profile_dir:
+        from validator import FeatureValidator
+
+        definitions = {}
+        if Path(args.features_dir).exists():
+            definitions = FeatureValidator(str(Path(args.features_dir) / "schema.json"), args.features_dir).features
+
+        if args.save_profiles:
+            profiles = detector.build_profiles(load_dataset(args.baseline), definitions, args.features)
+            paths = detector.save_profiles(profiles, args.profile_dir)
+            print(f"Saved {len(paths)} baseline profiles to {args.profile_dir}")
+            exit(0)
+
+        # Daily scoring needs only the candidate window
+        profiles = detector.load_profiles(args.profile_dir, {
+            name: int(definition.get("version", 1)) for name, definition in definitions.items()
+        })
+        candidate_df = load_dataset(args.candidate or args.baseline)
+        results = detector.detect_drift_from_profiles(profiles, candidate_df, args.features)
+
+    else:
+        if args.candidate is None:
+            parser.error("candidate dataset required unless --profile-dir is given")
+
+        # Initialize detector and run drift detection
+        results = detector.detect_drift(load_dataset(args.baseline), load_dataset(args.candidate), args.features)
 
     # Generate and save report
     report = detector.generate_drift_report(results, args.format)
@@ -0,0 +1,244 @@
+"""
+Blaze Sports Intelligence Drift Sketches
+
+Constant-memory, mergeable summaries of a feature's value distribution, so
+drift can be monitored continuously without keeping raw values:
+- KLL quantile sketch (approximate CDF / quantiles, rank error ~1/k)
+- Fixed-bin histogram over edges chosen from the baseline
+- Running count / mean / variance / min / max and null count
+
+Sketches built on different workers, games or days merge into one.
+"""
+
+import math
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+
+DEFAULT_SKETCH_K = 512
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch.
+
+    Items on level ``h`` stand for ``2**h`` observations. A level that grows
+    past its capacity is sorted and every other item (random offset) moves
+    up a level, so total weight is preserved exactly and retained items stay
+    O(k) however many values are added.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K, seed: Optional[int] = None):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+        self._sorted = None
+
+    def __len__(self) -> int:
+        """Number of retained items."""
+        return sum(level.size for level in self.levels)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(int(math.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compress(self) -> None:
+        while True:
+            full = [h for h, items in enumerate(self.levels) if items.size > self._capacity(h)]
+            if not full:
+                break
+
+            level = full[0]
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+
+            items = np.sort(self.levels[level])
+            odd = items.size % 2
+            promoted = items[odd:][self._rng.integers(2)::2]
+            self.levels[level] = items[:odd]
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+
+        self._sorted = None
+
+    def update(self, values) -> None:
+        """Add values (NaNs are ignored)."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.n += values.size
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Fold another sketch into this one (in place)."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def _weighted(self):
+        """Retained items in sorted order with their cumulative weights."""
+        if self._sorted is None:
+            items = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(level.size, 2.0 ** h) for h, level in enumerate(self.levels)])
+            order = np.argsort(items, kind="stable")
+            self._sorted = (items[order], np.cumsum(weights[order]))
+        return self._sorted
+
+    @property
+    def items(self) -> np.ndarray:
+        """Retained items, sorted."""
+        return self._weighted()[0]
+
+    def cdf(self, x) -> np.ndarray:
+        """Estimated fraction of observations <= x."""
+        items, cumulative = self._weighted()
+        x = np.asarray(x, dtype=np.float64)
+        if self.n == 0:
+            return np.full(x.shape, np.nan)
+        position = np.searchsorted(items, x, side="right")
+        return np.where(position > 0, cumulative[np.maximum(position - 1, 0)], 0.0) / self.n
+
+    def quantile(self, q) -> np.ndarray:
+        """Estimated quantiles for q in [0, 1]."""
+        items, cumulative = self._weighted()
+        q = np.asarray(q, dtype=np.float64)
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        position = np.searchsorted(cumulative, q * self.n, side="left")
+        return items[np.clip(position, 0, items.size - 1)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form."""
+        return {"k": self.k, "n": self.n, "levels": [level.tolist() for level in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        sketch = cls(k=data["k"])
+        sketch.n = int(data["n"])
+        sketch.levels = [np.asarray(level, dtype=np.float64) for level in data["levels"]] or [np.empty(0)]
+        return sketch
+
+
+class FeatureSketch:
+    """
+    Streaming summary of one feature: KLL sketch, optional fixed-bin
+    histogram and running moments.
+
+    ``bin_edges`` are the interior edges of the histogram (the outer bins
+    are open-ended); bins are right-closed like ``pd.cut``.
+    """
+
+    def __init__(self, bin_edges: Optional[Sequence[float]] = None, k: int = DEFAULT_SKETCH_K,
+                 seed: Optional[int] = None):
+        self.kll = KLLSketch(k, seed)
+        self.bin_edges = None if bin_edges is None else np.unique(np.asarray(bin_edges, dtype=np.float64))
+        self.bin_counts = None if bin_edges is None else np.zeros(self.bin_edges.size + 1, dtype=np.int64)
+
+        self.count = 0
+        self.nulls = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def _merge_moments(self, count: int, mean: float, m2: float, low: float, high: float) -> None:
+        """Chan et al. parallel update of count / mean / M2."""
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+
+    def update(self, values) -> None:
+        """Add a batch of feature values."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        missing = np.isnan(values)
+        self.nulls += int(missing.sum())
+        values = values[~missing]
+        if values.size == 0:
+            return
+
+        self.kll.update(values)
+        if self.bin_counts is not None:
+            self.bin_counts += np.bincount(
+                np.searchsorted(self.bin_edges, values, side="left"), minlength=self.bin_counts.size
+            )
+        mean = values.mean()
+        self._merge_moments(values.size, mean, float(((values - mean) ** 2).sum()), values.min(), values.max())
+
+    def merge(self, other: "FeatureSketch") -> "FeatureSketch":
+        """Fold another sketch into this one (in place)."""
+        self.kll.merge(other.kll)
+        self.nulls += other.nulls
+        if self.bin_counts is not None:
+            if other.bin_counts is None or not np.array_equal(self.bin_edges, other.bin_edges):
+                raise ValueError("Cannot merge histograms with different bin edges")
+            self.bin_counts += other.bin_counts
+        self._merge_moments(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+
+    def quantile_edges(self, bins: int = 10) -> np.ndarray:
+        """Interior edges splitting this distribution into ``bins`` quantile bins."""
+        return np.unique(self.kll.quantile(np.linspace(0, 1, bins + 1)[1:-1]))
+
+    def proportions(self, bin_edges: np.ndarray) -> np.ndarray:
+        """
+        Share of values in each bin of ``bin_edges`` (interior edges).
+
+        Exact when the histogram uses the same edges, else read off the KLL CDF.
+        """
+        if self.bin_edges is not None and np.array_equal(self.bin_edges, bin_edges):
+            return self.bin_counts / max(self.bin_counts.sum(), 1)
+        cdf = np.concatenate([[0.0], self.kll.cdf(bin_edges), [1.0]])
+        return np.diff(cdf)
+
+    def stats(self) -> Dict[str, float]:
+        """Summary statistics in the shape of FeatureDriftDetector._calculate_stats."""
+        total = self.count + self.nulls
+        return {
+            "count": int(self.count),
+            "mean": float(self.mean) if self.count > 0 else np.nan,
+            "std": float(math.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan,
+            "min": float(self.min) if self.count > 0 else np.nan,
+            "max": float(self.max) if self.count > 0 else np.nan,
+            "null_rate": self.nulls / total if total else np.nan
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form."""
+        return {
+            "kll": self.kll.to_dict(),
+            "bin_edges": None if self.bin_edges is None else self.bin_edges.tolist(),
+            "bin_counts": None if self.bin_counts is None else self.bin_counts.tolist(),
+            "count": self.count,
+            "nulls": self.nulls,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeatureSketch":
+        sketch = cls(bin_edges=data["bin_edges"], k=data["kll"]["k"])
+        sketch.kll = KLLSketch.from_dict(data["kll"])
+        if data["bin_counts"] is not None:
+            sketch.bin_counts = np.asarray(data["bin_counts"], dtype=np.int64)
+        sketch.count = int(data["count"])
+        sketch.nulls = int(data["nulls"])
+        sketch.mean = float(data["mean"])
+        sketch.m2 = float(data["m2"])
+        sketch.min = np.inf if data["min"] is None else float(data["min"])
+        sketch.max = -np.inf if data["max"] is None else float(data["max"])
+        return sketch
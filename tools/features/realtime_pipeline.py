@@ -2,8 +2,12 @@
 Blaze Sports Intelligence Real-Time Feature Computation Pipeline
 
 High-performance feature computation system designed to meet <100ms latency requirements:
-- Redis-backed caching for intermediate calculations
+- Redis-backed caching for intermediate calculations, behind an in-process L1
+- Cache entries indexed by feature, game and entity for targeted invalidation
+- Columnar binary requests and float32 results (wire_format)
 - Streaming data processing with asyncio
+- Priority/deadline-aware scheduling by latency class (scheduler)
+- Last-known-value fallback once a request's deadline passes
 - Optimized pandas operations
 - Circuit breaker pattern for reliability
 - Monitoring and metrics collection
@@ -15,47 +19,118 @@ import pandas as pd
 import numpy as np
 import json
 import time
+import struct
 import logging
 from typing import Dict, List, Optional, Callable, Any, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, replace
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from functools import partial
 import warnings
 from pathlib import Path
-import pickle
 import hashlib
+import yaml
+
+from scheduler import DeadlineExceeded, FeatureScheduler
+from wire_format import decode_frame, decode_values, encode_values, frame_rows, is_encoded_frame
 
 # Import our feature implementations
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from features_impl import FEATURE_IMPLEMENTATIONS, compute_feature
+from execution_backends import get_execution_backend
+from local_cache import (
+    DEFAULT_EARLY_REFRESH_BETA, DEFAULT_HARD_TTL_FACTOR, DEFAULT_L1_MAX_BYTES,
+    L1Cache, SingleFlight, hard_ttl, load_cache_ttl, should_refresh
+)
 
 
 @dataclass
 class FeatureRequest:
-    """Request for real-time feature computation."""
+    """Request for real-time feature computation.
+
+    ``input_data`` is either a column dict or a wire_format.encode_frame() payload.
+    ``cache_key`` may be supplied by streaming callers, e.g. ``(game_id, last_event_id)``;
+    otherwise it is filled with the input's content hash on first use.
+    ``stale_key`` scopes the last-known value served when ``timeout_ms`` passes;
+    it defaults to ``game_id``, then ``entity_id``. Unscoped requests get no
+    last-known value and wait for their computation.
+    ``game_id`` / ``entity_id`` file the cached result under those indexes so
+    invalidate_game() / invalidate_entity() can drop exactly those entries.
+    """
     feature_name: str
-    input_data: Dict[str, Any]
+    input_data: Union[Dict[str, Any], bytes]
     request_id: str
     timestamp: datetime
     priority: int = 1  # 1=highest, 3=lowest
     timeout_ms: int = 100
+    cache_key: Optional[Any] = None
+    stale_key: Optional[Any] = None
+    game_id: Optional[Any] = None
+    entity_id: Optional[Any] = None
+
+    @property
+    def stale_scope(self) -> Optional[Any]:
+        """Scope of the last-known value this request may read and refresh."""
+        return stale_scope(self.stale_key, self.game_id, self.entity_id)
+
+    @property
+    def n_rows(self) -> Optional[int]:
+        """Rows in ``input_data`` (None if it cannot be told without decoding)."""
+        try:
+            if is_encoded_frame(self.input_data):
+                return frame_rows(self.input_data)
+            return len(next(iter(self.input_data.values())))
+        except Exception:
+            return None
+
+
+def stale_scope(stale_key: Any = None, game_id: Any = None, entity_id: Any = None) -> Optional[Any]:
+    """``stale_key``, else ``game_id``, else ``entity_id`` (None if all are unset)."""
+    for scope in (stale_key, game_id, entity_id):
+        if scope is not None:
+            return scope
+    return None
 
 
 @dataclass
 class FeatureResponse:
-    """Response from feature computation."""
+    """Response from feature computation (values are a float32 array).
+
+    ``stale`` responses carry the last known value, ``age_seconds`` old,
+    because the fresh computation missed the deadline.
+    """
     request_id: str
     feature_name: str
-    values: List[float]
+    values: np.ndarray
     computation_time_ms: float
     cache_hit: bool
     error: Optional[str] = None
     timestamp: datetime = None
+    stale: bool = False
+    age_seconds: Optional[float] = None
 
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now()
+        self.values = np.asarray(self.values, dtype=np.float32)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the response."""
+        data = asdict(self)
+        data["values"] = self.values.tolist()
+        return data
+
+
+@dataclass
+class CacheWrite:
+    """One feature result to cache, with the indexes it is filed under."""
+    key: str
+    values: np.ndarray
+    feature_name: str
+    last_key: Optional[str] = None  # also record as the last-known value (see make_last_key)
+    compute_seconds: float = 0.0
+    game_id: Optional[Any] = None
+    entity_id: Optional[Any] = None
 
 
 class CircuitBreaker:
@@ -95,57 +170,361 @@ class CircuitBreaker:
 
 
 class FeatureCache:
-    """Redis-backed feature caching system."""
-
-    def __init__(self, redis_client: redis.Redis, ttl_seconds: int = 300):
+    """
+    Redis-backed feature caching system with an in-process L1 tier in front.
+
+    Entries carry a soft TTL next to the storage (hard) TTL. Past the soft
+    TTL - or a little before it, by probabilistic early expiration - a read
+    still returns the value but reports that a refresh is due.
+
+    Every entry is also filed in per-feature (and, when known, per-game and
+    per-entity) index sorted sets scored by expiry, so invalidation touches
+    only the affected keys instead of scanning the keyspace.
+    """
+
+    # Entry header: magic, soft expiry (epoch seconds), compute time (seconds)
+    ENTRY_MAGIC = b"BLZE"
+    _ENTRY_HEADER = struct.Struct("<4sdd")
+
+    def __init__(self, redis_client: redis.Redis, ttl_seconds: int = None,
+                 l1_max_bytes: int = DEFAULT_L1_MAX_BYTES, stale_ttl_seconds: int = None,
+                 hard_ttl_factor: float = DEFAULT_HARD_TTL_FACTOR,
+                 early_refresh_beta: float = DEFAULT_EARLY_REFRESH_BETA, l1_ttl_seconds: int = None):
+        """
+        Args:
+            redis_client: Redis (L2) client
+            ttl_seconds: Soft entry TTL; defaults to the ``features`` tier in analytics_config.yaml
+            l1_max_bytes: Byte budget of the process-local L1 (0 disables it)
+            stale_ttl_seconds: How long last-known values stay available as a
+                deadline fallback; defaults to the ``stale_features`` tier
+            hard_ttl_factor: Entries are stored for this multiple of the soft TTL
+            early_refresh_beta: Eagerness of probabilistic early refresh (0 disables it)
+            l1_ttl_seconds: Longest an entry stays in the L1. Invalidation
+                only clears this process's L1, so other workers may serve an
+                invalidated entry for up to this long; defaults to the
+                ``l1_features`` tier
+        """
+        cache_ttl = load_cache_ttl() if None in (ttl_seconds, stale_ttl_seconds, l1_ttl_seconds) else {}
         self.redis_client = redis_client
-        self.ttl_seconds = ttl_seconds
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else cache_ttl['features']
+        self.hard_ttl_seconds = hard_ttl(self.ttl_seconds, hard_ttl_factor)
+        self.stale_ttl_seconds = stale_ttl_seconds if stale_ttl_seconds is not None else cache_ttl['stale_features']
+        self.early_refresh_beta = early_refresh_beta
+        self.l1_ttl_seconds = l1_ttl_seconds if l1_ttl_seconds is not None else cache_ttl['l1_features']
+        self.l1 = L1Cache(l1_max_bytes, self.hard_ttl_seconds, self.l1_ttl_seconds) if l1_max_bytes else None
+
+    @staticmethod
+    def content_hash(input_data: Union[Dict[str, Any], bytes]) -> str:
+        """
+        Content hash of the input's column buffers.
+
+        Columnar payloads are hashed as-is (their header carries names and
+        dtypes). Dict inputs hash each column's length-prefixed name, its
+        dtype and shape, and its raw NumPy bytes, so no two inputs share a
+        byte stream; object columns go through pandas' vectorized element hash.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+
+        def update_framed(data: bytes) -> None:
+            hasher.update(len(data).to_bytes(8, 'little'))
+            hasher.update(data)
 
-    def _generate_key(self, feature_name: str, input_data: Dict[str, Any]) -> str:
+        if is_encoded_frame(input_data):
+            hasher.update(input_data)
+        else:
+            for name in sorted(input_data):
+                values = np.atleast_1d(np.asarray(input_data[name]))
+                shape, dtype = values.shape, values.dtype.str
+                if values.dtype == object:
+                    values = pd.util.hash_array(values.ravel())
+                update_framed(str(name).encode())
+                update_framed(f"{dtype}{shape}".encode())
+                hasher.update(np.ascontiguousarray(values))
+
+        return hasher.hexdigest()
+
+    @staticmethod
+    def make_key(feature_name: str, cache_key: Any) -> str:
+        """Redis key for a content hash or caller-supplied key (tuples are joined)."""
+        if isinstance(cache_key, (tuple, list)):
+            cache_key = ":".join(str(part) for part in cache_key)
+        return f"feature:{feature_name}:{cache_key}"
+
+    @staticmethod
+    def make_last_key(feature_name: str, stale_key: Any = None) -> Optional[str]:
+        """
+        Redis key of a feature's last-known value within ``stale_key`` (a game,
+        entity, ...). None without a scope: values are never shared across scopes.
+        """
+        if stale_key is None:
+            return None
+        if isinstance(stale_key, (tuple, list)):
+            stale_key = ":".join(str(part) for part in stale_key)
+        return f"feature_last:{feature_name}:{stale_key}"
+
+    @staticmethod
+    def index_key(kind: str, value: Any) -> str:
+        """Redis key of an entry index ("feature", "game" or "entity")."""
+        if isinstance(value, (tuple, list)):
+            value = ":".join(str(part) for part in value)
+        return f"feature_idx:{kind}:{value}"
+
+    @staticmethod
+    def _stamped(payload: bytes) -> bytes:
+        """Prefix a payload with its write time (little-endian float64 epoch seconds)."""
+        return struct.pack("<d", time.time()) + payload
+
+    def _entry(self, payload: bytes, compute_seconds: float) -> bytes:
+        """Prefix a value payload with its soft expiry and compute time."""
+        return self._ENTRY_HEADER.pack(self.ENTRY_MAGIC, time.time() + self.ttl_seconds, compute_seconds) + payload
+
+    def _read_entry(self, cached_data: bytes) -> tuple:
+        """``(values, refresh_due, hard_ttl_left)`` of a stored entry."""
+        if bytes(cached_data[:4]) != self.ENTRY_MAGIC:
+            # Entries written before soft TTLs: plain values, never refreshed early
+            return decode_values(cached_data), False, self.ttl_seconds
+
+        _, soft_expires_at, compute_seconds = self._ENTRY_HEADER.unpack_from(cached_data)
+        values = decode_values(memoryview(cached_data)[self._ENTRY_HEADER.size:])
+        refresh_due = should_refresh(soft_expires_at, compute_seconds, self.early_refresh_beta)
+        hard_ttl_left = soft_expires_at + self.hard_ttl_seconds - self.ttl_seconds - time.time()
+        return values, refresh_due, hard_ttl_left
+
+    def _generate_key(self, feature_name: str, input_data: Union[Dict[str, Any], bytes]) -> str:
         """Generate cache key from feature name and input data."""
-        # Create hash of input data for consistent keying
-        data_str = json.dumps(input_data, sort_keys=True, default=str)
-        data_hash = hashlib.md5(data_str.encode()).hexdigest()
-        return f"feature:{feature_name}:{data_hash}"
+        return self.make_key(feature_name, self.content_hash(input_data))
+
+    def lookup(self, key: str) -> Optional[tuple]:
+        """
+        Cached ``(values, refresh_due)`` for a key, or None on a miss.
 
-    def get(self, feature_name: str, input_data: Dict[str, Any]) -> Optional[List[float]]:
-        """Retrieve cached feature values."""
+        The L1 is consulted first; Redis hits are promoted into it for the
+        rest of their hard TTL, capped at ``l1_ttl_seconds``. Content-hash
+        keys always name the same inputs, but caller-supplied cache keys and
+        invalidations can change what Redis holds: an L1 copy may lag Redis
+        for up to ``l1_ttl_seconds`` when another process changed it.
+        """
         try:
-            key = self._generate_key(feature_name, input_data)
+            if self.l1 is not None:
+                cached_data = self.l1.get(key)
+                if cached_data is not None:
+                    return self._read_entry(cached_data)[:2]
+
             cached_data = self.redis_client.get(key)
 
-            if cached_data:
-                return pickle.loads(cached_data)
+            if cached_data is not None:
+                values, refresh_due, hard_ttl_left = self._read_entry(cached_data)
+                if self.l1 is not None:
+                    self.l1.set(key, cached_data, hard_ttl_left)
+                return values, refresh_due
         except Exception as e:
             logging.warning(f"Cache get error: {e}")
 
         return None
 
-    def set(self, feature_name: str, input_data: Dict[str, Any], values: List[float]) -> None:
-        """Store feature values in cache."""
+    def get(self, feature_name: str, input_data: Union[Dict[str, Any], bytes] = None,
+            key: Optional[str] = None) -> Optional[np.ndarray]:
+        """Retrieve cached feature values (raw float32 buffer); pass ``key`` to skip hashing."""
+        entry = self.lookup(key or self._generate_key(feature_name, input_data))
+        return entry[0] if entry is not None else None
+
+    def set(self, feature_name: str, input_data: Union[Dict[str, Any], bytes], values,
+            key: Optional[str] = None, stale_key: Any = None, compute_seconds: float = 0.0,
+            game_id: Any = None, entity_id: Any = None) -> None:
+        """
+        Store feature values in both tiers; pass ``key`` to skip hashing.
+
+        The feature's last-known value (scoped by ``stale_key``, else
+        ``game_id``, else ``entity_id``) is refreshed in the same pipelined flush. ``compute_seconds`` (how long the values
+        took) sets how early readers start refreshing the entry.
+        """
+        self.set_many([CacheWrite(
+            key=key or self._generate_key(feature_name, input_data),
+            values=values,
+            feature_name=feature_name,
+            last_key=self.make_last_key(feature_name, stale_scope(stale_key, game_id, entity_id)),
+            compute_seconds=compute_seconds,
+            game_id=game_id,
+            entity_id=entity_id
+        )])
+
+    def lookup_many(self, keys: List[str]) -> List[Optional[tuple]]:
+        """
+        Cached ``(values, refresh_due)`` for several keys: L1 first, then a
+        single MGET for the rest.
+
+        Returns a list aligned with ``keys`` (None for misses).
+        """
+        entries: List[Optional[tuple]] = [None] * len(keys)
+        missing = []
+        for i, key in enumerate(keys):
+            cached_data = self.l1.get(key) if self.l1 is not None else None
+            if cached_data is not None:
+                entries[i] = self._read_entry(cached_data)[:2]
+            else:
+                missing.append(i)
+
+        if missing:
+            try:
+                fetched = self.redis_client.mget([keys[i] for i in missing])
+                for i, cached_data in zip(missing, fetched):
+                    if cached_data is not None:
+                        values, refresh_due, hard_ttl_left = self._read_entry(cached_data)
+                        if self.l1 is not None:
+                            self.l1.set(keys[i], cached_data, hard_ttl_left)
+                        entries[i] = (values, refresh_due)
+            except Exception as e:
+                logging.warning(f"Cache mget error: {e}")
+
+        return entries
+
+    def get_many(self, keys: List[str]) -> List[Optional[np.ndarray]]:
+        """Cached values for several keys, aligned with ``keys`` (None for misses)."""
+        return [entry[0] if entry is not None else None for entry in self.lookup_many(keys)]
+
+    def set_many(self, items: List[CacheWrite]) -> None:
+        """
+        Store several results in both tiers, and file them in their indexes,
+        with one pipelined flush.
+        """
+        if not items:
+            return
         try:
-            key = self._generate_key(feature_name, input_data)
-            cached_data = pickle.dumps(values)
-            self.redis_client.setex(key, self.ttl_seconds, cached_data)
+            now = time.time()
+            indexes = set()
+            pipe = self.redis_client.pipeline(transaction=False)
+            for item in items:
+                payload = encode_values(item.values)
+                entry = self._entry(payload, item.compute_seconds)
+                if self.l1 is not None:
+                    self.l1.set(item.key, entry, self.hard_ttl_seconds)
+                pipe.setex(item.key, self.hard_ttl_seconds, entry)
+
+                for kind, value in (("feature", item.feature_name), ("game", item.game_id),
+                                    ("entity", item.entity_id)):
+                    if value is not None:
+                        index_key = self.index_key(kind, value)
+                        pipe.zadd(index_key, {item.key: now + self.hard_ttl_seconds})
+                        indexes.add(index_key)
+
+                # Last-known values only enter the L1 once a fallback has read them.
+                # They survive new game events, so only the feature index lists them.
+                if item.last_key is not None:
+                    stamped = self._stamped(payload)
+                    if self.l1 is not None and item.last_key in self.l1:
+                        self.l1.set(item.last_key, stamped, self.stale_ttl_seconds)
+                    pipe.setex(item.last_key, self.stale_ttl_seconds, stamped)
+                    pipe.zadd(self.index_key("feature", item.feature_name),
+                              {item.last_key: now + self.stale_ttl_seconds})
+
+            # Members are scored by expiry, so each index only holds live keys
+            for index_key in indexes:
+                pipe.zremrangebyscore(index_key, "-inf", now)
+                pipe.expire(index_key, max(self.hard_ttl_seconds, self.stale_ttl_seconds))
+            pipe.execute()
         except Exception as e:
             logging.warning(f"Cache set error: {e}")
 
-    def invalidate_pattern(self, pattern: str) -> int:
-        """Invalidate cache entries matching pattern."""
+    def get_stale(self, feature_name: str, stale_key: Any = None,
+                  n_rows: Optional[int] = None) -> Optional[tuple]:
+        """
+        Last-known values of a feature within ``stale_key`` as
+        ``(values, age_seconds)``, or None.
+
+        Unlike get(), this ignores the input: it is the fallback served when
+        a fresh computation cannot finish in time. There is none without a
+        scope, nor when its length differs from ``n_rows``.
+        """
+        last_key = self.make_last_key(feature_name, stale_key)
+        if last_key is None:
+            return None
+        try:
+            stamped = self.l1.get(last_key) if self.l1 is not None else None
+            if stamped is None:
+                stamped = self.redis_client.get(last_key)
+                if stamped is not None and self.l1 is not None:
+                    self.l1.set(last_key, stamped, self.stale_ttl_seconds)
+
+            if stamped is not None:
+                (written_at,) = struct.unpack_from("<d", stamped)
+                values = decode_values(memoryview(stamped)[8:])
+                if n_rows is None or len(values) == n_rows:
+                    return values, max(time.time() - written_at, 0.0)
+        except Exception as e:
+            logging.warning(f"Cache stale get error: {e}")
+
+        return None
+
+    def invalidate_index(self, kind: str, value: Any) -> int:
+        """
+        Invalidate the entries filed under one index ("feature", "game" or
+        "entity"), in O(entries in that index).
+        """
+        return self.invalidate_indexes(kind, [value])
+
+    def invalidate_indexes(self, kind: str, values: List[Any]) -> int:
+        """
+        Invalidate the entries filed under several indexes of one kind in two
+        round trips however many there are: one pipelined ZRANGE per index,
+        then a single DEL. Returns the number of entries deleted.
+        """
+        index_keys = [self.index_key(kind, value) for value in dict.fromkeys(values)]
+        if not index_keys:
+            return 0
         try:
-            keys = self.redis_client.keys(pattern)
+            pipe = self.redis_client.pipeline(transaction=False)
+            for index_key in index_keys:
+                pipe.zrange(index_key, 0, -1)
+            members = pipe.execute()
+
+            keys = list(dict.fromkeys(key.decode() if isinstance(key, bytes) else key
+                                      for entries in members for key in entries))
+            if self.l1 is not None and keys:
+                self.l1.delete(*keys)
             if keys:
-                return self.redis_client.delete(*keys)
+                # Every non-empty index key is deleted too
+                return self.redis_client.delete(*keys, *index_keys) - sum(1 for entries in members if entries)
         except Exception as e:
             logging.warning(f"Cache invalidation error: {e}")
         return 0
 
+    def invalidate_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Invalidate cache entries matching pattern (L1 and Redis).
+
+        Uses incremental SCAN rather than KEYS, so Redis is never blocked
+        for a full keyspace walk; prefer invalidate_index() where possible.
+        Like invalidate_indexes(), returns the number of keys deleted from
+        Redis (L1 entries are copies of those and are not counted).
+        """
+        if self.l1 is not None:
+            self.l1.invalidate(pattern)
+        deleted = 0
+        try:
+            batch = []
+            for key in self.redis_client.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += self.redis_client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis_client.delete(*batch)
+        except Exception as e:
+            logging.warning(f"Cache invalidation error: {e}")
+        return deleted
+
+    def l1_stats(self) -> Dict[str, Any]:
+        """L1 hit/miss/eviction counters (empty when the L1 is disabled)."""
+        return self.l1.stats() if self.l1 is not None else {}
+
 
 class RealTimeFeaturePipeline:
     """Main real-time feature computation pipeline."""
 
     def __init__(self, redis_host: str = "localhost", redis_port: int = 6379,
-                 max_workers: int = 4, cache_ttl: int = 300):
+                 max_workers: int = 4, cache_ttl: int = None,
+                 l1_max_bytes: int = DEFAULT_L1_MAX_BYTES, execution_backend: str = "thread",
+                 drift_monitor=None):
         """
         Initialize pipeline.
 
@@ -153,21 +532,33 @@ class RealTimeFeaturePipeline:
             redis_host: Redis server hostname
             redis_port: Redis server port
             max_workers: Maximum worker threads
-            cache_ttl: Cache TTL in seconds
+            cache_ttl: Cache TTL in seconds (default: ``features`` tier of analytics_config.yaml)
+            l1_max_bytes: Byte budget of the in-process L1 cache (0 disables it)
+            execution_backend: "thread" or "process" (persistent workers reading the
+                input frame from shared memory) for the feature computation itself
+            drift_monitor: Optional drift_detector.StreamingDriftMonitor fed with
+                every computed feature's values
         """
         # Redis setup
         self.redis_client = redis.Redis(
             host=redis_host, port=redis_port, decode_responses=False,
             socket_connect_timeout=1, socket_timeout=1
         )
-        self.cache = FeatureCache(self.redis_client, cache_ttl)
+        self.cache = FeatureCache(self.redis_client, cache_ttl, l1_max_bytes)
 
-        # Threading
+        # Threading (computations run here so callers can stop waiting at their deadline)
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.backend = get_execution_backend(execution_backend, max_workers)
+        self.drift_monitor = drift_monitor
 
         # Circuit breakers per feature
         self.circuit_breakers = {}
 
+        # Concurrent misses on one cache key share a single computation,
+        # and entries due for refresh are recomputed by one background task
+        self.inflight = SingleFlight()
+        self.refreshing = SingleFlight()
+
         # Metrics
         self.metrics = {
             "requests_total": 0,
@@ -175,6 +566,9 @@ class RealTimeFeaturePipeline:
             "requests_error": 0,
             "cache_hits": 0,
             "cache_misses": 0,
+            "requests_coalesced": 0,
+            "stale_responses": 0,
+            "background_refreshes": 0,
             "avg_latency_ms": 0.0,
             "feature_counts": {},
             "error_counts": {}
@@ -188,16 +582,28 @@ class RealTimeFeaturePipeline:
         self.logger = logging.getLogger(__name__)
 
         # Pre-warm cache with feature registry
+        self.feature_registry = {}
         self._load_feature_registry()
 
+        # Async work is queued by latency class and priority, with deadline-aware admission
+        self.scheduler = FeatureScheduler(max_workers, {
+            name: definition.get("latency_requirement", "batch")
+            for name, definition in self.feature_registry.items()
+        })
+
     def _load_feature_registry(self) -> None:
-        """Load and cache feature definitions."""
+        """Load feature definitions (latency requirements etc.) from the YAML specs."""
         try:
             features_dir = Path("features")
+            if not features_dir.exists():
+                features_dir = Path(__file__).parent.parent.parent / "features"
             if features_dir.exists():
                 self.logger.info(f"Loading feature registry from {features_dir}")
-                # Store feature metadata in Redis for quick access
                 for yaml_file in features_dir.glob("*.yaml"):
+                    with open(yaml_file, 'r') as f:
+                        for definition in yaml.safe_load_all(f):
+                            if definition and "name" in definition:
+                                self.feature_registry[definition["name"]] = definition
                     self.logger.info(f"Loaded features from {yaml_file}")
         except Exception as e:
             self.logger.warning(f"Failed to load feature registry: {e}")
@@ -261,54 +667,159 @@ class RealTimeFeaturePipeline:
 
         return df
 
-    def _compute_feature_sync(self, request: FeatureRequest) -> FeatureResponse:
-        """Synchronously compute a single feature."""
+    def _cache_key(self, request: FeatureRequest) -> str:
+        """Cache key for a request, hashing its input at most once."""
+        if request.cache_key is None:
+            request.cache_key = self.cache.content_hash(request.input_data)
+        return self.cache.make_key(request.feature_name, request.cache_key)
+
+    def _cache_write(self, request: FeatureRequest, cache_key: str, values: np.ndarray,
+                     compute_seconds: float) -> CacheWrite:
+        """Cache write for a computed request, filed under its feature/game/entity indexes."""
+        return CacheWrite(
+            key=cache_key,
+            values=values,
+            feature_name=request.feature_name,
+            last_key=self.cache.make_last_key(request.feature_name, request.stale_scope),
+            compute_seconds=compute_seconds,
+            game_id=request.game_id,
+            entity_id=request.entity_id
+        )
+
+    def _circuit_open_response(self, request: FeatureRequest) -> FeatureResponse:
+        """Error response for a feature whose circuit breaker is open."""
+        return FeatureResponse(
+            request_id=request.request_id,
+            feature_name=request.feature_name,
+            values=np.empty(0, dtype=np.float32),
+            computation_time_ms=0,
+            cache_hit=False,
+            error="Circuit breaker OPEN"
+        )
+
+    def _invalid_input_response(self, request: FeatureRequest, error: Exception,
+                                start_time: float) -> FeatureResponse:
+        """Error response for a request whose input cannot be hashed (e.g. ragged columns)."""
+        computation_time = (time.time() - start_time) * 1000
+        error_msg = f"Invalid input: {error}"
+        self._update_metrics(request.feature_name, computation_time, False, False, error_msg)
+
+        self.logger.warning(f"Feature {request.feature_name} rejected: {error_msg}")
+
+        return FeatureResponse(
+            request_id=request.request_id,
+            feature_name=request.feature_name,
+            values=np.empty(0, dtype=np.float32),
+            computation_time_ms=computation_time,
+            cache_hit=False,
+            error=error_msg
+        )
+
+    def _cache_hit_response(self, request: FeatureRequest, cached_values: np.ndarray,
+                            start_time: float) -> FeatureResponse:
+        """Response (and metrics) for a request served from cache."""
+        computation_time = (time.time() - start_time) * 1000
+        self._get_circuit_breaker(request.feature_name).record_success()
+
+        self._update_metrics(request.feature_name, computation_time, True, True)
+
+        return FeatureResponse(
+            request_id=request.request_id,
+            feature_name=request.feature_name,
+            values=cached_values,
+            computation_time_ms=computation_time,
+            cache_hit=True
+        )
+
+    def _compute_feature_sync(self, request: FeatureRequest, check_cache: bool = True,
+                              write_cache: bool = True) -> FeatureResponse:
+        """
+        Synchronously compute a single feature.
+
+        Batch callers pass ``check_cache=False, write_cache=False`` and do the
+        cache round trips for the whole batch themselves.
+        """
         start_time = time.time()
 
         # Check circuit breaker
         circuit_breaker = self._get_circuit_breaker(request.feature_name)
         if not circuit_breaker.can_execute():
-            return FeatureResponse(
-                request_id=request.request_id,
-                feature_name=request.feature_name,
-                values=[],
-                computation_time_ms=0,
-                cache_hit=False,
-                error="Circuit breaker OPEN"
-            )
+            return self._circuit_open_response(request)
 
         # Check cache first
-        cached_values = self.cache.get(request.feature_name, request.input_data)
-        if cached_values is not None:
-            computation_time = (time.time() - start_time) * 1000
-            circuit_breaker.record_success()
-
-            self._update_metrics(request.feature_name, computation_time, True, True)
-
-            return FeatureResponse(
-                request_id=request.request_id,
-                feature_name=request.feature_name,
-                values=cached_values,
-                computation_time_ms=computation_time,
-                cache_hit=True
-            )
+        try:
+            cache_key = self._cache_key(request)
+        except Exception as e:
+            return self._invalid_input_response(request, e, start_time)
+        if check_cache:
+            entry = self.cache.lookup(cache_key)
+            if entry is not None:
+                cached_values, refresh_due = entry
+                if refresh_due:
+                    self._schedule_refresh(request, cache_key)
+                return self._cache_hit_response(request, cached_values, start_time)
+
+        # Identical concurrent misses share one computation, run on the executor
+        future, leader = self.inflight.submit(cache_key, lambda: self.executor.submit(
+            self._compute_uncached, request, cache_key, start_time, write_cache
+        ))
 
+        remaining_ms = request.timeout_ms - (datetime.now() - request.timestamp).total_seconds() * 1000
         try:
-            # Convert input data to DataFrame
+            response = future.result(timeout=max(remaining_ms, 0) / 1000)
+        except FuturesTimeout:
+            # Past the deadline: serve the last known value while the computation finishes
+            stale = self._get_stale(request)
+            if stale is not None:
+                if not write_cache:
+                    future.add_done_callback(partial(self._cache_late_result, request, cache_key))
+                return self._stale_response(request, *stale, start_time)
+            response = future.result()
+
+        if leader:
+            return response
+
+        computation_time = (time.time() - start_time) * 1000
+        self.metrics["requests_coalesced"] += 1
+        self._update_metrics(request.feature_name, computation_time, response.error is None, False,
+                             response.error)
+
+        return replace(response, request_id=request.request_id, computation_time_ms=computation_time)
+
+    def _compute_values(self, request: FeatureRequest) -> np.ndarray:
+        """Decode the request's input and compute the feature as a float32 array."""
+        # Columnar payloads decode straight into typed column buffers
+        if is_encoded_frame(request.input_data):
+            df = decode_frame(request.input_data)
+        else:
             df = pd.DataFrame(request.input_data)
             df = self._optimize_dataframe(df)
 
-            # Compute feature
-            result = compute_feature(request.feature_name, df)
+        # Compute feature
+        result = self.backend.compute(request.feature_name, df)
 
-            # Convert to list for JSON serialization
-            if isinstance(result, pd.Series):
-                values = result.fillna(0.0).tolist()
-            else:
-                values = [float(result)] if np.isscalar(result) else list(result)
+        # Results travel and are cached as float32 arrays
+        if isinstance(result, pd.Series):
+            values = result.fillna(0.0).to_numpy(dtype=np.float32)
+        else:
+            values = np.atleast_1d(np.asarray(result, dtype=np.float32))
+
+        if self.drift_monitor is not None:
+            self.drift_monitor.observe(request.feature_name, values)
+        return values
+
+    def _compute_uncached(self, request: FeatureRequest, cache_key: str, start_time: float,
+                          write_cache: bool = True) -> FeatureResponse:
+        """Compute a feature after a cache miss, recording the outcome on its circuit breaker."""
+        circuit_breaker = self._get_circuit_breaker(request.feature_name)
+
+        try:
+            compute_start = time.time()
+            values = self._compute_values(request)
 
             # Cache result
-            self.cache.set(request.feature_name, request.input_data, values)
+            if write_cache:
+                self.cache.set_many([self._cache_write(request, cache_key, values, time.time() - compute_start)])
 
             computation_time = (time.time() - start_time) * 1000
 
@@ -342,41 +853,183 @@ class RealTimeFeaturePipeline:
             return FeatureResponse(
                 request_id=request.request_id,
                 feature_name=request.feature_name,
-                values=[],
+                values=np.empty(0, dtype=np.float32),
                 computation_time_ms=computation_time,
                 cache_hit=False,
                 error=error_msg
             )
 
+    def _schedule_refresh(self, request: FeatureRequest, cache_key: str) -> None:
+        """Recompute an entry due for refresh in the background (one task per key)."""
+        self.refreshing.submit(cache_key, lambda: self.executor.submit(self._refresh, request, cache_key))
+
+    def _refresh(self, request: FeatureRequest, cache_key: str) -> None:
+        """Stale-while-revalidate: rewrite a cached entry while readers keep using the old one."""
+        start = time.time()
+        try:
+            values = self._compute_values(request)
+        except Exception as e:
+            self.logger.warning(f"Background refresh of {request.feature_name} failed: {e}")
+            return
+
+        self.cache.set_many([self._cache_write(request, cache_key, values, time.time() - start)])
+        self.metrics["background_refreshes"] += 1
+
+    def _get_stale(self, request: FeatureRequest) -> Optional[tuple]:
+        """Last-known value a request may fall back to: same scope, same row count."""
+        return self.cache.get_stale(request.feature_name, request.stale_scope, request.n_rows)
+
+    def _stale_response(self, request: FeatureRequest, values: np.ndarray, age_seconds: float,
+                        start_time: float) -> FeatureResponse:
+        """
+        Response carrying a last-known value after the deadline passed.
+
+        The fresh computation (if any) is still recorded in the request
+        metrics when it completes; stale responses are only counted.
+        """
+        computation_time = (time.time() - start_time) * 1000
+        self.metrics["stale_responses"] += 1
+
+        self.logger.warning(
+            f"Feature {request.feature_name} missed its {request.timeout_ms}ms deadline; "
+            f"serving value from {age_seconds:.1f}s ago"
+        )
+
+        return FeatureResponse(
+            request_id=request.request_id,
+            feature_name=request.feature_name,
+            values=values,
+            computation_time_ms=computation_time,
+            cache_hit=True,
+            stale=True,
+            age_seconds=age_seconds
+        )
+
+    def _cache_late_result(self, request: FeatureRequest, cache_key: str, future) -> None:
+        """Cache a computation that finished after its caller was served a stale value."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        response = future.result()
+        if response.error is None:
+            self.cache.set_many([self._cache_write(
+                request, cache_key, response.values, response.computation_time_ms / 1000
+            )])
+
+    def _deadline_response(self, request: FeatureRequest, error: DeadlineExceeded) -> FeatureResponse:
+        """Error response for work the scheduler rejected or expired (stale value if one exists)."""
+        stale = self._get_stale(request)
+        if stale is not None:
+            return self._stale_response(request, *stale, request.timestamp.timestamp())
+
+        computation_time = (datetime.now() - request.timestamp).total_seconds() * 1000
+        self._update_metrics(request.feature_name, computation_time, False, False, str(error))
+
+        self.logger.warning(
+            f"Feature {request.feature_name} dropped: {error} "
+            f"(priority {request.priority}, timeout: {request.timeout_ms}ms)"
+        )
+
+        return FeatureResponse(
+            request_id=request.request_id,
+            feature_name=request.feature_name,
+            values=np.empty(0, dtype=np.float32),
+            computation_time_ms=computation_time,
+            cache_hit=False,
+            error=str(error)
+        )
+
+    async def _run_scheduled(self, request: FeatureRequest, **compute_kwargs) -> FeatureResponse:
+        """Run _compute_feature_sync through the scheduler with the request's remaining budget."""
+        elapsed_ms = (datetime.now() - request.timestamp).total_seconds() * 1000
+        future = self.scheduler.submit(
+            partial(self._compute_feature_sync, request, **compute_kwargs),
+            request.feature_name,
+            priority=request.priority,
+            budget_ms=request.timeout_ms - elapsed_ms
+        )
+        try:
+            return await asyncio.wrap_future(future)
+        except DeadlineExceeded as e:
+            return self._deadline_response(request, e)
+
     async def compute_feature_async(self, request: FeatureRequest) -> FeatureResponse:
         """Asynchronously compute a single feature."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, self._compute_feature_sync, request)
+        return await self._run_scheduled(request)
 
     async def compute_features_batch(self, requests: List[FeatureRequest]) -> List[FeatureResponse]:
-        """Compute multiple features concurrently."""
-        tasks = [self.compute_feature_async(request) for request in requests]
+        """
+        Compute multiple features concurrently.
+
+        Cache access is batch-level: one MGET for every key in the batch and
+        one pipelined SETEX flush for the computed results.
+        """
+        start_time = time.time()
+
+        results: List[Optional[FeatureResponse]] = [None] * len(requests)
+
+        # Requests sharing one input payload share its content hash; an input
+        # that cannot be hashed only fails its own request
+        content_hashes = {}
+        keys: Dict[int, str] = {}
+        for i, request in enumerate(requests):
+            try:
+                if request.cache_key is None:
+                    input_id = id(request.input_data)
+                    if input_id not in content_hashes:
+                        content_hashes[input_id] = self.cache.content_hash(request.input_data)
+                    request.cache_key = content_hashes[input_id]
+                keys[i] = self._cache_key(request)
+            except Exception as e:
+                results[i] = self._invalid_input_response(request, e, start_time)
+
+        cached = self.cache.lookup_many(list(keys.values()))
+
+        pending = []
+        for (i, key), entry in zip(keys.items(), cached):
+            request = requests[i]
+            if not self._get_circuit_breaker(request.feature_name).can_execute():
+                results[i] = self._circuit_open_response(request)
+            elif entry is not None:
+                cached_values, refresh_due = entry
+                if refresh_due:
+                    self._schedule_refresh(request, key)
+                results[i] = self._cache_hit_response(request, cached_values, start_time)
+            else:
+                pending.append(i)
+
+        tasks = [
+            self._run_scheduled(requests[i], check_cache=False, write_cache=False)
+            for i in pending
+        ]
         responses = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Handle any exceptions
-        results = []
-        for i, response in enumerate(responses):
+        computed = []
+        for i, response in zip(pending, responses):
             if isinstance(response, Exception):
-                results.append(FeatureResponse(
+                results[i] = FeatureResponse(
                     request_id=requests[i].request_id,
                     feature_name=requests[i].feature_name,
-                    values=[],
+                    values=np.empty(0, dtype=np.float32),
                     computation_time_ms=0,
                     cache_hit=False,
                     error=f"Async execution error: {str(response)}"
-                ))
+                )
             else:
-                results.append(response)
+                results[i] = response
+                if response.error is None and not response.stale:
+                    computed.append(self._cache_write(
+                        requests[i], keys[i], response.values, response.computation_time_ms / 1000
+                    ))
+
+        self.cache.set_many(computed)
 
         return results
 
-    def compute_feature_sync(self, feature_name: str, input_data: Dict[str, Any],
-                           request_id: str = None, timeout_ms: int = 100) -> FeatureResponse:
+    def compute_feature_sync(self, feature_name: str, input_data: Union[Dict[str, Any], bytes],
+                           request_id: str = None, timeout_ms: int = 100,
+                           cache_key: Optional[Any] = None, stale_key: Optional[Any] = None,
+                           game_id: Optional[Any] = None, entity_id: Optional[Any] = None) -> FeatureResponse:
         """Synchronous interface for single feature computation."""
         if request_id is None:
             request_id = f"{feature_name}_{int(time.time() * 1000)}"
@@ -386,14 +1039,21 @@ class RealTimeFeaturePipeline:
             input_data=input_data,
             request_id=request_id,
             timestamp=datetime.now(),
-            timeout_ms=timeout_ms
+            timeout_ms=timeout_ms,
+            cache_key=cache_key,
+            stale_key=stale_key,
+            game_id=game_id,
+            entity_id=entity_id
         )
 
         return self._compute_feature_sync(request)
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get current pipeline metrics."""
-        return self.metrics.copy()
+        metrics = self.metrics.copy()
+        metrics["l1_cache"] = self.cache.l1_stats()
+        metrics["scheduler"] = self.scheduler.stats()
+        return metrics
 
     def get_health_status(self) -> Dict[str, Any]:
         """Get system health status."""
@@ -426,29 +1086,91 @@ class RealTimeFeaturePipeline:
         }
 
     def invalidate_cache(self, feature_name: str = None) -> int:
-        """Invalidate feature cache."""
+        """Invalidate one feature's cache entries (via its index), or everything (via SCAN)."""
         if feature_name:
-            pattern = f"feature:{feature_name}:*"
-        else:
-            pattern = "feature:*"
+            return self.cache.invalidate_index("feature", feature_name)
+
+        return sum(self.cache.invalidate_pattern(pattern)
+                   for pattern in ("feature:*", "feature_last:*", "feature_idx:*"))
 
-        return self.cache.invalidate_pattern(pattern)
+    def invalidate_game(self, game_id: Any) -> int:
+        """Invalidate every cached result computed for a game (e.g. on a new game event)."""
+        return self.cache.invalidate_index("game", game_id)
+
+    def invalidate_games(self, game_ids: List[Any]) -> int:
+        """Invalidate several games' cached results in a fixed number of round trips."""
+        return self.cache.invalidate_indexes("game", game_ids)
+
+    def invalidate_entity(self, entity_id: Any) -> int:
+        """Invalidate every cached result computed for a player or team."""
+        return self.cache.invalidate_index("entity", entity_id)
 
     def close(self):
         """Clean up resources."""
+        self.scheduler.shutdown()
         self.executor.shutdown(wait=True)
+        self.backend.shutdown()
         self.redis_client.close()
 
 
+# Features computed for each (sport, team) seen on the event stream, with the
+# entity column(s) their windows are partitioned by
+STREAM_FEATURES = {
+    ('baseball', 'STL'): {
+        'cardinals_batter_xwoba_30d': ('batter_id',),
+        'cardinals_pitcher_whiff_rate_15d': ('pitcher_id',),
+        'cardinals_bullpen_fatigue_index_3d': ('team_id', 'pitcher_id')
+    },
+    ('football', 'TEN'): {
+        'titans_qb_pressure_to_sack_rate_adj_4g': ('qb_id',),
+        'titans_qb_epa_per_play_clean_pocket_5g': ('qb_id',)
+    }
+}
+
+# Longest stream feature window (5 NFL games) plus slack
+DEFAULT_WINDOW_TTL_SECONDS = 40 * 86400
+
+
 class FeatureStreamProcessor:
-    """Stream processor for real-time feature updates."""
+    """
+    Micro-batching stream processor for real-time feature updates.
+
+    Each cycle reads up to ``batch_size`` messages, waiting at most
+    ``batch_window_ms`` once the first one arrives. Events are appended to
+    the rolling history of each entity a stream feature is partitioned by
+    (batter, pitcher, QB, ...), kept in Redis across games. Messages are
+    grouped by (sport, team, game_id), and each feature is computed once
+    per group over the histories of the entities in that group, so
+    multi-game windows see earlier games. Result writes and
+    acknowledgements for the whole batch go out in one pipelined flush.
+    """
 
     def __init__(self, pipeline: RealTimeFeaturePipeline,
-                 stream_key: str = "sports_events"):
+                 stream_key: str = "sports_events", batch_size: int = 100,
+                 batch_window_ms: int = 50, window_rows: int = 500,
+                 window_ttl_seconds: int = DEFAULT_WINDOW_TTL_SECONDS):
+        """
+        Args:
+            pipeline: Feature pipeline computing and caching the features
+            stream_key: Redis stream to consume
+            batch_size: Maximum messages per micro-batch
+            batch_window_ms: How long to keep collecting after the first message
+            window_rows: Events of history kept per entity (at least ``batch_size``)
+            window_ttl_seconds: Idle time after which an entity's history is dropped
+        """
         self.pipeline = pipeline
         self.stream_key = stream_key
+        self.batch_size = batch_size
+        self.batch_window_ms = batch_window_ms
+        self.window_rows = max(window_rows, batch_size)
+        self.window_ttl_seconds = window_ttl_seconds
         self.running = False
 
+    @staticmethod
+    def window_key(sport: str, team: str, entity_cols: tuple, entity: tuple) -> str:
+        """Redis list holding one entity's recent events, e.g. a QB's across games."""
+        return f"stream_window:{sport}:{team}:{':'.join(entity_cols)}:{':'.join(map(str, entity))}"
+
     async def process_stream(self, consumer_group: str = "feature_processors",
                             consumer_name: str = "processor_1"):
         """Process streaming sports data for real-time features."""
@@ -466,76 +1188,212 @@ class FeatureStreamProcessor:
 
         while self.running:
             try:
-                # Read from stream
-                messages = self.pipeline.redis_client.xreadgroup(
-                    consumer_group, consumer_name,
-                    {self.stream_key: '>'},
-                    count=10, block=1000
-                )
-
-                for stream, msgs in messages:
-                    for msg_id, fields in msgs:
-                        await self._process_message(msg_id, fields)
-
-                        # Acknowledge message
-                        self.pipeline.redis_client.xack(self.stream_key, consumer_group, msg_id)
+                batch = self._read_batch(consumer_group, consumer_name)
+                if batch:
+                    await self.process_batch(batch, consumer_group)
 
             except Exception as e:
                 self.pipeline.logger.error(f"Stream processing error: {e}")
                 await asyncio.sleep(1)
 
-    async def _process_message(self, msg_id: str, fields: Dict[str, bytes]):
-        """Process a single stream message."""
+    def _read_batch(self, consumer_group: str, consumer_name: str) -> List[tuple]:
+        """
+        Read one micro-batch as ``(stream, msg_id, fields)`` tuples.
+
+        Blocks up to a second for the first message, then collects more until
+        ``batch_size`` messages or ``batch_window_ms`` have been reached.
+        """
+        batch = []
+        deadline = None
+        while self.running and len(batch) < self.batch_size:
+            if deadline is None:
+                block_ms = 1000
+            else:
+                block_ms = int((deadline - time.monotonic()) * 1000)
+                if block_ms <= 0:
+                    break
+
+            messages = self.pipeline.redis_client.xreadgroup(
+                consumer_group, consumer_name,
+                {self.stream_key: '>'},
+                count=self.batch_size - len(batch), block=block_ms
+            )
+            for stream, msgs in messages or []:
+                batch.extend((stream, msg_id, fields) for msg_id, fields in msgs)
+
+            if not batch:
+                break
+            if deadline is None:
+                deadline = time.monotonic() + self.batch_window_ms / 1000
+
+        return batch
+
+    async def process_batch(self, batch: List[tuple], consumer_group: str = "feature_processors") -> None:
+        """
+        Compute features for a micro-batch, then store results and acknowledge it in one flush.
+
+        The whole batch is always acknowledged (the consumer only reads new
+        messages, so anything left pending would never be retried): messages
+        that cannot be decoded and groups whose features fail are logged and
+        skipped.
+        """
+        pipe = self.pipeline.redis_client.pipeline(transaction=False)
         try:
-            # Decode message
-            data = {k.decode('utf-8'): v.decode('utf-8') for k, v in fields.items()}
-
-            # Determine which features to compute based on data type
-            sport = data.get('sport', '')
-            team = data.get('team', '')
-
-            features_to_compute = []
-
-            if sport == 'baseball' and team == 'STL':
-                features_to_compute.extend([
-                    'cardinals_batter_xwoba_30d',
-                    'cardinals_pitcher_whiff_rate_15d',
-                    'cardinals_bullpen_fatigue_index_3d'
-                ])
-            elif sport == 'football' and team == 'TEN':
-                features_to_compute.extend([
-                    'titans_qb_pressure_to_sack_rate_adj_4g',
-                    'titans_qb_epa_per_play_clean_pocket_5g'
-                ])
-
-            # Create feature requests
-            requests = []
-            for feature_name in features_to_compute:
-                request = FeatureRequest(
-                    feature_name=feature_name,
-                    input_data=data,
-                    request_id=f"{msg_id}_{feature_name}",
-                    timestamp=datetime.now(),
-                    priority=1,
-                    timeout_ms=50  # Aggressive timeout for streaming
+            groups = self._group_events(batch)
+            if groups:
+                await self._compute_groups(groups, pipe)
+        except Exception as e:
+            self.pipeline.logger.error(f"Stream micro-batch of {len(batch)} messages failed: {e}")
+        finally:
+            ids_by_stream: Dict[Any, list] = {}
+            for stream, msg_id, _ in batch:
+                ids_by_stream.setdefault(stream, []).append(msg_id)
+            for stream, ids in ids_by_stream.items():
+                pipe.xack(stream, consumer_group, *ids)
+            pipe.execute()
+
+    def _group_events(self, batch: List[tuple]) -> Dict[tuple, List[tuple]]:
+        """Decoded events grouped by (sport, team, game); events without stream features are dropped."""
+        groups: Dict[tuple, List[tuple]] = {}
+        for _, msg_id, fields in batch:
+            try:
+                msg_id = msg_id.decode('utf-8') if isinstance(msg_id, bytes) else msg_id
+                data = {k.decode('utf-8'): v.decode('utf-8') for k, v in fields.items()}
+            except Exception as e:
+                self.pipeline.logger.warning(f"Skipping undecodable stream message {msg_id}: {e}")
+                continue
+
+            group = (data.get('sport', ''), data.get('team', ''), data.get('game_id'))
+            if group[:2] in STREAM_FEATURES:
+                groups.setdefault(group, []).append((msg_id, data))
+        return groups
+
+    async def _compute_groups(self, groups: Dict[tuple, List[tuple]], pipe) -> None:
+        """Compute each group's features over its entities' histories and queue per-event results on ``pipe``."""
+        windows = self._update_windows(groups)
+
+        # New events supersede everything cached for their games
+        game_ids = [group[2] for group in groups if group[2] is not None]
+        if game_ids:
+            self.pipeline.invalidate_games(game_ids)
+
+        # One request per feature per group, over the histories of the group's entities
+        requests, targets = [], []
+        for group, events in groups.items():
+            try:
+                inputs = {}
+                for feature_name, entity_cols in STREAM_FEATURES[group[:2]].items():
+                    if entity_cols not in inputs:
+                        inputs[entity_cols] = self._window_input(group, events, entity_cols, windows)
+                    input_data, positions = inputs[entity_cols]
+                    if not positions:
+                        continue
+
+                    requests.append(FeatureRequest(
+                        feature_name=feature_name,
+                        input_data=input_data,
+                        request_id=f"{events[-1][0]}_{feature_name}",
+                        timestamp=datetime.now(),
+                        priority=1,
+                        timeout_ms=50,  # Aggressive timeout for streaming
+                        stale_key=group[2],
+                        game_id=group[2]
+                    ))
+                    targets.append((events, positions, len(next(iter(input_data.values())))))
+            except Exception as e:
+                self.pipeline.logger.error(f"Skipping stream group {group}: {e}")
+
+        responses = await self.pipeline.compute_features_batch(requests) if requests else []
+
+        # Store each event's results for downstream consumption. A stale
+        # response carries an earlier window's values, whose rows are not this
+        # batch's events, so it is never split per event
+        for response, (events, positions, n_rows) in zip(responses, targets):
+            if response.error:
+                continue
+            if response.stale:
+                self.pipeline.logger.warning(
+                    f"{response.feature_name} missed its deadline; no results for {len(events)} events"
                 )
-                requests.append(request)
+                continue
+            try:
+                self._store_results(pipe, response, events, positions, n_rows)
+            except Exception as e:
+                self.pipeline.logger.error(f"Could not store {response.feature_name} results: {e}")
 
-            # Compute features
-            if requests:
-                responses = await self.pipeline.compute_features_batch(requests)
+    def _window_input(self, group: tuple, events: List[tuple], entity_cols: tuple,
+                      windows: Dict[str, List[Dict[str, str]]]) -> tuple:
+        """
+        Column input over the histories of the group's entities, and each
+        event's row in it (events without the entity columns get none).
+        """
+        keys = dict.fromkeys(
+            self.window_key(group[0], group[1], entity_cols, entity)
+            for entity in (self._entity(data, entity_cols) for _, data in events) if entity is not None
+        )
+        rows = [row for key in keys for row in windows[key]]
+
+        columns = dict.fromkeys(column for row in rows for column in row if column != '_event_id')
+        input_data = {column: [row.get(column) for row in rows] for column in columns}
+
+        event_ids = {msg_id for msg_id, _ in events}
+        positions = {row['_event_id']: i for i, row in enumerate(rows) if row.get('_event_id') in event_ids}
+        return input_data, positions
+
+    @staticmethod
+    def _entity(data: Dict[str, str], entity_cols: tuple) -> Optional[tuple]:
+        """An event's entity for one window layout (None if a column is missing)."""
+        entity = tuple(data.get(col) for col in entity_cols)
+        return None if None in entity else entity
+
+    @staticmethod
+    def _store_results(pipe, response: FeatureResponse, events: List[tuple],
+                       positions: Dict[str, int], n_rows: int) -> None:
+        """Queue one result per event, picking each event's row when the values are per row."""
+        per_row = len(response.values) == n_rows
+        for msg_id, _ in events:
+            position = positions.get(msg_id)
+            if position is None:
+                continue
+            result = replace(
+                response,
+                request_id=f"{msg_id}_{response.feature_name}",
+                values=response.values[position:position + 1] if per_row else response.values
+            )
+            pipe.setex(
+                f"feature_results:{response.feature_name}:{msg_id}", 300,
+                json.dumps(result.to_dict(), default=str)
+            )
 
-                # Store results back to Redis for downstream consumption
-                for response in responses:
-                    if not response.error:
-                        result_key = f"feature_results:{response.feature_name}:{msg_id}"
-                        self.pipeline.redis_client.setex(
-                            result_key, 300,
-                            json.dumps(asdict(response), default=str)
-                        )
+    def _update_windows(self, groups: Dict[tuple, List[tuple]]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Append the batch's events to the history of every entity they belong
+        to and return those histories by window_key().
 
-        except Exception as e:
-            self.pipeline.logger.error(f"Message processing error: {e}")
+        Each stored event carries its message id as ``_event_id``. All
+        histories share one pipelined round trip.
+        """
+        appended: Dict[str, List[str]] = {}
+        for (sport, team, _), events in groups.items():
+            layouts = dict.fromkeys(STREAM_FEATURES[(sport, team)].values())
+            for msg_id, data in events:
+                row = json.dumps({**data, '_event_id': msg_id})
+                for entity_cols in layouts:
+                    entity = self._entity(data, entity_cols)
+                    if entity is not None:
+                        appended.setdefault(self.window_key(sport, team, entity_cols, entity), []).append(row)
+        if not appended:
+            return {}
+
+        pipe = self.pipeline.redis_client.pipeline(transaction=False)
+        for key, rows in appended.items():
+            pipe.rpush(key, *rows)
+            pipe.ltrim(key, -self.window_rows, -1)
+            pipe.expire(key, self.window_ttl_seconds)
+            pipe.lrange(key, 0, -1)
+        results = pipe.execute()
+
+        return {key: [json.loads(row) for row in results[4 * i + 3]] for i, key in enumerate(appended)}
 
     def stop(self):
         """Stop stream processing."""
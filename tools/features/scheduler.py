@@ -0,0 +1,206 @@
+"""
+Blaze Sports Intelligence Feature Request Scheduler
+
+Priority- and deadline-aware execution for the real-time feature pipeline:
+- Latency classes from each feature's YAML ``latency_requirement``
+  (real_time > near_real_time > batch), then FeatureRequest.priority
+- Deadline-aware admission: latency-critical work that cannot finish within
+  its timeout_ms is rejected up front; batch work is deferred instead
+- Queued work whose deadline passes before it starts is cancelled
+- Per-feature service-time estimates (EWMA) drive the admission decision
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+
+LATENCY_CLASSES = ("real_time", "near_real_time", "batch")
+DEFAULT_LATENCY_CLASS = "batch"  # schema.json default
+
+
+class DeadlineExceeded(Exception):
+    """Work rejected at admission, or expired while queued."""
+
+    def __init__(self, reason: str, feature_name: str, expected_ms: float = None, budget_ms: float = None):
+        super().__init__(reason)
+        self.feature_name = feature_name
+        self.expected_ms = expected_ms
+        self.budget_ms = budget_ms
+
+
+@dataclass(order=True)
+class _Task:
+    sort_key: tuple
+    fn: Callable[[], Any] = field(compare=False)
+    future: Future = field(compare=False)
+    feature_name: str = field(compare=False)
+    latency_class: str = field(compare=False)
+    deadline: Optional[float] = field(compare=False)
+    estimate_ms: float = field(compare=False)
+
+
+class FeatureScheduler:
+    """Priority queue of feature computations served by a fixed set of worker threads."""
+
+    def __init__(self, max_workers: int = 4, latency_classes: Dict[str, str] = None,
+                 default_estimate_ms: float = 5.0, smoothing: float = 0.2):
+        """
+        Args:
+            max_workers: Worker threads
+            latency_classes: Feature name -> latency_requirement (unknown features are batch)
+            default_estimate_ms: Service-time estimate before a feature has been observed
+            smoothing: EWMA weight of the newest service-time observation
+        """
+        self.max_workers = max_workers
+        self.latency_classes = dict(latency_classes or {})
+        self.default_estimate_ms = default_estimate_ms
+        self.smoothing = smoothing
+
+        self._heap = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._workers = []
+        self._shutdown = False
+
+        self._estimates: Dict[str, float] = {}
+        self._backlog_ms = {name: 0.0 for name in LATENCY_CLASSES}
+        self._running_ms = 0.0
+
+        self.counters = {
+            "admitted": 0,
+            "rejected": 0,
+            "deferred": 0,
+            "expired": 0,
+            "cancelled": 0,
+            "completed": 0
+        }
+
+    def latency_class(self, feature_name: str) -> str:
+        """Latency class of a feature (real_time, near_real_time or batch)."""
+        latency_class = self.latency_classes.get(feature_name, DEFAULT_LATENCY_CLASS)
+        return latency_class if latency_class in LATENCY_CLASSES else DEFAULT_LATENCY_CLASS
+
+    def estimate_ms(self, feature_name: str) -> float:
+        """Current service-time estimate for a feature."""
+        return self._estimates.get(feature_name, self.default_estimate_ms)
+
+    def observe(self, feature_name: str, elapsed_ms: float) -> None:
+        """Fold a measured service time into the feature's estimate."""
+        previous = self._estimates.get(feature_name)
+        self._estimates[feature_name] = (
+            elapsed_ms if previous is None
+            else previous + self.smoothing * (elapsed_ms - previous)
+        )
+
+    def submit(self, fn: Callable[[], Any], feature_name: str, priority: int = 1,
+               budget_ms: Optional[float] = None) -> Future:
+        """
+        Queue ``fn`` for execution.
+
+        Args:
+            fn: Zero-argument callable doing the work
+            feature_name: Feature being computed (selects class and estimate)
+            priority: FeatureRequest.priority (1=highest) within the latency class
+            budget_ms: Time left until the request's deadline (None = no deadline)
+
+        Returns:
+            Future resolving to ``fn()``; DeadlineExceeded if the work is
+            rejected at admission or expires in the queue
+        """
+        future = Future()
+        latency_class = self.latency_class(feature_name)
+        rank = LATENCY_CLASSES.index(latency_class)
+        estimate = self.estimate_ms(feature_name)
+
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("Scheduler has been shut down")
+
+            # Work ahead of this request: its own and higher classes, plus what is running
+            ahead_ms = sum(self._backlog_ms[name] for name in LATENCY_CLASSES[:rank + 1]) + self._running_ms
+            expected_ms = ahead_ms / self.max_workers + estimate
+
+            deadline = None
+            if budget_ms is not None:
+                if expected_ms <= budget_ms:
+                    deadline = time.monotonic() + budget_ms / 1000
+                elif latency_class == "batch":
+                    self.counters["deferred"] += 1
+                else:
+                    self.counters["rejected"] += 1
+                    future.set_exception(DeadlineExceeded(
+                        "Deadline cannot be met", feature_name, expected_ms, budget_ms
+                    ))
+                    return future
+
+            self.counters["admitted"] += 1
+            sort_key = (rank, priority, deadline if deadline is not None else float("inf"), next(self._sequence))
+            heapq.heappush(self._heap, _Task(sort_key, fn, future, feature_name, latency_class, deadline, estimate))
+            self._backlog_ms[latency_class] += estimate
+
+            if len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._work, name=f"feature-scheduler-{len(self._workers)}", daemon=True)
+                self._workers.append(worker)
+                worker.start()
+
+            self._cond.notify()
+
+        return future
+
+    def _work(self) -> None:
+        """Worker loop: run the most urgent task, skipping cancelled and expired ones."""
+        while True:
+            with self._cond:
+                while not self._heap and not self._shutdown:
+                    self._cond.wait()
+                if not self._heap:
+                    return
+
+                task = heapq.heappop(self._heap)
+                self._backlog_ms[task.latency_class] -= task.estimate_ms
+
+                if not task.future.set_running_or_notify_cancel():
+                    self.counters["cancelled"] += 1
+                    continue
+
+                if task.deadline is not None and time.monotonic() > task.deadline:
+                    self.counters["expired"] += 1
+                    task.future.set_exception(DeadlineExceeded("Deadline exceeded in queue", task.feature_name))
+                    continue
+
+                self._running_ms += task.estimate_ms
+
+            start = time.perf_counter()
+            try:
+                result = task.fn()
+            except BaseException as e:
+                task.future.set_exception(e)
+            else:
+                task.future.set_result(result)
+            finally:
+                with self._cond:
+                    self.observe(task.feature_name, (time.perf_counter() - start) * 1000)
+                    self._running_ms -= task.estimate_ms
+                    self.counters["completed"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current queue depth per latency class."""
+        with self._cond:
+            queued = {name: 0 for name in LATENCY_CLASSES}
+            for task in self._heap:
+                queued[task.latency_class] += 1
+            return {**self.counters, "queued": queued}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work; queued tasks still run."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
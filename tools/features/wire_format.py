@@ -0,0 +1,151 @@
+"""
+Blaze Sports Intelligence Columnar Wire Format
+
+Binary request/response encoding for the real-time feature pipeline:
+- Input frames travel as contiguous, 8-byte aligned column buffers
+- Decoding is zero-copy for numeric, boolean and timestamp columns
+- String/ID and other object columns are dictionary-encoded (int32 codes +
+  category list; bool/int/float categories keep their type)
+- Feature results travel (and are cached) as raw float32 arrays
+
+Layout: MAGIC | version (u8) | header length (u32 LE) | JSON header | buffers
+"""
+
+import json
+import struct
+from typing import Any, Dict, Union
+
+import numpy as np
+import pandas as pd
+
+
+WIRE_MAGIC = b"BLZC"
+WIRE_VERSION = 1
+VALUE_DTYPE = np.dtype("<f4")
+
+_PREFIX = struct.Struct("<4sBI")
+_ALIGN = 8
+_TYPED_CATEGORIES = ("boolean", "integer", "floating", "mixed-integer-float")
+
+
+def _column_buffer(values: pd.Series):
+    """Raw buffer and header spec for one column."""
+    spec: Dict[str, Any] = {}
+
+    if pd.api.types.is_datetime64_any_dtype(values):
+        ts = pd.DatetimeIndex(values).as_unit("ns")
+        if ts.tz is not None:
+            spec["tz"] = str(ts.tz)
+            ts = ts.tz_convert("UTC").tz_localize(None)
+        spec["kind"] = "datetime"
+        array = ts.asi8
+    elif pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        spec["kind"] = "numeric"
+        array = values.to_numpy()
+    else:
+        codes, categories = pd.factorize(values)
+        spec["kind"] = "category"
+        if pd.api.types.infer_dtype(categories, skipna=True) in _TYPED_CATEGORIES:
+            # Object columns of bools / numbers (e.g. with None) keep their JSON types
+            spec["categories"] = [c.item() if isinstance(c, np.generic) else c for c in categories]
+        else:
+            spec["categories"] = [str(c) for c in categories]
+        array = codes.astype(np.int32)
+
+    array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+    spec["dtype"] = array.dtype.str
+    return array, spec
+
+
+def encode_frame(data: Union[pd.DataFrame, Dict[str, Any]]) -> bytes:
+    """
+    Encode a DataFrame (or dict of columns) into the columnar wire format.
+
+    Args:
+        data: Input rows as a DataFrame or column name -> sequence mapping
+
+    Returns:
+        Encoded payload
+    """
+    df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+
+    columns = []
+    buffers = []
+    offset = 0
+    for name in df.columns:
+        array, spec = _column_buffer(df[name])
+        raw = array.tobytes()
+        spec.update(name=str(name), offset=offset, nbytes=len(raw))
+        columns.append(spec)
+
+        padding = -len(raw) % _ALIGN
+        buffers.append(raw + b"\0" * padding)
+        offset += len(raw) + padding
+
+    header = json.dumps({"n_rows": len(df), "columns": columns}).encode()
+    header += b" " * (-(_PREFIX.size + len(header)) % _ALIGN)
+
+    return b"".join([_PREFIX.pack(WIRE_MAGIC, WIRE_VERSION, len(header)), header] + buffers)
+
+
+def is_encoded_frame(payload: Any) -> bool:
+    """Whether ``payload`` is a wire-format frame."""
+    return isinstance(payload, (bytes, bytearray, memoryview)) and bytes(payload[:4]) == WIRE_MAGIC
+
+
+def _read_header(view: memoryview):
+    """Parsed JSON header of a payload and the offset its buffers start at."""
+    magic, version, header_len = _PREFIX.unpack_from(view)
+    if magic != WIRE_MAGIC:
+        raise ValueError("Payload is not a Blaze columnar frame")
+    if version != WIRE_VERSION:
+        raise ValueError(f"Unsupported wire format version {version} (expected {WIRE_VERSION})")
+
+    header = json.loads(bytes(view[_PREFIX.size:_PREFIX.size + header_len]))
+    return header, _PREFIX.size + header_len
+
+
+def frame_rows(payload: Union[bytes, bytearray, memoryview]) -> int:
+    """Row count of a wire-format payload, read from its header alone."""
+    return _read_header(memoryview(payload))[0]["n_rows"]
+
+
+def decode_frame(payload: Union[bytes, bytearray, memoryview]) -> pd.DataFrame:
+    """
+    Decode a wire-format payload into a DataFrame.
+
+    Numeric, boolean and timestamp columns are read-only views over
+    ``payload``; category columns are materialized as object arrays.
+    """
+    view = memoryview(payload)
+    header, body = _read_header(view)
+    n_rows = header["n_rows"]
+
+    data = {}
+    for spec in header["columns"]:
+        start = body + spec["offset"]
+        array = np.frombuffer(view[start:start + spec["nbytes"]], dtype=np.dtype(spec["dtype"]))
+
+        if spec["kind"] == "datetime":
+            column = pd.Series(array.view("datetime64[ns]"))
+            if "tz" in spec:
+                column = column.dt.tz_localize("UTC").dt.tz_convert(spec["tz"])
+        elif spec["kind"] == "category":
+            categories = np.array(spec["categories"] + [None], dtype=object)
+            column = categories[array]  # code -1 (missing) picks the trailing None
+        else:
+            column = array
+
+        data[spec["name"]] = column
+
+    return pd.DataFrame(data, index=pd.RangeIndex(n_rows), copy=False)
+
+
+def encode_values(values) -> bytes:
+    """Feature values as raw little-endian float32."""
+    return np.ascontiguousarray(values, dtype=VALUE_DTYPE).tobytes()
+
+
+def decode_values(payload: Union[bytes, bytearray, memoryview]) -> np.ndarray:
+    """Read-only float32 view over an encode_values() payload."""
+    return np.frombuffer(payload, dtype=VALUE_DTYPE)